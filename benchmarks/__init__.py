@@ -0,0 +1,4 @@
+"""
+Benchmarks of the Matchers, one :code:`bench_<module>.py` of scenarios per module of :mod:`pychoir`,
+run with :code:`python -m benchmarks`, see :mod:`benchmarks.runner`.
+"""
@@ -0,0 +1,31 @@
+"""
+Matchers calling the compared value
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import WhenPassedTo
+
+VALUES = [str(number) for number in range(100_000)]
+
+
+@scenario
+def returns() -> Iterator[Statement]:
+    """WhenPassedTo(str.isdigit).returns(True) over 100,000 strings."""
+    matcher = WhenPassedTo(str.isdigit).returns(True)
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def does_not_raise() -> Iterator[Statement]:
+    """WhenPassedTo(int).does_not_raise() over 100,000 strings."""
+    matcher = WhenPassedTo(int).does_not_raise()
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def raises() -> Iterator[Statement]:
+    """WhenPassedTo(int).raises(ValueError) over 10,000 strings that are not numbers."""
+    matcher = WhenPassedTo(int).raises(ValueError)
+    values = [f'x{value}' for value in VALUES[:10_000]]
+    yield lambda: all(value == matcher for value in values)
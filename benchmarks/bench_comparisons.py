@@ -0,0 +1,30 @@
+"""
+Comparison Matchers over many values
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import EqualTo, GreaterThanOrEqualTo, LessThan, NotEqualTo
+
+VALUES = list(range(100_000))
+
+
+@scenario
+def equal_to() -> Iterator[Statement]:
+    """EqualTo over 100,000 values."""
+    matchers = [EqualTo(value) for value in VALUES]
+    yield lambda: all(value == matcher for value, matcher in zip(VALUES, matchers))
+
+
+@scenario
+def not_equal_to() -> Iterator[Statement]:
+    """NotEqualTo(-1) over 100,000 values."""
+    matcher = NotEqualTo(-1)
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def range_check() -> Iterator[Statement]:
+    """GreaterThanOrEqualTo(0) & LessThan(100,000) over 100,000 values."""
+    matcher = GreaterThanOrEqualTo(0) & LessThan(100_000)
+    yield lambda: all(value == matcher for value in VALUES)
@@ -0,0 +1,31 @@
+"""
+Compiled Matchers against the ones they were compiled from, see bench_containers and bench_logical
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import All, And, GreaterThan, IsInstance, LessThan, StartsWith, compile
+
+MILLION = list(range(1, 1_000_001))
+
+
+@scenario
+def all_over_a_million() -> Iterator[Statement]:
+    """compile(All(GreaterThan(0))) over 1,000,000 items."""
+    matcher = compile(All(GreaterThan(0)))
+    yield lambda: MILLION == matcher
+
+
+@scenario
+def and_of_three() -> Iterator[Statement]:
+    """compile(And(...)) of three checks over 100,000 values."""
+    matcher = compile(And(IsInstance(int), GreaterThan(-1), LessThan(1_000_001)))
+    values = MILLION[:100_000]
+    yield lambda: all(value == matcher for value in values)
+
+
+@scenario
+def compiling() -> Iterator[Statement]:
+    """Compiling an And of 100 StartsWith."""
+    matcher = And(*(StartsWith(str(number)) for number in range(100)))
+    yield lambda: compile(matcher)
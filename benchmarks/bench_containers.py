@@ -0,0 +1,104 @@
+"""
+Matchers over large containers, and how InAnyOrder scales with the number of items
+"""
+from typing import Any, Iterator, List
+
+from benchmarks.runner import Statement, scenario
+from pychoir import (
+    All,
+    ContainsAllOf,
+    DictContainsAllOf,
+    GreaterThan,
+    GreaterThanOrEqualTo,
+    InAnyOrder,
+    IsInstance,
+    SetEquals,
+)
+
+MILLION = list(range(1, 1_000_001))
+WIDE_DICT = {f'key{number}': number for number in range(10_000)}
+
+
+@scenario
+def all_over_a_million() -> Iterator[Statement]:
+    """All(GreaterThan(0)) over 1,000,000 items."""
+    matcher = All(GreaterThan(0))
+    yield lambda: MILLION == matcher
+
+
+@scenario
+def all_over_a_million_failing_last() -> Iterator[Statement]:
+    """All(GreaterThan(0)) over 1,000,000 items, the last one failing."""
+    matcher = All(GreaterThan(0))
+    values = MILLION[:-1] + [0]
+    yield lambda: values == matcher
+
+
+def _in_any_order(size: int) -> Iterator[Statement]:
+    values: List[Any] = [[number] for number in range(size)]  # unhashable, so paired up item by item
+    matcher = InAnyOrder(list(reversed(values)))
+    yield lambda: values == matcher
+
+
+@scenario
+def in_any_order_10() -> Iterator[Statement]:
+    """InAnyOrder of 10 unhashable values against them reversed."""
+    yield from _in_any_order(10)
+
+
+@scenario
+def in_any_order_100() -> Iterator[Statement]:
+    """InAnyOrder of 100 unhashable values against them reversed."""
+    yield from _in_any_order(100)
+
+
+@scenario
+def in_any_order_1000() -> Iterator[Statement]:
+    """InAnyOrder of 1,000 unhashable values against them reversed."""
+    yield from _in_any_order(1_000)
+
+
+@scenario
+def in_any_order_hashable_10000() -> Iterator[Statement]:
+    """InAnyOrder of 10,000 hashable values against them reversed, counted rather than paired up."""
+    values = list(range(10_000))
+    matcher = InAnyOrder(list(reversed(values)))
+    yield lambda: values == matcher
+
+
+@scenario
+def in_any_order_matchers_100() -> Iterator[Statement]:
+    """InAnyOrder of 100 overlapping Matchers against 100 values in the order that matches them greedily worst."""
+    matcher = InAnyOrder([GreaterThanOrEqualTo(value) for value in range(100)])
+    values = list(reversed(range(100)))
+    yield lambda: values == matcher
+
+
+@scenario
+def dict_contains_all_of_wide() -> Iterator[Statement]:
+    """DictContainsAllOf of 100 keys against a dict of 10,000 keys."""
+    matcher = DictContainsAllOf({f'key{number}': number for number in range(0, 10_000, 100)})
+    yield lambda: WIDE_DICT == matcher
+
+
+@scenario
+def dict_contains_all_of_all_keys() -> Iterator[Statement]:
+    """DictContainsAllOf of all the 10,000 keys of a dict, each with a Matcher."""
+    matcher = DictContainsAllOf({key: IsInstance(int) for key in WIDE_DICT})
+    yield lambda: WIDE_DICT == matcher
+
+
+@scenario
+def contains_all_of() -> Iterator[Statement]:
+    """ContainsAllOf 100 values of a list of 100,000."""
+    values = MILLION[:100_000]
+    matcher = ContainsAllOf(*values[::1_000])
+    yield lambda: values == matcher
+
+
+@scenario
+def set_equals() -> Iterator[Statement]:
+    """SetEquals of 100,000 values against a list of them."""
+    values = MILLION[:100_000]
+    matcher = SetEquals(values)
+    yield lambda: values == matcher
@@ -0,0 +1,71 @@
+"""
+The per-node overhead of evaluating Matchers against plain comparisons, and deeply nested Matchers
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import All, And, EqualTo, GreaterThan, Matcher, Not
+
+VALUES = list(range(1, 100_001))
+DEPTH = 100
+
+
+@scenario
+def plain_inequality() -> Iterator[Statement]:
+    """Plain != over 100,000 values, the reference for not_equal_to."""
+    yield lambda: all(value != 0 for value in VALUES)
+
+
+@scenario
+def not_equal_to() -> Iterator[Statement]:
+    """Not(EqualTo(0)) == over 100,000 values, a Matcher per value."""
+    matcher = Not(EqualTo(0))
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def plain_greater_than() -> Iterator[Statement]:
+    """Plain > over 100,000 values, the reference for greater_than and all_greater_than."""
+    yield lambda: all(value > 0 for value in VALUES)
+
+
+@scenario
+def greater_than() -> Iterator[Statement]:
+    """GreaterThan(0) == over 100,000 values, a Matcher per value."""
+    matcher = GreaterThan(0)
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def all_greater_than() -> Iterator[Statement]:
+    """All(GreaterThan(0)) over 100,000 values, a nested Matcher per value."""
+    matcher = All(GreaterThan(0))
+    yield lambda: VALUES == matcher
+
+
+@scenario
+def greater_than_failing() -> Iterator[Statement]:
+    """GreaterThan(0) == over 100,000 failing values, recording the failures."""
+    matcher = GreaterThan(0)
+    negative = [-value for value in VALUES]
+    yield lambda: any(value == matcher for value in negative)
+
+
+@scenario
+def deep_nesting() -> Iterator[Statement]:
+    """A chain of 100 nested And(And(...)) over 1,000 values, nested_match 100 levels deep."""
+    matcher: Matcher = GreaterThan(0)
+    for _ in range(DEPTH):
+        matcher = And(matcher)
+    values = VALUES[:1_000]
+    yield lambda: all(value == matcher for value in values)
+
+
+@scenario
+def deep_nesting_failing() -> Iterator[Statement]:
+    """A chain of 100 nested And(And(...)) over 1,000 failing values, with the failures replayed and recorded."""
+    matcher: Matcher = GreaterThan(0)
+    for _ in range(DEPTH):
+        matcher = And(matcher)
+    values = [-value for value in VALUES[:1_000]]
+    yield lambda: any(value == matcher for value in values)
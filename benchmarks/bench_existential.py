@@ -0,0 +1,42 @@
+"""
+Allow-lists and identity checks
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import In, IsNoneOr, IsTruthy
+
+ALLOWED = [f'user{number}' for number in range(100_000)]
+LOOKED_UP = ALLOWED[::10]
+
+
+@scenario
+def in_large_allow_list() -> Iterator[Statement]:
+    """In of 100,000 allowed strings, looking up 10,000 of them."""
+    matcher = In(ALLOWED)
+    yield lambda: all(value == matcher for value in LOOKED_UP)
+
+
+@scenario
+def in_large_allow_list_missing() -> Iterator[Statement]:
+    """In of 100,000 allowed strings, looking up 10,000 strings not in it."""
+    matcher = In(ALLOWED)
+    missing = [f'{value}x' for value in LOOKED_UP]
+    yield lambda: not any(value == matcher for value in missing)
+
+
+@scenario
+def in_unhashable_allow_list() -> Iterator[Statement]:
+    """In of 1,000 allowed lists, looking up 100 of them."""
+    allowed = [[number] for number in range(1_000)]
+    matcher = In(allowed)
+    looked_up = allowed[::10]
+    yield lambda: all(value == matcher for value in looked_up)
+
+
+@scenario
+def is_none_or_truthy() -> Iterator[Statement]:
+    """IsNoneOr(IsTruthy()) over 100,000 values."""
+    matcher = IsNoneOr(IsTruthy())
+    values = [None, 1] * 50_000
+    yield lambda: all(value == matcher for value in values)
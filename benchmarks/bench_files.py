@@ -0,0 +1,39 @@
+"""
+Matching the contents of a large file
+"""
+import os
+import tempfile
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import EndsWith, FileContents, MatchesRegex, StartsWith
+
+SIZE = 64 * 1024 * 1024
+
+
+def _large_file() -> Iterator[str]:
+    with tempfile.NamedTemporaryFile(suffix='.log', delete=False) as file:
+        line = b'INFO request took 5 ms\n'
+        file.write(line * (SIZE // len(line)) + b'ERROR done\n')
+    try:
+        yield file.name
+    finally:
+        os.remove(file.name)
+
+
+@scenario
+def starts_and_ends_with() -> Iterator[Statement]:
+    """StartsWith and EndsWith of a 64 MiB file, reading only its first and last pages."""
+    for path in _large_file():
+        contents = FileContents(path)
+        matcher = StartsWith(b'INFO') & EndsWith(b'done\n')
+        yield lambda: contents(matcher)
+
+
+@scenario
+def matches_regex() -> Iterator[Statement]:
+    """MatchesRegex searching a 64 MiB file for its last line."""
+    for path in _large_file():
+        contents = FileContents(path)
+        matcher = MatchesRegex(r'ERROR \w+')
+        yield lambda: contents(matcher)
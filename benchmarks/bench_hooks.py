@@ -0,0 +1,31 @@
+"""
+The overhead of evaluation hooks, see bench_core for the reference without them
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import GreaterThan, IsInstance, hooks
+
+VALUES = list(range(1, 100_001))
+
+
+def _sampled(sample_rate: float) -> Iterator[Statement]:
+    hook = hooks.on_match(lambda event: None, sample_rate)
+    try:
+        matcher = IsInstance(int) & GreaterThan(0)
+        yield lambda: all(value == matcher for value in VALUES)
+    finally:
+        hook.remove()
+        hooks.flush()
+
+
+@scenario
+def sampled_rarely() -> Iterator[Statement]:
+    """IsInstance(int) & GreaterThan(0) over 100,000 values, one in a thousand sampled by a hook."""
+    yield from _sampled(0.001)
+
+
+@scenario
+def sampled_always() -> Iterator[Statement]:
+    """IsInstance(int) & GreaterThan(0) over 100,000 values, all sampled by a hook."""
+    yield from _sampled(1.0)
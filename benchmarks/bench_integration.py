@@ -0,0 +1,21 @@
+"""
+Matchers of other libraries wrapped with Matches
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import Matches
+
+VALUES = list(range(100_000))
+
+
+class _Positive:
+    def matches(self, other: int) -> bool:
+        return other >= 0
+
+
+@scenario
+def matches() -> Iterator[Statement]:
+    """Matches of a foreign Matcher over 100,000 values."""
+    matcher = Matches(_Positive())
+    yield lambda: all(value == matcher for value in VALUES)
@@ -0,0 +1,56 @@
+"""
+And and Or over many children
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import (
+    And,
+    GreaterThan,
+    IsEven,
+    IsInstance,
+    LessThan,
+    MatchesRegex,
+    Not,
+    Or,
+    StartsWith,
+)
+
+VALUES = list(range(100_000))
+ROUTES = [f'/api/v1/resource{number}/' for number in range(100)]
+PATHS = [f'{ROUTES[number % len(ROUTES)]}{number}' for number in range(10_000)]
+
+
+@scenario
+def and_of_three() -> Iterator[Statement]:
+    """And of three checks over 100,000 values."""
+    matcher = And(IsInstance(int), GreaterThan(-1), LessThan(100_000))
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def and_rarely_failing_last() -> Iterator[Statement]:
+    """And whose last child fails half of the time, over 100,000 values, reordered adaptively."""
+    matcher = And(IsInstance(int), GreaterThan(-1), LessThan(100_000), IsEven())
+    yield lambda: [value == matcher for value in VALUES]
+
+
+@scenario
+def or_of_routes() -> Iterator[Statement]:
+    """Or of 100 StartsWith routes over 10,000 paths, fused into one regular expression."""
+    matcher = Or(*(StartsWith(route) for route in ROUTES))
+    yield lambda: all(path == matcher for path in PATHS)
+
+
+@scenario
+def or_of_regexes() -> Iterator[Statement]:
+    """Or of 100 anchored MatchesRegex over 10,000 paths."""
+    matcher = Or(*(MatchesRegex(f'^{route}\\d+$') for route in ROUTES))
+    yield lambda: all(path == matcher for path in PATHS)
+
+
+@scenario
+def not_of_values() -> Iterator[Statement]:
+    """Not of 10 values over 100,000 values."""
+    matcher = Not(*range(-10, 0))
+    yield lambda: all(value == matcher for value in VALUES)
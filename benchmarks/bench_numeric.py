@@ -0,0 +1,23 @@
+"""
+Numeric Matchers over many values
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import IsEven, IsNonNegative
+
+VALUES = list(range(0, 200_000, 2))
+
+
+@scenario
+def is_even() -> Iterator[Statement]:
+    """IsEven() over 100,000 values."""
+    matcher = IsEven()
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def is_non_negative() -> Iterator[Statement]:
+    """IsNonNegative() over 100,000 values."""
+    matcher = IsNonNegative()
+    yield lambda: all(value == matcher for value in VALUES)
@@ -0,0 +1,45 @@
+"""
+Optimized Matchers against the ones they were optimized from
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import (
+    All,
+    And,
+    Anything,
+    HasLength,
+    InAnyOrder,
+    IsInstance,
+    Matcher,
+    optimize,
+)
+
+VALUES = [[number, number + 1] for number in range(10_000)]
+
+
+def _matcher() -> Matcher:
+    return And(Anything(), IsInstance(list), InAnyOrder([0, 1]) | All(IsInstance(int)), HasLength(3))
+
+
+@scenario
+def unoptimized() -> Iterator[Statement]:
+    """An And with its cheapest child last over 10,000 lists, the reference for optimized."""
+    matcher = _matcher()
+    yield lambda: not any(value == matcher for value in VALUES)
+
+
+@scenario
+def optimized() -> Iterator[Statement]:
+    """optimize() of an And with its cheapest child last over 10,000 lists."""
+    matcher = optimize(_matcher())
+    yield lambda: not any(value == matcher for value in VALUES)
+
+
+@scenario
+def optimizing() -> Iterator[Statement]:
+    """Optimizing an And of 100 nested Ands."""
+    matcher: Matcher = IsInstance(int)
+    for _ in range(100):
+        matcher = And(matcher, HasLength(1))
+    yield lambda: optimize(matcher)
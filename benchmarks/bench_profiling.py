@@ -0,0 +1,17 @@
+"""
+The overhead of profiling, see bench_core for the reference without it
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import GreaterThan, IsInstance, profile
+
+VALUES = list(range(1, 100_001))
+
+
+@scenario
+def profiled() -> Iterator[Statement]:
+    """IsInstance(int) & GreaterThan(0) over 100,000 values, profiled."""
+    matcher = IsInstance(int) & GreaterThan(0)
+    with profile():
+        yield lambda: all(value == matcher for value in VALUES)
@@ -0,0 +1,27 @@
+"""
+Validating records streamed from JSON Lines and CSV files
+"""
+import io
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import DictContainsAllOf, GreaterThan, IsInstance, MatchesRegex
+from pychoir.stream import validate
+
+RECORDS = 100_000
+
+
+@scenario
+def validate_json_lines() -> Iterator[Statement]:
+    """validate() of 100,000 JSON Lines records."""
+    lines = ''.join(f'{{"id": {number}, "name": "user{number}"}}\n' for number in range(RECORDS)).encode()
+    matcher = DictContainsAllOf({'id': IsInstance(int) & GreaterThan(-1), 'name': MatchesRegex(r'^user\d+$')})
+    yield lambda: validate(io.BytesIO(lines), matcher)
+
+
+@scenario
+def validate_csv() -> Iterator[Statement]:
+    """validate() of 100,000 CSV records."""
+    rows = 'id,name\n' + ''.join(f'{number},user{number}\n' for number in range(RECORDS))
+    matcher = DictContainsAllOf({'id': MatchesRegex(r'^\d+$'), 'name': MatchesRegex(r'^user\d+$')})
+    yield lambda: validate(io.StringIO(rows), matcher, format='csv')
@@ -0,0 +1,48 @@
+"""
+String Matchers over many strings, and with many prefixes
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import EndsWith, MatchesRegex, StartsWith
+
+LINES = [f'2024-01-{day % 28 + 1:02d} INFO request {number} took {number % 997} ms'
+         for day, number in enumerate(range(100_000))]
+ROUTES = [f'/api/v{version}/resource{number}/' for version in range(1, 5) for number in range(250)]
+PATHS = [f'{ROUTES[number % len(ROUTES)]}{number}' for number in range(10_000)]
+
+
+@scenario
+def matches_regex() -> Iterator[Statement]:
+    """MatchesRegex over 100,000 log lines."""
+    matcher = MatchesRegex(r'INFO request \d+ took \d+ ms$')
+    yield lambda: all(line == matcher for line in LINES)
+
+
+@scenario
+def matches_regex_bytes() -> Iterator[Statement]:
+    """A string MatchesRegex over 100,000 log lines as bytes."""
+    matcher = MatchesRegex(r'INFO request \d+ took \d+ ms$')
+    lines = [line.encode() for line in LINES]
+    yield lambda: all(line == matcher for line in lines)
+
+
+@scenario
+def starts_with() -> Iterator[Statement]:
+    """StartsWith over 100,000 log lines."""
+    matcher = StartsWith('2024-')
+    yield lambda: all(line == matcher for line in LINES)
+
+
+@scenario
+def starts_with_many() -> Iterator[Statement]:
+    """StartsWith of 1,000 route prefixes over 10,000 paths."""
+    matcher = StartsWith(*ROUTES)
+    yield lambda: all(path == matcher for path in PATHS)
+
+
+@scenario
+def ends_with_many() -> Iterator[Statement]:
+    """EndsWith of 1,000 suffixes over 10,000 paths."""
+    matcher = EndsWith(*(str(number) for number in range(1_000)))
+    yield lambda: all(path == matcher for path in PATHS)
@@ -0,0 +1,28 @@
+"""
+Matching nested documents against a Structure
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import All, DictContainsAllOf, IsInstance, Structure
+
+DOCUMENTS = [
+    {'user': {'id': number, 'name': f'user{number}', 'tags': ['a', 'b', 'c']}, 'version': 1}
+    for number in range(10_000)
+]
+USER = {'id': IsInstance(int), 'name': IsInstance(str), 'tags': All(IsInstance(str))}
+TEMPLATE = {'user': USER, 'version': 1}
+
+
+@scenario
+def structure() -> Iterator[Statement]:
+    """Structure over 10,000 nested documents."""
+    matcher = Structure(TEMPLATE)
+    yield lambda: all(document == matcher for document in DOCUMENTS)
+
+
+@scenario
+def nested_matchers() -> Iterator[Statement]:
+    """The same template as nested DictContainsAllOf over 10,000 nested documents, the reference for structure."""
+    matcher = DictContainsAllOf({'user': DictContainsAllOf(USER), 'version': 1})
+    yield lambda: all(document == matcher for document in DOCUMENTS)
@@ -0,0 +1,31 @@
+"""
+Type checks over many values
+"""
+from typing import Iterator
+
+from benchmarks.runner import Statement, scenario
+from pychoir import ConvertsTo, IsInstance
+
+VALUES = list(range(100_000))
+
+
+@scenario
+def is_instance() -> Iterator[Statement]:
+    """IsInstance(int) over 100,000 values."""
+    matcher = IsInstance(int)
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def is_instance_of_many() -> Iterator[Statement]:
+    """IsInstance of 5 types, the last one matching, over 100,000 values."""
+    matcher = IsInstance(str, bytes, float, list, int)
+    yield lambda: all(value == matcher for value in VALUES)
+
+
+@scenario
+def converts_to() -> Iterator[Statement]:
+    """ConvertsTo(int) over 100,000 strings."""
+    matcher = ConvertsTo(int)
+    values = [str(value) for value in VALUES]
+    yield lambda: all(value == matcher for value in values)
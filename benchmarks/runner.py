@@ -0,0 +1,251 @@
+"""
+Running the benchmark scenarios, saving their results as JSON baselines and comparing results against them.
+
+Run from the repository root:
+
+- :code:`python -m benchmarks run` runs all the scenarios, :code:`-k containers` only the ones whose names
+  contain :code:`containers`. :code:`--save benchmarks/baseline.json` saves the results as the new baseline.
+- :code:`python -m benchmarks compare benchmarks/baseline.json` runs the scenarios and exits with status 1 if
+  any of them is slower than in the baseline by more than the threshold (:code:`--threshold 0.2` for 20 %,
+  the default). Pass a second file to compare saved results instead of running the scenarios.
+
+Each round of timing a scenario is preceded by one of a calibration loop of plain Python not using pychoir, and
+comparisons are of the times relative to the calibration, so that they hold up against a machine that is slower
+or faster, whether another one or the same one busy with something else. Only results from the same Python
+are comparable, and those from the same machine precise, so save a baseline before the change being measured.
+"""
+import argparse
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import platform
+import statistics
+import sys
+from contextlib import contextmanager
+from timeit import Timer
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+Statement = Callable[[], object]
+
+DEFAULT_THRESHOLD = 0.2
+
+
+class Scenario(NamedTuple):
+    name: str
+    description: str
+    setup: Callable[[], ContextManager[Statement]]
+
+
+class Result(NamedTuple):
+    """The best time of one run of the statement of a scenario, out of :code:`repeat` rounds of :code:`number`."""
+    seconds: float
+    number: int
+    repeat: int
+    relative: Optional[float] = None
+    """The median over the rounds of the time relative to the round of the calibration loop before it,
+    comparable across machines."""
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: Optional[Result]
+    current: Optional[Result]
+
+    @property
+    def calibrated(self) -> bool:
+        return self.baseline is not None and self.current is not None \
+            and self.baseline.relative is not None and self.current.relative is not None
+
+    @property
+    def change(self) -> Optional[float]:
+        """The relative change from the baseline, 0.1 for 10 % slower, in time relative to the calibration
+        if both results have it.
+        """
+        if self.baseline is None or self.current is None:
+            return None
+        if self.baseline.relative is not None and self.current.relative is not None:
+            return self.current.relative / self.baseline.relative - 1
+        return self.current.seconds / self.baseline.seconds - 1
+
+    def regressed(self, threshold: float) -> bool:
+        change = self.change
+        return change is not None and change > threshold
+
+
+_scenarios: Dict[str, Scenario] = {}
+
+
+def scenario(function: Callable[[], Iterator[Statement]]) -> Callable[[], Iterator[Statement]]:
+    """Registers a benchmark scenario: a generator setting up the data, yielding the statement to time
+    and cleaning up after it. Named after its module (without the :code:`bench_` prefix) and itself.
+    """
+    module = function.__module__.rpartition('.')[2]
+    name = f'{module[len("bench_"):]}.{function.__name__}'
+    _scenarios[name] = Scenario(name, inspect.getdoc(function) or '', contextmanager(function))
+    return function
+
+
+def scenarios(pattern: str = '') -> List[Scenario]:
+    """Returns the scenarios of all the :code:`bench_*` modules whose names contain the pattern."""
+    for module in pkgutil.iter_modules([os.path.dirname(__file__)]):
+        if module.name.startswith('bench_'):
+            importlib.import_module(f'{__package__}.{module.name}')
+    return [found for name, found in sorted(_scenarios.items()) if pattern in name]
+
+
+def run(pattern: str = '', repeat: int = 5, report: Callable[[str], Any] = print) -> Dict[str, Result]:
+    """Times the statement of each scenario whose name contains the pattern.
+
+    The statement is run as many times as takes at least 0.2 seconds, :code:`repeat` times over,
+    and the best time kept, the others being slowed down by whatever else the machine was doing.
+    The calibration loop is timed the same way, a round of it before each round of the statement, and the median
+    of the times of the rounds relative to it kept as well, the machine speeding up and slowing down between rounds.
+    """
+    calibration = Timer(_calibration)
+    calibration_number, _ = calibration.autorange()
+    results = {}
+    for selected in scenarios(pattern):
+        with selected.setup() as statement:
+            timer = Timer(statement)
+            number, _ = timer.autorange()
+            times, relative = [], []
+            for _ in range(repeat):
+                calibrated = calibration.timeit(calibration_number) / calibration_number
+                times.append(timer.timeit(number) / number)
+                relative.append(times[-1] / calibrated)
+        seconds = min(times)
+        results[selected.name] = Result(seconds, number, repeat, statistics.median(relative))
+        report(f'{selected.name:<48} {_format_seconds(seconds):>10}  {selected.description.splitlines()[0]}')
+    return results
+
+
+def environment() -> Dict[str, str]:
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'system': platform.system(),
+        'processor': platform.processor(),
+    }
+
+
+def save(path: str, results: Dict[str, Result]) -> None:
+    with open(path, 'w') as file:
+        json.dump({
+            'environment': environment(),
+            'results': {name: result._asdict() for name, result in sorted(results.items())},
+        }, file, indent=2)
+        file.write('\n')
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as file:
+        saved: Dict[str, Any] = json.load(file)
+    saved['results'] = {name: Result(**result) for name, result in saved['results'].items()}
+    return saved
+
+
+def compare(baseline: Dict[str, Result], current: Dict[str, Result]) -> List[Comparison]:
+    """Pairs the results of the scenarios, the ones missing from either side with None."""
+    return [
+        Comparison(name, baseline.get(name), current.get(name))
+        for name in sorted(baseline.keys() | current.keys())
+    ]
+
+
+def main(arguments: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks of the pychoir Matchers.')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    run_command = commands.add_parser('run', help='run the scenarios')
+    run_command.add_argument('--save', metavar='PATH', help='save the results as JSON, for example as a baseline')
+    compare_command = commands.add_parser('compare', help='compare results against a baseline')
+    compare_command.add_argument('baseline', help='the saved baseline')
+    compare_command.add_argument('results', nargs='?', help='saved results instead of running the scenarios')
+    compare_command.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                 help=f'the allowed slowdown, {DEFAULT_THRESHOLD} for {DEFAULT_THRESHOLD:.0%} '
+                                      f'(default)')
+    for command in (run_command, compare_command):
+        command.add_argument('-k', dest='pattern', default='', help='only the scenarios whose names contain this')
+        command.add_argument('--repeat', type=int, default=5, help='how many rounds to take the best of')
+    options = parser.parse_args(arguments)
+
+    if options.command == 'run':
+        results = run(options.pattern, options.repeat)
+        if options.save:
+            save(options.save, results)
+        return 0
+
+    baseline = load(options.baseline)
+    if options.results:
+        current = load(options.results)
+    else:
+        current = {'environment': environment(), 'results': run(options.pattern, options.repeat, report=_ignore)}
+    if baseline['environment'] != current['environment']:
+        print(f'warning: comparing results from different environments:\n'
+              f'  {baseline["environment"]}\n  {current["environment"]}', file=sys.stderr)
+    comparisons = compare(
+        {name: result for name, result in baseline['results'].items() if options.pattern in name},
+        {name: result for name, result in current['results'].items() if options.pattern in name},
+    )
+    regressions = [comparison for comparison in comparisons if comparison.regressed(options.threshold)]
+    if any(comparison.change is not None and not comparison.calibrated for comparison in comparisons):
+        print('warning: comparing results without calibration, only comparable from the same machine',
+              file=sys.stderr)
+    for comparison in comparisons:
+        change = comparison.change
+        print(f'{comparison.name:<48} '
+              f'{_format_seconds(comparison.baseline and comparison.baseline.seconds):>10} '
+              f'{_format_seconds(comparison.current and comparison.current.seconds):>10}'
+              f' {"" if change is None else f"{change:+.1%}":>8}'
+              f'{"  REGRESSION" if comparison.regressed(options.threshold) else ""}')
+    if regressions:
+        print(f'{len(regressions)} of {len(comparisons)} scenarios slower than the baseline by more than '
+              f'{options.threshold:.0%}', file=sys.stderr)
+        return 1
+    return 0
+
+
+_CALIBRATION_VALUES = [(number, str(number)) for number in range(10_000)]
+
+
+class _Calibrated:
+    # function calls, attribute lookups, comparisons and isinstance, the kind of work Matchers do
+    __slots__ = ('minimum',)
+
+    def __init__(self, minimum: int) -> None:
+        self.minimum = minimum
+
+    def check(self, value: Tuple[int, str]) -> bool:
+        return value[0] >= self.minimum and isinstance(value[1], str)
+
+
+def _calibration() -> object:
+    calibrated = _Calibrated(0)
+    return all(calibrated.check(value) for value in _CALIBRATION_VALUES)
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return '-'
+    for unit, scale in (('s', 1.0), ('ms', 1e-3), ('µs', 1e-6)):
+        if seconds >= scale:
+            return f'{seconds / scale:.2f} {unit}'
+    return f'{seconds / 1e-9:.0f} ns'
+
+
+def _ignore(line: str) -> None:
+    pass
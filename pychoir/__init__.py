@@ -1,51 +1,136 @@
-from .core import Matchable, Matcher, that  # noqa: F401  # isort:skip
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
-from .callables import WhenPassedTo  # noqa: F401
-from .comparisons import (  # noqa: F401
-    EQ,
-    GT,
-    GTE,
-    LT,
-    LTE,
-    NE,
-    EqualTo,
-    GreaterThan,
-    GreaterThanOrEqualTo,
-    LessThan,
-    LessThanOrEqualTo,
-    NotEqualTo,
-)
-from .containers import (  # noqa: F401
-    All,
-    AreNot,
-    Contains,
-    ContainsAllOf,
-    ContainsAnyOf,
-    ContainsNoneOf,
-    DictContainsAllOf,
-    First,
-    HasLength,
-    InAnyOrder,
-    IsEmpty,
-    IsNotPresentOr,
-    Last,
-    Len,
-    NotPresent,
-    SetEquals,
-    Slice,
-)
-from .existential import (  # noqa: F401
-    Anything,
-    In,
-    Is,
-    IsFalsy,
-    IsNoneOr,
-    IsTruthy,
-    OneOf,
-    Optionally,
-)
-from .integration import M, MatcherLike, Matches  # noqa: F401
-from .logical import AllOf, And, AnyOf, IsNoneOf, Not, Or, ResultsTrueFor  # noqa: F401
-from .numeric import IsEven, IsNegative, IsNonNegative, IsOdd, IsPositive  # noqa: F401
-from .strings import EndsWith, MatchesRegex, StartsWith  # noqa: F401
-from .types import ConvertsTo, IsInstance, OfType  # noqa: F401
+# The public names by the module they are defined in. The modules are only imported when one of their names is
+# first used, so that for example a process needing only a couple of Matchers does not pay for importing the rest.
+_EXPORTS: Dict[str, Tuple[str, ...]] = {
+    'core': (
+        'DescriptionRendering', 'FailedValueStorage', 'FailureRecording', 'Matchable', 'Matcher',
+        'set_adaptive_ordering', 'set_description_rendering', 'set_failure_recording', 'set_fast_evaluation', 'that',
+    ),
+    'callables': ('WhenPassedTo',),
+    'comparisons': (
+        'EQ', 'GT', 'GTE', 'LT', 'LTE', 'NE', 'EqualTo', 'GreaterThan', 'GreaterThanOrEqualTo', 'LessThan',
+        'LessThanOrEqualTo', 'NotEqualTo',
+    ),
+    'compiler': ('CompiledMatcher', 'compile'),
+    'containers': (
+        'All', 'AreNot', 'Contains', 'ContainsAllOf', 'ContainsAnyOf', 'ContainsNoneOf', 'DictContainsAllOf', 'First',
+        'HasLength', 'InAnyOrder', 'IsEmpty', 'IsNotPresentOr', 'Last', 'Len', 'NotPresent', 'SetEquals', 'Slice',
+    ),
+    'existential': ('Anything', 'In', 'Is', 'IsFalsy', 'IsNoneOr', 'IsTruthy', 'OneOf', 'Optionally'),
+    'files': ('FileContents',),
+    'integration': ('M', 'MatcherLike', 'Matches'),
+    'logical': ('AllOf', 'And', 'AnyOf', 'IsNoneOf', 'Not', 'Or', 'ResultsTrueFor'),
+    'numeric': ('IsEven', 'IsNegative', 'IsNonNegative', 'IsOdd', 'IsPositive'),
+    'optimizer': ('optimize',),
+    'profiling': ('profile',),
+    'strings': ('EndsWith', 'MatchesRegex', 'StartsWith'),
+    'structures': ('Structure',),
+    'types': ('ConvertsTo', 'IsInstance', 'OfType'),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+# the submodules, also reached as attributes of the package like when they were all imported with it
+_SUBMODULES = frozenset(_EXPORTS) | {'hooks', 'stream', 'utils'}
+
+# not compile, which would shadow the builtin in `from pychoir import *`, it is used as pychoir.compile
+__all__ = [name for name in _MODULES if name != 'compile']
+
+if TYPE_CHECKING or sys.version_info < (3, 7):  # no module __getattr__ before Python 3.7 (PEP 562)
+    from .core import (  # noqa: F401  # isort:skip
+        DescriptionRendering,
+        FailedValueStorage,
+        FailureRecording,
+        Matchable,
+        Matcher,
+        set_adaptive_ordering,
+        set_description_rendering,
+        set_failure_recording,
+        set_fast_evaluation,
+        that,
+    )
+
+    from .callables import WhenPassedTo  # noqa: F401
+    from .comparisons import (  # noqa: F401
+        EQ,
+        GT,
+        GTE,
+        LT,
+        LTE,
+        NE,
+        EqualTo,
+        GreaterThan,
+        GreaterThanOrEqualTo,
+        LessThan,
+        LessThanOrEqualTo,
+        NotEqualTo,
+    )
+    from .compiler import CompiledMatcher, compile  # noqa: F401
+    from .containers import (  # noqa: F401
+        All,
+        AreNot,
+        Contains,
+        ContainsAllOf,
+        ContainsAnyOf,
+        ContainsNoneOf,
+        DictContainsAllOf,
+        First,
+        HasLength,
+        InAnyOrder,
+        IsEmpty,
+        IsNotPresentOr,
+        Last,
+        Len,
+        NotPresent,
+        SetEquals,
+        Slice,
+    )
+    from .existential import (  # noqa: F401
+        Anything,
+        In,
+        Is,
+        IsFalsy,
+        IsNoneOr,
+        IsTruthy,
+        OneOf,
+        Optionally,
+    )
+    from .files import FileContents  # noqa: F401
+    from .integration import M, MatcherLike, Matches  # noqa: F401
+    from .logical import (  # noqa: F401
+        AllOf,
+        And,
+        AnyOf,
+        IsNoneOf,
+        Not,
+        Or,
+        ResultsTrueFor,
+    )
+    from .numeric import (  # noqa: F401
+        IsEven,
+        IsNegative,
+        IsNonNegative,
+        IsOdd,
+        IsPositive,
+    )
+    from .optimizer import optimize  # noqa: F401
+    from .profiling import profile  # noqa: F401
+    from .strings import EndsWith, MatchesRegex, StartsWith  # noqa: F401
+    from .structures import Structure  # noqa: F401
+    from .types import ConvertsTo, IsInstance, OfType  # noqa: F401
+else:
+    def __getattr__(name: str) -> Any:
+        try:
+            module = _MODULES[name]
+        except KeyError:
+            if name in _SUBMODULES:
+                return importlib.import_module(f'{__name__}.{name}')  # sets itself as the attribute
+            raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+        # rather than importlib.import_module(), so that the import shows up in python -X importtime
+        value = getattr(__import__(module, globals(), level=1, fromlist=(name,)), name)
+        globals()[name] = value  # not looked up through __getattr__ again
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(globals().keys() | _MODULES.keys() | _SUBMODULES)
@@ -1,11 +1,16 @@
+from inspect import isawaitable, iscoroutinefunction
 from typing import Any, Callable, Optional, Type
 
 from pychoir import Matcher
+from pychoir.core import described
 
 
 class WhenPassedTo:
     """Matchers that check how a value behaves when passed to a callable.
 
+    Coroutine functions (and other callables returning awaitables) are supported when
+    evaluating with :func:`MatcherWrapper.matches_async`.
+
     :param callable_: The callable to pass the value to.
 
     Usage:
@@ -31,32 +36,52 @@ class WhenPassedTo:
 
 
 class _Returns(Matcher):
+    _cost = 20
+
     def __init__(self, callable_: Callable[[Any], Any], value: Any):
         super().__init__(name='WhenPassedTo')
         self.callable = callable_
         self.value = value
 
     def _matches(self, other: Any) -> bool:
+        _require_synchronous(self.callable)
         return bool(self.callable(other) == self.value)
 
+    async def _matches_async(self, other: Any) -> bool:
+        return bool(await _call_async(self.callable, other) == self.value)
+
     def _description(self) -> str:
         callable_name = _name_or_repr(self.callable)
 
-        return f'{callable_name}).returns({self.value!r}'
+        return f'{callable_name}).returns({described(self.value)}'
 
 
 class _Raises(Matcher):
+    _cost = 20
+
     def __init__(self, callable_: Callable[..., Any], exception: Optional[Type[Exception]]):
         super().__init__(name='WhenPassedTo')
         self.callable = callable_
         self.exception = exception
 
     def _matches(self, other: Any) -> bool:
+        _require_synchronous(self.callable)
         raised = None
         try:
             self.callable(other)
         except Exception as e:
             raised = e
+        return self.__is_expected(raised)
+
+    async def _matches_async(self, other: Any) -> bool:
+        raised = None
+        try:
+            await _call_async(self.callable, other)
+        except Exception as e:
+            raised = e
+        return self.__is_expected(raised)
+
+    def __is_expected(self, raised: Optional[Exception]) -> bool:
         if self.exception is not None:
             return isinstance(raised, self.exception)
         else:
@@ -70,21 +95,44 @@ class _Raises(Matcher):
 
 
 class _DoesNotRaise(Matcher):
+    _cost = 20
+
     def __init__(self, callable_: Callable[..., Any]):
         super().__init__(name='WhenPassedTo')
         self.callable = callable_
 
     def _matches(self, other: Any) -> bool:
+        _require_synchronous(self.callable)
         try:
             self.callable(other)
         except Exception:
             return False
         return True
 
+    async def _matches_async(self, other: Any) -> bool:
+        try:
+            await _call_async(self.callable, other)
+        except Exception:
+            return False
+        return True
+
     def _description(self) -> str:
         callable_name = _name_or_repr(self.callable)
         return f'{callable_name}).does_not_raise('
 
 
+def _require_synchronous(callable_: Callable[..., Any]) -> None:
+    if iscoroutinefunction(callable_):
+        raise TypeError(f'{_name_or_repr(callable_)} is a coroutine function, '
+                        f'evaluate with that(value).matches_async(matcher) instead')
+
+
+async def _call_async(callable_: Callable[..., Any], other: Any) -> Any:
+    result = callable_(other)
+    if isawaitable(result):
+        result = await result
+    return result
+
+
 def _name_or_repr(thing: Any) -> str:
     return getattr(thing, '__name__', None) or repr(thing)
@@ -1,6 +1,9 @@
 from typing import Any
 
-from pychoir.core import Matcher
+from pychoir.core import Matcher, described
+from pychoir.utils import is_ndarray_vector
+
+_SCALAR_TYPES = (bool, int, float, complex, str, bytes)
 
 
 class EqualTo(Matcher):
@@ -23,6 +26,9 @@ class EqualTo(Matcher):
       >>> 1 == IsInstance(int) & 1  # Bare value works here
       True
     """
+    _cost = 1
+    _total = True
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -30,8 +36,14 @@ class EqualTo(Matcher):
     def _matches(self, other: Any) -> bool:
         return bool(other == self.value)
 
+    def _matches_many(self, values: Any) -> Any:
+        expected = self.value
+        if is_ndarray_vector(values) and isinstance(expected, _SCALAR_TYPES):
+            return values == expected
+        return [bool(other == expected) for other in values]
+
     def _description(self) -> str:
-        return repr(self.value)
+        return described(self.value)
 
 
 EQ = EqualTo
@@ -49,6 +61,9 @@ class NotEqualTo(Matcher):
       >>> 1 == NotEqualTo(1)
       False
     """
+    _cost = 1
+    _total = True
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -56,8 +71,14 @@ class NotEqualTo(Matcher):
     def _matches(self, other: Any) -> bool:
         return bool(other != self.value)
 
+    def _matches_many(self, values: Any) -> Any:
+        expected = self.value
+        if is_ndarray_vector(values) and isinstance(expected, _SCALAR_TYPES):
+            return values != expected
+        return [bool(other != expected) for other in values]
+
     def _description(self) -> str:
-        return repr(self.value)
+        return described(self.value)
 
 
 NE = NotEqualTo
@@ -75,6 +96,8 @@ class GreaterThan(Matcher):
       >>> [3] == [GreaterThan(2)]
       True
     """
+    _cost = 1
+
     def __init__(self, threshold: Any):
         super().__init__()
         self.threshold = threshold
@@ -82,8 +105,14 @@ class GreaterThan(Matcher):
     def _matches(self, other: Any) -> bool:
         return bool(other > self.threshold)
 
+    def _matches_many(self, values: Any) -> Any:
+        threshold = self.threshold
+        if is_ndarray_vector(values):
+            return values > threshold
+        return [bool(other > threshold) for other in values]
+
     def _description(self) -> str:
-        return repr(self.threshold)
+        return described(self.threshold)
 
 
 GT = GreaterThan
@@ -101,6 +130,8 @@ class GreaterThanOrEqualTo(Matcher):
       >>> 1 == GreaterThanOrEqualTo(2)
       False
     """
+    _cost = 1
+
     def __init__(self, threshold: Any):
         super().__init__()
         self.threshold = threshold
@@ -108,8 +139,14 @@ class GreaterThanOrEqualTo(Matcher):
     def _matches(self, other: Any) -> bool:
         return bool(other >= self.threshold)
 
+    def _matches_many(self, values: Any) -> Any:
+        threshold = self.threshold
+        if is_ndarray_vector(values):
+            return values >= threshold
+        return [bool(other >= threshold) for other in values]
+
     def _description(self) -> str:
-        return repr(self.threshold)
+        return described(self.threshold)
 
 
 GTE = GreaterThanOrEqualTo
@@ -127,6 +164,8 @@ class LessThan(Matcher):
       >>> 1 == LessThan(2)
       True
     """
+    _cost = 1
+
     def __init__(self, threshold: Any):
         super().__init__()
         self.threshold = threshold
@@ -134,8 +173,14 @@ class LessThan(Matcher):
     def _matches(self, other: Any) -> bool:
         return bool(other < self.threshold)
 
+    def _matches_many(self, values: Any) -> Any:
+        threshold = self.threshold
+        if is_ndarray_vector(values):
+            return values < threshold
+        return [bool(other < threshold) for other in values]
+
     def _description(self) -> str:
-        return repr(self.threshold)
+        return described(self.threshold)
 
 
 LT = LessThan
@@ -153,6 +198,8 @@ class LessThanOrEqualTo(Matcher):
       >>> 3 == LessThanOrEqualTo(2)
       False
     """
+    _cost = 1
+
     def __init__(self, threshold: Any):
         super().__init__()
         self.threshold = threshold
@@ -160,8 +207,14 @@ class LessThanOrEqualTo(Matcher):
     def _matches(self, other: Any) -> bool:
         return bool(other <= self.threshold)
 
+    def _matches_many(self, values: Any) -> Any:
+        threshold = self.threshold
+        if is_ndarray_vector(values):
+            return values <= threshold
+        return [bool(other <= threshold) for other in values]
+
     def _description(self) -> str:
-        return repr(self.threshold)
+        return described(self.threshold)
 
 
 LTE = LessThanOrEqualTo
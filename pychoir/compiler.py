@@ -0,0 +1,331 @@
+"""
+Compiling Matcher trees into flat predicates
+"""
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+
+from pychoir import optimizer
+from pychoir.comparisons import (
+    EqualTo,
+    GreaterThan,
+    GreaterThanOrEqualTo,
+    LessThan,
+    LessThanOrEqualTo,
+    NotEqualTo,
+)
+from pychoir.containers import (
+    All,
+    AreNot,
+    Contains,
+    ContainsAllOf,
+    ContainsAnyOf,
+    ContainsNoneOf,
+    DictContainsAllOf,
+    HasLength,
+    IsEmpty,
+    IsNotPresentOr,
+    NotPresent,
+    _First,
+    _Last,
+    _Slice,
+)
+from pychoir.core import (
+    _UNTRACKED_EQ_CONTEXT,
+    Matchable,
+    MatchedType,
+    Matcher,
+    _AndOperator,
+    _matches_untracked,
+    _OrOperator,
+)
+from pychoir.existential import Anything, In, Is, IsFalsy, IsNoneOr, IsTruthy
+from pychoir.logical import And, Not, Or, ResultsTrueFor
+from pychoir.numeric import IsEven, IsNegative, IsNonNegative, IsOdd, IsPositive
+from pychoir.strings import EndsWith, MatchesRegex, StartsWith
+from pychoir.types import IsInstance
+from pychoir.utils import MANY_LOOKUPS
+
+
+class CompiledMatcher:
+    """A Matcher tree compiled into a single predicate function, see :func:`compile`.
+
+    Compares like the Matcher it was compiled from, but only falls back to evaluating the original Matcher
+    (and recording failures into it) when the predicate does not pass. Its textual representation is
+    that of the original Matcher.
+    """
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, matcher: Matchable, predicate: Callable[[Any], bool], source: str) -> None:
+        self.matcher = matcher
+        self.source = source
+        self.__predicate = predicate
+
+    def __call__(self, other: MatchedType) -> bool:
+        return self == other
+
+    def __reduce__(self) -> Tuple[Callable[[Matchable], 'CompiledMatcher'], Tuple[Matchable]]:
+        # the generated predicate cannot be pickled, so it is compiled again when unpickling
+        return compile, (self.matcher,)
+
+    def passes(self, other: MatchedType) -> bool:
+        """Returns whether the predicate passes for the value, without evaluating the original Matcher.
+
+        Returns False also when the predicate raises an exception, leaving it for the original Matcher to decide.
+        """
+        try:
+            return self.__predicate(other)
+        except Exception:
+            return False
+
+    def __eq__(self, other: MatchedType) -> bool:
+        if self.passes(other):
+            return True
+        return bool(self.matcher == other)
+
+    def __ne__(self, other: MatchedType) -> bool:
+        try:
+            if not self.__predicate(other):
+                return True
+        except Exception:
+            pass
+        return bool(self.matcher != other)
+
+    def __str__(self) -> str:
+        return str(self.matcher)
+
+    def __repr__(self) -> str:
+        return repr(self.matcher)
+
+
+_Handler = Callable[['_Compiler', Any, str], str]
+
+# Matchers whose generated expression refers to the compared value only once
+_SINGLE_REFERENCE: Tuple[Type[Matcher], ...] = (
+    EqualTo, NotEqualTo, GreaterThan, GreaterThanOrEqualTo, LessThan, LessThanOrEqualTo,
+    Anything, Is, IsTruthy, IsFalsy, In,
+    IsEven, IsOdd, IsPositive, IsNonNegative, IsNegative,
+    StartsWith, EndsWith, MatchesRegex,
+    IsInstance,
+    IsEmpty, HasLength, Contains, All, AreNot, _First, _Last, _Slice,
+)
+
+
+class _Compiler:
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {'NotPresent': NotPresent, '_fallback': _fallback}
+        self.definitions: List[str] = []
+        self.variables = 0
+
+    def constant(self, value: Any) -> str:
+        name = f'_c{len(self.namespace)}'
+        self.namespace[name] = value
+        return name
+
+    def variable(self) -> str:
+        self.variables += 1
+        return f'v{self.variables}'
+
+    def function(self, matcher: Matchable) -> str:
+        name = f'_f{len(self.definitions)}'
+        self.definitions.append('')  # reserve the name before compiling nested definitions
+        self.definitions[int(name[2:])] = f'def {name}(v0):\n    return {self.expression(matcher, "v0")}\n'
+        return name
+
+    def expression(self, matcher: Matchable, subject: str) -> str:
+        if not isinstance(matcher, Matcher):
+            return f'({self.constant(matcher)} == {subject})'
+
+        handler = _HANDLERS.get(type(matcher))
+        if handler is None:
+            return _fallback_expression(self, matcher, subject)
+        if not _is_variable(subject) and type(matcher) not in _SINGLE_REFERENCE:
+            return f'{self.function(matcher)}({subject})'
+        return handler(self, matcher, subject)
+
+    def expressions(self, matchers: Sequence[Matchable], subject: str) -> List[str]:
+        return [self.expression(matcher, subject) for matcher in matchers]
+
+
+def _is_variable(subject: str) -> bool:
+    return subject.startswith('v') and subject[1:].isdigit()
+
+
+def _fallback(matcher: Matcher, other: Any) -> bool:
+    # failures get recorded when the original Matcher is evaluated after the predicate fails
+    return _matches_untracked(matcher, other, _UNTRACKED_EQ_CONTEXT)
+
+
+def _all_of(expressions: List[str]) -> str:
+    return f'({" and ".join(expressions)})' if expressions else 'True'
+
+
+def _any_of(expressions: List[str]) -> str:
+    return f'({" or ".join(expressions)})' if expressions else 'False'
+
+
+def _operator(operator: str, attribute: str) -> _Handler:
+    def handler(compiler: _Compiler, matcher: Any, subject: str) -> str:
+        return f'({subject} {operator} {compiler.constant(getattr(matcher, attribute))})'
+    return handler
+
+
+def _constant_comparison(template: str) -> _Handler:
+    def handler(_: _Compiler, __: Any, subject: str) -> str:
+        return template.format(subject)
+    return handler
+
+
+def _all(compiler: _Compiler, matcher: All, subject: str) -> str:
+    variable = compiler.variable()
+    return f'all({_all_of(compiler.expressions(matcher.matchers, variable))} for {variable} in {subject})'
+
+
+def _are_not(compiler: _Compiler, matcher: AreNot, subject: str) -> str:
+    variable = compiler.variable()
+    return f'(not any({_any_of(compiler.expressions(matcher.matchers, variable))} for {variable} in {subject}))'
+
+
+def _dict_contains_all_of(compiler: _Compiler, matcher: DictContainsAllOf, subject: str) -> str:
+    expressions = []
+    for key, expected in matcher.expected.items():
+        key_name = compiler.constant(key)
+        if expected is NotPresent:
+            expressions.append(f'({key_name} not in {subject})')
+        else:
+            expressions.append(compiler.expression(expected, f'{subject}.get({key_name}, NotPresent)'))
+    return _all_of(expressions)
+
+
+def _fallback_expression(compiler: _Compiler, matcher: Matcher, subject: str) -> str:
+    return f'_fallback({compiler.constant(matcher)}, {subject})'
+
+
+def _contains_all_of(compiler: _Compiler, matcher: ContainsAllOf, subject: str) -> str:
+    if len(matcher.values) >= MANY_LOOKUPS:
+        return _fallback_expression(compiler, matcher, subject)  # looks the values up from a set
+    return _all_of([f'({compiler.constant(value)} in {subject})' for value in matcher.values])
+
+
+def _contains_any_of(compiler: _Compiler, matcher: ContainsAnyOf, subject: str) -> str:
+    if len(matcher.values) >= MANY_LOOKUPS:
+        return _fallback_expression(compiler, matcher, subject)
+    return _any_of([f'({compiler.constant(value)} in {subject})' for value in matcher.values])
+
+
+def _contains_none_of(compiler: _Compiler, matcher: ContainsNoneOf, subject: str) -> str:
+    if len(matcher.values) >= MANY_LOOKUPS:
+        return _fallback_expression(compiler, matcher, subject)
+    return f'(not {_any_of([f"({compiler.constant(value)} in {subject})" for value in matcher.values])})'
+
+
+def _starts_with(compiler: _Compiler, matcher: StartsWith, subject: str) -> str:
+    if matcher._index is not None:
+        return _fallback_expression(compiler, matcher, subject)  # looks the prefixes up by their lengths
+    return f'{subject}.startswith({compiler.constant(matcher.start)})'
+
+
+def _ends_with(compiler: _Compiler, matcher: EndsWith, subject: str) -> str:
+    if matcher._index is not None:
+        return _fallback_expression(compiler, matcher, subject)
+    return f'{subject}.endswith({compiler.constant(matcher.end)})'
+
+
+def _first(compiler: _Compiler, matcher: _First, subject: str) -> str:
+    sliced = f'{subject}[0]' if matcher.how_many < 2 else f'{subject}[:{matcher.how_many!r}]'
+    return compiler.expression(matcher.matcher, sliced)
+
+
+def _last(compiler: _Compiler, matcher: _Last, subject: str) -> str:
+    sliced = f'{subject}[-1]' if matcher.how_many < 2 else f'{subject}[-{matcher.how_many!r}:]'
+    return compiler.expression(matcher.matcher, sliced)
+
+
+def _results_true_for(compiler: _Compiler, matcher: ResultsTrueFor, subject: str) -> str:
+    return _all_of([f'{compiler.constant(condition)}({subject})' for condition in matcher.conditions])
+
+
+_HANDLERS: Dict[Type[Matcher], _Handler] = {
+    _AndOperator: lambda compiler, matcher, subject: _all_of(compiler.expressions(matcher.matchers, subject)),
+    _OrOperator: lambda compiler, matcher, subject: _any_of(compiler.expressions(matcher.matchers, subject)),
+    And: lambda compiler, matcher, subject: _all_of(compiler.expressions(matcher.matchers, subject)),
+    Or: lambda compiler, matcher, subject: _any_of(compiler.expressions(matcher.matchers, subject)),
+    Not: lambda compiler, matcher, subject: f'(not {_any_of(compiler.expressions(matcher.matchers, subject))})',
+    ResultsTrueFor: _results_true_for,
+
+    EqualTo: _operator('==', 'value'),
+    NotEqualTo: _operator('!=', 'value'),
+    GreaterThan: _operator('>', 'threshold'),
+    GreaterThanOrEqualTo: _operator('>=', 'threshold'),
+    LessThan: _operator('<', 'threshold'),
+    LessThanOrEqualTo: _operator('<=', 'threshold'),
+
+    Anything: _constant_comparison('True'),
+    Is: _operator('is', 'value'),
+    IsTruthy: _constant_comparison('bool({})'),
+    IsFalsy: _constant_comparison('(not {})'),
+    In: lambda compiler, matcher, subject: f'({subject} in {compiler.constant(matcher._allowed)})',
+    IsNoneOr: lambda compiler, matcher, subject: _any_of(
+        [f'({subject} is None)'] + compiler.expressions(matcher.matchers, subject)),
+
+    IsEven: _constant_comparison('({} % 2 == 0)'),
+    IsOdd: _constant_comparison('({} % 2 == 1)'),
+    IsPositive: _constant_comparison('({} > 0)'),
+    IsNonNegative: _constant_comparison('({} >= 0)'),
+    IsNegative: _constant_comparison('({} < 0)'),
+
+    StartsWith: _starts_with,
+    EndsWith: _ends_with,
+    MatchesRegex: lambda compiler, matcher, subject: (
+        f'({compiler.constant(matcher.regex)}.search({subject}) is not None)'),
+
+    IsInstance: lambda compiler, matcher, subject: f'isinstance({subject}, {compiler.constant(matcher.types)})',
+
+    IsEmpty: _constant_comparison('(len({}) == 0)'),
+    HasLength: lambda compiler, matcher, subject: compiler.expression(matcher.matcher, f'len({subject})'),
+    All: _all,
+    AreNot: _are_not,
+    Contains: lambda compiler, matcher, subject: f'({compiler.constant(matcher.value)} in {subject})',
+    ContainsAllOf: _contains_all_of,
+    ContainsAnyOf: _contains_any_of,
+    ContainsNoneOf: _contains_none_of,
+    DictContainsAllOf: _dict_contains_all_of,
+    IsNotPresentOr: lambda compiler, matcher, subject: _any_of(
+        [f'({subject} is NotPresent)', compiler.expression(matcher.matcher, subject)]),
+    _First: _first,
+    _Last: _last,
+    _Slice: lambda compiler, matcher, subject: compiler.expression(
+        matcher.matcher, f'{subject}[{compiler.constant(matcher.slice)}]'),
+}
+
+
+def compile(matcher: Matchable, optimize: bool = False) -> CompiledMatcher:
+    """Compiles a Matcher tree into a single specialized predicate function.
+
+    Bare values are compared with :code:`==` and the built-in Matchers are inlined as plain Python expressions,
+    skipping the bookkeeping done by :func:`Matcher.nested_match`. Other Matchers are evaluated as usual.
+    When the predicate does not pass, the original Matcher is evaluated to record the failures
+    shown in its textual representation.
+
+    The Matchers are compiled as they are when calling this, later changes to their parameters are not seen.
+
+    :param matcher: The Matcher (or value) to compile.
+    :param optimize: Set to True to compile the tree rewritten by :func:`optimize` instead,
+        which also shows the failures.
+    :return: A :class:`CompiledMatcher` to compare values against.
+
+    Usage:
+      >>> from pychoir import All, And, HasLength, IsInstance, GreaterThan, compile
+      >>> matcher = compile(And(HasLength(GreaterThan(1)), All(IsInstance(int), GreaterThan(0))))
+      >>> [1, 2, 3] == matcher
+      True
+      >>> [1, 2, -3] == matcher
+      False
+      >>> matcher
+      And(HasLength(GreaterThan(1)), All(IsInstance(int), GreaterThan(0)[FAILED for -3])[FAILED for [1, 2, -3]])[FAILED for [1, 2, -3]]
+    """  # noqa: E501
+    if optimize:
+        matcher = optimizer.optimize(matcher)
+    compiler = _Compiler()
+    predicate_source = f'def _predicate(v0):\n    return bool({compiler.expression(matcher, "v0")})\n'
+    source = '\n'.join(compiler.definitions + [predicate_source])
+    exec(source, compiler.namespace)
+    return CompiledMatcher(matcher, compiler.namespace['_predicate'], source)
@@ -1,8 +1,45 @@
 import sys
-from typing import Any, Iterable, Mapping, Optional, Sequence, Tuple, Union
-
-from pychoir.core import Matchable, Matcher, Transformer
-from pychoir.utils import i_removed
+from collections import Counter, deque
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Deque,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from pychoir.core import (
+    Matchable,
+    Matcher,
+    Transformer,
+    _any_awaits,
+    described,
+    described_all,
+    set_fast_evaluation,
+)
+from pychoir.utils import (
+    ValueIndex,
+    all_concurrently,
+    all_true,
+    any_concurrently,
+    any_true,
+    as_set,
+    buffer_contains,
+    frozen,
+    is_buffer,
+    is_ndarray,
+    is_ndarray_vector,
+    maximum_bipartite_matching,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
 
 if sys.version_info >= (3, 8):
     from typing import Protocol
@@ -24,6 +61,8 @@ class IsEmpty(Matcher):
       >>> {'not': 'empty'} == Not(IsEmpty())
       True
     """
+    _cost = 1
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
 
     def _matches(self, other: Lengthy) -> bool:
         return len(other) == 0
@@ -44,6 +83,9 @@ class HasLength(Matcher):
       >>> 'foo' == HasLength(GreaterThan(2))
       True
     """
+    _cost = 2
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, matcher: Matchable):
         super().__init__()
         self.matcher = matcher
@@ -57,11 +99,85 @@ class HasLength(Matcher):
 
 Len = HasLength
 
+# how many values a worker process evaluates between checking whether it should stop
+_STOP_CHECK_INTERVAL = 1000
+
+_stopping_chunk: Any = None
+
+
+def _start_chunk_worker(stopping_chunk: Any) -> None:
+    global _stopping_chunk
+    _stopping_chunk = stopping_chunk
+    set_fast_evaluation(True)
+
+
+def _first_failure_in_chunk(
+    matchers: Sequence[Matchable],
+    mismatch_expected: bool,
+    chunk_index: int,
+    chunk: Sequence[Any],
+) -> Optional[int]:
+    for offset, value in enumerate(chunk):
+        if offset % _STOP_CHECK_INTERVAL == 0 and _stopping_chunk.value < chunk_index:
+            return None  # an earlier chunk has already failed
+        if mismatch_expected:
+            failed = any(value == matcher for matcher in matchers)
+        else:
+            failed = not all(value == matcher for matcher in matchers)
+        if failed:
+            return offset
+    return None
+
+
+def _first_failure_in_parallel(
+    matchers: Sequence[Matchable],
+    iterable: Iterable[Any],
+    mismatch_expected: bool,
+    workers: int,
+    chunk_size: int,
+) -> Optional[Tuple[Any]]:
+    # Returns the first failing value in a tuple, or None if all values pass.
+    # Chunks are waited for in order, so the first failure found is the first one in the iterable.
+    # only needed with workers, not worth the import time otherwise
+    from concurrent.futures import ProcessPoolExecutor
+    from multiprocessing import RawValue
+
+    stopping_chunk = RawValue('q', sys.maxsize)
+    iterator = iter(iterable)
+    chunks = enumerate(iter(lambda: list(islice(iterator, chunk_size)), []))
+    pending: Deque[Tuple[int, List[Any], 'Future[Optional[int]]']] = deque()
+    with ProcessPoolExecutor(workers, initializer=_start_chunk_worker, initargs=(stopping_chunk,)) as pool:
+        try:
+            while True:
+                for chunk_index, chunk in islice(chunks, 2 * workers - len(pending)):
+                    future = pool.submit(_first_failure_in_chunk, matchers, mismatch_expected, chunk_index, chunk)
+                    pending.append((chunk_index, chunk, future))
+                if not pending:
+                    return None
+
+                chunk_index, chunk, future = pending.popleft()
+                offset = future.result()
+                if offset is not None:
+                    stopping_chunk.value = chunk_index
+                    return (chunk[offset],)
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+
 
 class All(Matcher):
     """A Matcher checking that all values in a container match passed Matchables.
 
+    A one-dimensional NumPy array is compared against each of the Matchables as a whole,
+    and the failed values are reported by their indices.
+
+    With `workers`, the values are evaluated in chunks in a pool of processes, which requires
+    the Matchables and the values to be picklable. The evaluation stops at the first failing value,
+    which is then evaluated again in the calling process to record the failures.
+
     :param matchers: The value(s) and/or Matcher(s) to compare against.
+    :param workers: The number of worker processes to use, by default evaluates in the calling process.
+    :param chunk_size: The number of values to pass to a worker process at a time.
 
     Usage:
       >>> from pychoir import All, IsInstance
@@ -70,21 +186,47 @@ class All(Matcher):
       >>> [1, 2, 3] == All(IsInstance(int))
       True
     """
-    def __init__(self, *matchers: Matchable):
+    _cost = 20
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
+    def __init__(self, *matchers: Matchable, workers: Optional[int] = None, chunk_size: int = 10_000):
         super().__init__()
         self.matchers = matchers
+        self.workers = workers
+        self.chunk_size = chunk_size
 
     def _matches(self, iterable: Iterable[Any]) -> bool:
+        if is_ndarray_vector(iterable):
+            return all(all_true(self.nested_match_many(matcher, iterable)) for matcher in self.matchers)
+        if self.workers is not None:
+            failure = _first_failure_in_parallel(self.matchers, iterable, False, self.workers, self.chunk_size)
+            if failure is None:
+                return True
+            iterable = failure
         return all(self.nested_match(matcher, value) for value in iterable for matcher in self.matchers)
 
+    async def _matches_async(self, iterable: Iterable[Any]) -> bool:
+        return await all_concurrently(
+            evaluation for value in iterable for evaluation in self.nested_evaluations(self.matchers, value))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
+
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 class AreNot(Matcher):
     """A Matcher checking that none of the values in a container match passed Matchables.
 
+    A one-dimensional NumPy array is compared against each of the Matchables as a whole,
+    and the failed values are reported by their indices.
+
+    With `workers`, the values are evaluated in a pool of processes like in :class:`All`.
+
     :param matchers: The value(s) and/or Matcher(s) to compare against.
+    :param workers: The number of worker processes to use, by default evaluates in the calling process.
+    :param chunk_size: The number of values to pass to a worker process at a time.
 
     Usage:
       >>> from pychoir import AreNot, IsInstance
@@ -93,21 +235,47 @@ class AreNot(Matcher):
       >>> [1, 2, 3] == AreNot(IsInstance(str))
       True
     """
-    def __init__(self, *matchers: Matchable):
+    _cost = 20
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
+    def __init__(self, *matchers: Matchable, workers: Optional[int] = None, chunk_size: int = 10_000):
         super().__init__()
         self.matchers = matchers
+        self.workers = workers
+        self.chunk_size = chunk_size
 
     def _matches(self, iterable: Iterable[Any]) -> bool:
+        if is_ndarray_vector(iterable):
+            return not any(any_true(self.nested_match_many(matcher, iterable, expect_mismatch=True))
+                           for matcher in self.matchers)
+        if self.workers is not None:
+            failure = _first_failure_in_parallel(self.matchers, iterable, True, self.workers, self.chunk_size)
+            if failure is None:
+                return True
+            iterable = failure
         return not any(self.nested_match(matcher, value, expect_mismatch=True)
                        for value in iterable for matcher in self.matchers)
 
+    async def _matches_async(self, iterable: Iterable[Any]) -> bool:
+        return not await any_concurrently(
+            evaluation for value in iterable
+            for evaluation in self.nested_evaluations(self.matchers, value, expect_mismatch=True))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
+
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 class Contains(Matcher):
     """A Matcher checking that a container contains the passed value.
 
+    Bytes are also found in :class:`memoryview` and :class:`mmap.mmap` objects, without copying them.
+    They are searched for as a substring, like in :class:`bytes`: :code:`memoryview(b'abc') == Contains(b'bc')`
+    is True, while :code:`b'bc' in memoryview(b'abc')` is False. Other values are found with :code:`in`,
+    like the integers in :code:`memoryview(b'abc') == Contains(97)`.
+
     :param value: The value to find in the container.
 
     Usage:
@@ -117,15 +285,22 @@ class Contains(Matcher):
       >>> [1, 2, 3] == Contains(4)
       False
     """
+    _cost = 5
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
 
     def _matches(self, other: Any) -> bool:
+        if isinstance(self.value, Matcher) and is_ndarray(other):
+            return any_true(self.value.match_many(other))
+        if is_buffer(other) and isinstance(self.value, (bytes, bytearray, memoryview)):
+            return buffer_contains(other, self.value)
         return self.value in other
 
     def _description(self) -> str:
-        return repr(self.value)
+        return described(self.value)
 
 
 class ContainsAllOf(Matcher):
@@ -133,6 +308,9 @@ class ContainsAllOf(Matcher):
 
     Plural of :class:`Contains`.
 
+    Hashable values are looked up from a set when the container is one. With many values to find,
+    a one-off set is built of the items of a list or tuple too.
+
     :param values: The value(s) to find in the container.
 
     Usage:
@@ -142,20 +320,29 @@ class ContainsAllOf(Matcher):
       >>> [1, 2, 3] == ContainsAllOf(3, 4)
       False
     """
+    _cost = 5
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, *values: Any):
         super().__init__()
         self.values = values
+        self._index = ValueIndex(values)
 
     def _matches(self, other: Any) -> bool:
-        return all(value in other for value in self.values)
+        items = as_set(other, len(self.values))
+        if items is None:
+            return all(value in other for value in self.values)
+        return self._index.hashable <= items and all(value in other for value in self._index.unhashable)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.values))
+        return described_all(self.values)
 
 
 class ContainsAnyOf(Matcher):
     """A Matcher checking that a container contains *at least one of* the passed values.
 
+    Looks up the values like :class:`ContainsAllOf`.
+
     :param values: The value(s) to find in the container.
 
     Usage:
@@ -165,20 +352,29 @@ class ContainsAnyOf(Matcher):
       >>> [1, 2, 3] == ContainsAnyOf(3, 4)
       True
     """
+    _cost = 5
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, *values: Any):
         super().__init__()
         self.values = values
+        self._index = ValueIndex(values)
 
     def _matches(self, other: Any) -> bool:
-        return any(value in other for value in self.values)
+        items = as_set(other, len(self.values))
+        if items is None:
+            return any(value in other for value in self.values)
+        return not self._index.hashable.isdisjoint(items) or any(value in other for value in self._index.unhashable)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.values))
+        return described_all(self.values)
 
 
 class ContainsNoneOf(Matcher):
     """A Matcher checking that a container contains none of the passed values.
 
+    Looks up the values like :class:`ContainsAllOf`.
+
     :param values: The value(s) to find in the container.
 
     Usage:
@@ -188,15 +384,22 @@ class ContainsNoneOf(Matcher):
       >>> [1, 2, 3] == ContainsNoneOf(4)
       True
     """
+    _cost = 5
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, *values: Any):
         super().__init__()
         self.values = values
+        self._index = ValueIndex(values)
 
     def _matches(self, other: Any) -> bool:
-        return not any(value in other for value in self.values)
+        items = as_set(other, len(self.values))
+        if items is None:
+            return not any(value in other for value in self.values)
+        return self._index.hashable.isdisjoint(items) and not any(value in other for value in self._index.unhashable)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.values))
+        return described_all(self.values)
 
 
 class DictContainsAllOf(Matcher):
@@ -204,34 +407,46 @@ class DictContainsAllOf(Matcher):
     Usually this means that the passed dict is a subset of the one compared against.
     Keys expected to be absent can be set as :class:`NotPresent`.
 
+    Only the expected keys are looked up, in order, and the evaluation stops at the first one that does not match.
+    The key that failed is shown with the value it had.
+
     :param value: The Mapping to find in the Mapping compared against.
 
     Usage:
       >>> from pychoir import DictContainsAllOf, NotPresent
       >>> {'a': 1, 'b': 2, 'd': 3} == DictContainsAllOf({'a': 1, 'c': NotPresent})
       True
-      >>> {'a': 1, 'c': 2, 'd': 3} == DictContainsAllOf({'a': 1, 'c': NotPresent})
+      >>> matcher = DictContainsAllOf({'a': 1, 'c': NotPresent})
+      >>> {'a': 1, 'c': 2, 'd': 3} == matcher
       False
+      >>> matcher
+      DictContainsAllOf({'a': 1, 'c': NotPresent})[FAILED for {'c': 2}]
     """
+    _cost = 5
+
     def __init__(self, value: Mapping[Any, Any]):
         super().__init__()
         self.expected = value
 
     def _matches(self, other: Mapping[Any, Any]) -> bool:
-        match_dict = {key: value for key, value in other.items() if key in self.expected}
-        for key in self.expected:
-            if key not in match_dict:
-                match_dict[key] = NotPresent
-        return self.expected == match_dict
+        for key, expected in self.expected.items():
+            value = other.get(key, NotPresent)
+            # identical values are equal, like in comparing dicts with ==, NaN for example
+            if expected is not value and not self.nested_match(expected, value):
+                self.report_failed_value({key: value})
+                return False
+        return True
 
     def _description(self) -> str:
-        return repr(self.expected)
+        return described(self.expected)
 
 
 class InAnyOrder(Matcher):
     """A Matcher checking that an Iterable contains *exactly* the passed items, in any order.
 
     The Iterable can be for example a list, tuple or set. Items can be Matchers and do not need to be hashable.
+    Hashable bare values are counted, other items are paired up using maximum bipartite matching,
+    so the time taken grows polynomially with the number of items.
 
     :param values: An Iterable containing the expected items, in any order.
 
@@ -248,26 +463,36 @@ class InAnyOrder(Matcher):
       >>> [{'a': 1}, {'b': 2}] == InAnyOrder([{'b': IsEven()}, {'a': IsOdd()}])
       True
     """
+    _cost = 20
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, values: Iterable[Matchable]):
         super().__init__()
         self.expected_values = values
 
     def _matches(self, other: Iterable[Any]) -> bool:
-        return self.__has_a_solution(tuple(self.expected_values), tuple(other))
-
-    def __has_a_solution(self, expected_left: Tuple[Matchable, ...], values_left: Tuple[Any, ...]) -> bool:
-        if not expected_left and not values_left:
-            return True  # expectations and values matched one-to-one
-        if not expected_left or not values_left:
-            return False  # expectations or values left but nothing to match with
-
-        expected_head, expected_tail = expected_left[0], expected_left[1:]
-        return any(self.nested_match(expected_head, value) and
-                   self.__has_a_solution(expected_tail, i_removed(values_left, i))
-                   for i, value in enumerate(values_left))
+        expected_values = tuple(self.expected_values)
+        values = tuple(other)
+        if len(expected_values) != len(values):
+            return False
+
+        if not any(isinstance(expected, Matcher) for expected in expected_values):
+            try:
+                return Counter(expected_values) == Counter(values)
+            except TypeError:
+                pass  # unhashable items, fall back to matching item by item
+
+        compatible_values: List[List[int]] = []
+        for expected in expected_values:
+            compatible = [i for i, value in enumerate(values) if self.nested_match(expected, value)]
+            if not compatible:
+                return False  # nothing for this expectation to match with
+            compatible_values.append(compatible)
+
+        return maximum_bipartite_matching(compatible_values, len(values)) == len(expected_values)
 
     def _description(self) -> str:
-        return repr(self.expected_values)
+        return described(self.expected_values)
 
 
 class SetEquals(Matcher):
@@ -275,6 +500,7 @@ class SetEquals(Matcher):
     Faster than :class:`InAnyOrder` but less pedantic about duplicates and requires hashable items.
 
     The Iterable can be for example a list, tuple or set. Items must be hashable.
+    The expected items are frozen into a set when the Matcher is created.
 
     :param values: An Iterable containing the expected items, in any order.
 
@@ -285,15 +511,20 @@ class SetEquals(Matcher):
       >>> [1, 2] == SetEquals([3, 2, 1])
       False
     """
+    _cost = 5
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, values: Iterable[Any]):
         super().__init__()
         self.expected_values = values
+        self._expected = frozen(values)
 
     def _matches(self, other: Iterable[Any]) -> bool:
-        return set(self.expected_values) == set(other)
+        expected = self._expected if self._expected is not None else set(self.expected_values)
+        return expected == set(other)
 
     def _description(self) -> str:
-        return repr(self.expected_values)
+        return described(self.expected_values)
 
 
 class _NotPresent:
@@ -320,6 +551,8 @@ class IsNotPresentOr(Matcher):
       >>> {} == DictContainsAllOf({'a': IsNotPresentOr(2)})
       True
     """
+    _cost = 2
+
     def __init__(self, matcher: Matchable):
         super().__init__()
         self.matcher = matcher
@@ -332,6 +565,9 @@ class IsNotPresentOr(Matcher):
 
 
 class _First(Matcher):
+    _cost = 2
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, how_many: int, matcher: Matchable):
         super().__init__(name='First')
         self.how_many = how_many
@@ -375,6 +611,9 @@ class First(Transformer):
 
 
 class _Last(Matcher):
+    _cost = 2
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, how_many: int, matcher: Matchable):
         super().__init__(name='Last')
         self.how_many = how_many
@@ -416,6 +655,9 @@ class Last(Transformer):
 
 
 class _Slice(Matcher):
+    _cost = 5
+    __array_ufunc__ = None  # NumPy arrays are compared as a whole, not item by item
+
     def __init__(self, slice_: Union[int, slice], matcher: Matchable) -> None:
         super().__init__(name=f'Slice[{slice_}]')
         self.slice = slice_
@@ -1,11 +1,41 @@
 import sys
+import threading
 from abc import ABC, abstractmethod
-from contextlib import contextmanager
-from enum import Enum, auto
-from itertools import chain
-from typing import Any, Callable, Iterator, List, Optional, Tuple, Type, TypeVar, Union
-
-from pychoir.utils import Default, DefaultType, sequence_or_its_only_member
+from contextvars import ContextVar
+from enum import Enum
+from itertools import chain, count
+from time import perf_counter
+from types import BuiltinFunctionType, FunctionType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from pychoir.utils import (
+    Default,
+    DefaultType,
+    all_concurrently,
+    any_concurrently,
+    bool_array,
+    imported_numpy,
+    is_ndarray,
+    sequence_or_its_only_member,
+)
+
+if TYPE_CHECKING:
+    import re
 
 MatchedType = TypeVar('MatchedType', bound=Any)
 
@@ -40,46 +70,324 @@ class _MatcherStatus(str, Enum):
     FAILED = 'FAILED'
 
 
-class _MatcherDirection(Enum):
-    EQ = auto()
-    NE = auto()
+class FailedValueStorage(str, Enum):
+    """What a Matcher keeps of the values it fails for, see :class:`FailureRecording`."""
+    VALUE = 'value'
+    """The values themselves, until they are rendered into the textual representation of the Matcher."""
+    REPR = 'repr'
+    """The :code:`repr()` of the values, taken immediately."""
+    DIGEST = 'digest'
+    """A short digest of the :code:`repr()` of the values, taken immediately."""
+
+
+class FailureRecording:
+    """Policy for recording the values Matchers fail for. Set it with :func:`set_failure_recording`.
+
+    Failures are always counted, but only the first `max_values` failed values are kept per Matcher.
+
+    :param max_values: How many failed values to keep per Matcher, or None to keep all of them.
+    :param storage: What to keep of each failed value.
+    :param max_repr_length: The length to truncate the :code:`repr()` of each failed value to, or None.
+    """
+    def __init__(
+        self,
+        max_values: Optional[int] = 100,
+        storage: FailedValueStorage = FailedValueStorage.VALUE,
+        max_repr_length: Optional[int] = None,
+    ) -> None:
+        self.max_values = max_values
+        self.storage = storage
+        self.max_repr_length = max_repr_length
+
+    def __repr__(self) -> str:
+        return (f'FailureRecording(max_values={self.max_values!r}, storage={self.storage.value!r}, '
+                f'max_repr_length={self.max_repr_length!r})')
+
+
+_failure_recording = FailureRecording()
 
-    @classmethod
-    def from_mismatch_expected(cls, mismatch_expected: bool) -> '_MatcherDirection':
-        return cls.NE if mismatch_expected else cls.EQ
 
+def set_failure_recording(recording: FailureRecording) -> FailureRecording:
+    """Sets how Matchers record the values they fail for.
+
+    :param recording: The new :class:`FailureRecording` policy.
+    :return: The previous policy, for restoring it later.
+
+    Usage:
+      >>> from pychoir import FailureRecording, GreaterThan, set_failure_recording
+      >>> previous = set_failure_recording(FailureRecording(max_values=2))
+      >>> matcher = GreaterThan(0)
+      >>> [value == matcher for value in (-1, -2, -3)]
+      [False, False, False]
+      >>> matcher
+      GreaterThan(0)[FAILED for (-1, -2) <first 2 of 3>]
+      >>> _ = set_failure_recording(previous)
+    """
+    global _failure_recording
+    previous, _failure_recording = _failure_recording, recording
+    _descriptions_changed()
+    return previous
+
+
+class DescriptionRendering:
+    """Policy for rendering the textual representations of Matchers. Set it with :func:`set_description_rendering`.
+
+    Long lists, tuples, sets and dicts of expected values (like the allowed values of :class:`In`) and of failed
+    values are elided after their first items, and the parameters of deeply nested Matchers to :code:`...`.
+    Matchers that have failed, and the values containing them, are never elided.
+
+    :param max_items: How many items of a list, tuple, set or dict to show, or None to show all of them.
+    :param max_depth: How many levels of nested Matchers to show, or None to show all of them.
+    """
+    def __init__(self, max_items: Optional[int] = 100, max_depth: Optional[int] = None) -> None:
+        self.max_items = max_items
+        self.max_depth = max_depth
+
+    def __repr__(self) -> str:
+        return f'DescriptionRendering(max_items={self.max_items!r}, max_depth={self.max_depth!r})'
+
+
+_description_rendering = DescriptionRendering()
+
+
+def set_description_rendering(rendering: DescriptionRendering) -> DescriptionRendering:
+    """Sets how the textual representations of Matchers are rendered.
+
+    :param rendering: The new :class:`DescriptionRendering` policy.
+    :return: The previous policy, for restoring it later.
+
+    Usage:
+      >>> from pychoir import And, DescriptionRendering, In, IsInstance, Not, set_description_rendering
+      >>> previous = set_description_rendering(DescriptionRendering(max_items=3, max_depth=2))
+      >>> In(list(range(100_000)))
+      In([0, 1, 2, ... 99997 more])
+      >>> matcher = And(Not(IsInstance(str)), Not(In([1, 2])))
+      >>> matcher
+      And(Not(IsInstance(...)), Not(In(...)))
+      >>> 2 == matcher
+      False
+      >>> matcher
+      And(Not(IsInstance(...)), Not(In([1, 2])[FAILED for 2])[FAILED for 2])[FAILED for 2]
+      >>> _ = set_description_rendering(previous)
+    """
+    global _description_rendering
+    previous, _description_rendering = _description_rendering, rendering
+    _descriptions_changed()
+    return previous
 
+
+# Changed whenever the textual representation of any Matcher may have changed, invalidating the cached ones.
+# Failures are the only changes of state that show, so passing evaluations do not touch it.
+# Taken from a counter after the change, so that concurrent changes never end up with the same version.
+_descriptions_versions = count(1)
+_descriptions_version = 0
+# How deep in nested Matchers the one being described is
+_description_depth: ContextVar[int] = ContextVar('pychoir_description_depth', default=0)
+# the containers elided after max_items, with the format of their repr
+_ELIDED_CONTAINERS: Dict[type, str] = {
+    list: '[{}]', tuple: '({})', set: '{{{}}}', frozenset: 'frozenset({{{}}})', dict: '{{{}}}',
+}
+
+
+def _descriptions_changed() -> None:
+    global _descriptions_version
+    _descriptions_version = next(_descriptions_versions)
+
+
+def described(value: Any) -> str:
+    """Returns the :code:`repr()` of a value for :func:`Matcher._description`, with long lists, tuples, sets
+    and dicts elided as set with :func:`set_description_rendering`.
+
+    :param value: The value, for example the expected value of the Matcher.
+    """
+    if _description_rendering.max_items is None and _description_rendering.max_depth is None:
+        return repr(value)
+    return _described(value, _description_rendering)
+
+
+def described_all(values: Iterable[Any], separator: str = ', ') -> str:
+    """Returns the values (for example the child Matchers of the Matcher) for :func:`Matcher._description`,
+    joined with the separator and elided like by :func:`described`.
+
+    :param values: The values.
+    :param separator: What to join them with.
+    """
+    if _description_rendering.max_items is None and _description_rendering.max_depth is None:
+        return separator.join(map(repr, values))
+    return separator.join(_described_items(values, _description_rendering))
+
+
+def _described(value: Any, rendering: DescriptionRendering) -> str:
+    template = _ELIDED_CONTAINERS.get(type(value))
+    if template is None or not value:
+        return repr(value)
+    items = _described_items(value.items() if type(value) is dict else value, rendering, pairs=type(value) is dict)
+    if type(value) is tuple and len(value) == 1:
+        return template.format(f'{items[0]},')
+    return template.format(', '.join(items))
+
+
+def _described_items(items: Iterable[Any], rendering: DescriptionRendering, pairs: bool = False) -> List[str]:
+    # the first max_items items and the later ones containing failures, followed by how many were left out
+    def render(item: Any) -> str:
+        if pairs:
+            return f'{_described(item[0], rendering)}: {_described(item[1], rendering)}'
+        return _described(item, rendering)
+
+    if rendering.max_items is None:
+        return [render(item) for item in items]
+    items = list(items)
+    rest = items[rendering.max_items:]
+    values = [item[1] for item in rest] if pairs else rest
+    # only Matchers and containers can contain failures, checked item by item only when there are any
+    if any(issubclass(kind, Matcher) or kind in _ELIDED_CONTAINERS for kind in {type(value) for value in values}):
+        failing = [item for item, value in zip(rest, values) if _contains_failure(value)]
+    else:
+        failing = []
+    shown = [render(item) for item in chain(items[:rendering.max_items], failing)]
+    if len(rest) > len(failing):
+        shown.append(f'... {len(rest) - len(failing)} more')
+    return shown
+
+
+_IMMUTABLE_TYPES = (
+    type(None), bool, int, float, complex, str, bytes, range, slice, type, Enum, FunctionType, BuiltinFunctionType,
+)
+
+
+def _immutable(value: Any) -> bool:
+    if isinstance(value, Matcher):
+        return value._has_immutable_parameters()
+    if type(value) in (tuple, frozenset):
+        return all(map(_immutable, value))
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    # like NumPy for arrays, no value can be a compiled regular expression if re has not been imported
+    regular_expressions = sys.modules.get('re')
+    return regular_expressions is not None and isinstance(value, type(regular_expressions.compile('')))
+
+
+def _any_awaits(matchers: Iterable[Matchable]) -> bool:
+    # for Matchers that only await their children
+    return any(isinstance(matcher, Matcher) and matcher._awaits() for matcher in matchers)
+
+
+def _contains_failure(value: Any) -> bool:
+    if isinstance(value, Matcher):
+        return value._failed()
+    if type(value) is dict:
+        return any(_contains_failure(item) for item in value.values())
+    if type(value) in _ELIDED_CONTAINERS:
+        return any(_contains_failure(item) for item in value)
+    return False
+
+
+class _RenderedValue:
+    def __init__(self, text: str) -> None:
+        self.__text = text
+
+    def __repr__(self) -> str:
+        return self.__text
+
+
+def _rendered(value: Any, max_repr_length: Optional[int]) -> _RenderedValue:
+    if isinstance(value, _RenderedValue):
+        return value
+    text = described(value)
+    if max_repr_length is not None and len(text) > max_repr_length:
+        text = f'{text[:max(max_repr_length - 3, 0)]}...'
+    return _RenderedValue(text)
+
+
+_SHOWN_FAILED_ITEMS = 5
+
+
+def _failed_items(values: Sequence[Any], matched: Any, mismatch_expected: bool) -> Optional[_RenderedValue]:
+    # the failed items of a batch, shown by their indices instead of one by one
+    if is_ndarray(matched):
+        indices = imported_numpy().flatnonzero(matched == mismatch_expected)
+        count = len(indices)
+        shown_indices = indices[:_SHOWN_FAILED_ITEMS].tolist()
+    else:
+        all_indices = [index for index, passed in enumerate(matched) if bool(passed) is mismatch_expected]
+        count = len(all_indices)
+        shown_indices = all_indices[:_SHOWN_FAILED_ITEMS]
+    if count == 0:
+        return None
+
+    if is_ndarray(values):
+        shown_items = values[shown_indices].tolist()
+    else:
+        shown_items = [values[index] for index in shown_indices]
+    more = ', ...' if count > _SHOWN_FAILED_ITEMS else ''
+    return _RenderedValue(f'{repr(shown_items)[:-1]}{more}] at indices {repr(shown_indices)[:-1]}{more}]')
+
+
+def _digested(value: Any) -> _RenderedValue:
+    # only needed with FailedValueStorage.DIGEST, not worth the import time otherwise
+    from hashlib import blake2b
+
+    digest = blake2b(repr(value).encode(), digest_size=8).hexdigest()
+    return _RenderedValue(f'<{type(value).__name__} {digest}>')
+
+
+_NOT_RUN = _MatcherStatus.NOT_RUN
+_PASSED = _MatcherStatus.PASSED
+_FAILED = _MatcherStatus.FAILED
+
+
+# Shared by all the evaluations of a Matcher and updated without a lock, see the caveats in Matcher
 class _MatcherState:
+    __slots__ = ('__status', '__mismatch_expected', '__failed_values', '__failure_count', '__nested_calls', '__dirty')
+
     def __init__(self) -> None:
-        self.__status: _MatcherStatus = _MatcherStatus.NOT_RUN
-        self.__direction: Optional[_MatcherDirection] = None
+        self.__status: _MatcherStatus = _NOT_RUN
+        self.__mismatch_expected: Optional[bool] = None
         self.__failed_values: List[Any] = []
-        self.__nested_calls: List[Matcher] = []
-
-    def update(self, passed: bool, mismatch_expected: bool, value: Any) -> None:
-        direction = _MatcherDirection.from_mismatch_expected(mismatch_expected)
-        if self.__direction is None:
-            self.__direction = direction
-        elif self.__direction != direction:
+        self.__failure_count = 0
+        self.__nested_calls: Dict[int, Matcher] = {}
+        # whether the Matcher or one nested in it has failures recorded since they were last reset,
+        # so that passing Matchers only go through the ones nested in them when there is something to reset
+        self.__dirty = False
+
+    def update(self, passed: bool, mismatch_expected: bool, value: Any, nested_failed: bool = False) -> bool:
+        """Returns whether the Matcher or one nested in it has failures recorded, for the Matcher it is nested in."""
+        if nested_failed:
+            self.__dirty = True
+        if self.__mismatch_expected is None:
+            self.__mismatch_expected = mismatch_expected
+        elif self.__mismatch_expected is not mismatch_expected:
             # pytest assert rewrite flips comparison on failure, let's not count that
-            return
-
-        if passed:
-            self.__add_success()
+            return self.__dirty
+
+        if passed:  # the success bookkeeping inlined, it is on the hot path of every evaluation
+            if self.__status is _NOT_RUN:
+                self.__status = _PASSED
+            if self.__status is not _FAILED and self.__dirty:
+                self.__reset_nested_failures()
+                self.__dirty = False
         else:
             self.__add_failure(value)
+        return self.__dirty
 
     def add_nested_call(self, matcher: 'Matcher') -> None:
-        self.__nested_calls.append(matcher)
+        # keyed by identity, so that repeated calls to the same child are only kept once
+        if id(matcher) not in self.__nested_calls:
+            self.__nested_calls[id(matcher)] = matcher
 
     def reset_failures(self) -> None:
-        if self.__status == _MatcherStatus.FAILED:
-            self.__status = _MatcherStatus.NOT_RUN
+        if not self.__dirty:
+            return
+        if self.__status is _FAILED:
+            self.__status = _NOT_RUN
             self.__failed_values = []
+            self.__failure_count = 0
+            _descriptions_changed()
         self.__reset_nested_failures()
+        self.__dirty = False
 
     def __reset_nested_failures(self) -> None:
-        for nested_call in self.__nested_calls:
+        for nested_call in self.__nested_calls.values():
             nested_call._reset_nested_failures()
 
     @property
@@ -90,29 +398,148 @@ class _MatcherState:
     def failed_values(self) -> Tuple[Any, ...]:
         return tuple(self.__failed_values)
 
+    @property
+    def failure_count(self) -> int:
+        return self.__failure_count
+
+    def render_failed_values(self) -> Tuple[Any, ...]:
+        """Replaces the recorded failed values with their textual representations, releasing the values."""
+        max_repr_length = _failure_recording.max_repr_length
+        self.__failed_values = [_rendered(value, max_repr_length) for value in self.__failed_values]
+        return tuple(self.__failed_values)
+
     @property
     def was_already_run(self) -> bool:
-        return self.status != _MatcherStatus.NOT_RUN
+        return self.__status is not _NOT_RUN
 
     def __add_failure(self, value: Any) -> None:
-        self.__status = _MatcherStatus.FAILED
-        self.__failed_values.append(value)
-
-    def __add_success(self) -> None:
-        if not self.was_already_run:
-            self.__status = _MatcherStatus.PASSED
-        if not self.__status == _MatcherStatus.FAILED:
-            self.__reset_nested_failures()
+        self.__status = _FAILED
+        self.__dirty = True
+        self.__failure_count += 1
+        recording = _failure_recording
+        if recording.max_values is None or len(self.__failed_values) < recording.max_values:
+            if recording.storage == FailedValueStorage.REPR:
+                value = _rendered(value, recording.max_repr_length)
+            elif recording.storage == FailedValueStorage.DIGEST:
+                value = _digested(value)
+            self.__failed_values.append(value)
+        _descriptions_changed()
 
 
 class _MatcherContext:
-    def __init__(self, mismatch_expected: bool, nested_call: bool) -> None:
-        self.__mismatch_expected = mismatch_expected
-        self.__nested_call = nested_call
+    __slots__ = ('mismatch_expected', 'nested_call', 'tracked')
 
-    @property
-    def mismatch_expected(self) -> bool:
-        return self.__mismatch_expected
+    mismatch_expected: bool
+    nested_call: bool
+    tracked: bool
+
+    def __init__(self, mismatch_expected: bool, nested_call: bool, tracked: bool = True) -> None:
+        object.__setattr__(self, 'mismatch_expected', mismatch_expected)
+        object.__setattr__(self, 'nested_call', nested_call)
+        object.__setattr__(self, 'tracked', tracked)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f'{self.__class__.__name__} is immutable')
+
+
+_EQ_CONTEXT = _MatcherContext(mismatch_expected=False, nested_call=False)
+_NE_CONTEXT = _MatcherContext(mismatch_expected=True, nested_call=False)
+_NESTED_EQ_CONTEXT = _MatcherContext(mismatch_expected=False, nested_call=True)
+_NESTED_NE_CONTEXT = _MatcherContext(mismatch_expected=True, nested_call=True)
+_UNTRACKED_EQ_CONTEXT = _MatcherContext(mismatch_expected=False, nested_call=False, tracked=False)
+_UNTRACKED_NE_CONTEXT = _MatcherContext(mismatch_expected=True, nested_call=False, tracked=False)
+_UNTRACKED_NESTED_EQ_CONTEXT = _MatcherContext(mismatch_expected=False, nested_call=True, tracked=False)
+_UNTRACKED_NESTED_NE_CONTEXT = _MatcherContext(mismatch_expected=True, nested_call=True, tracked=False)
+
+
+# The Matcher being evaluated in the current thread or task, its context, the failed value it reported
+# and whether a Matcher nested in it has failures recorded, read by nested_match() and report_failed_value().
+# Kept out of the Matchers themselves, so that the same Matchers can be evaluated concurrently.
+_current_evaluation: ContextVar[Optional[List[Any]]] = ContextVar('pychoir_current_evaluation', default=None)
+_NOT_REPORTED = object()
+
+
+class _Evaluation(Enum):
+    TRACKED = 'tracked'
+    """Comparisons update the state of the Matchers."""
+    CHECKED = 'checked'
+    """Comparisons are checked without updating state first and replayed with tracking if they fail."""
+    UNTRACKED = 'untracked'
+    """Comparisons do not update state, used while checking."""
+
+
+_TRACKED = _Evaluation.TRACKED
+_CHECKED = _Evaluation.CHECKED
+_UNTRACKED = _Evaluation.UNTRACKED
+
+_evaluation = ContextVar('pychoir_evaluation', default=_TRACKED)
+
+_adaptive_ordering = ContextVar('pychoir_adaptive_ordering', default=False)
+
+
+def set_fast_evaluation(enabled: bool) -> bool:
+    """Sets whether comparisons against Matchers are evaluated in the fast mode of :func:`Matcher.check`.
+
+    In the fast mode, Matchers do not keep track of their state while evaluating.
+    Only values that fail are evaluated again with tracking, so that the textual representation of
+    the Matchers still shows the failures.
+
+    The setting is stored in a :class:`contextvars.ContextVar`, so it applies to the current thread or asyncio task
+    and the ones started from it afterwards.
+
+    :param enabled: Whether to enable the fast mode.
+    :return: Whether the fast mode was enabled before, for restoring it later.
+
+    Usage:
+      >>> from pychoir import All, GreaterThan, set_fast_evaluation
+      >>> previous = set_fast_evaluation(True)
+      >>> matcher = All(GreaterThan(0))
+      >>> [1, 2, 3] == matcher
+      True
+      >>> [1, -2, 3] == matcher
+      False
+      >>> matcher
+      All(GreaterThan(0)[FAILED for -2])[FAILED for [1, -2, 3]]
+      >>> _ = set_fast_evaluation(previous)
+    """
+    previous = _evaluation.get()
+    _evaluation.set(_CHECKED if enabled else _TRACKED)
+    return previous is _CHECKED
+
+
+def set_adaptive_ordering(enabled: bool) -> bool:
+    """Sets whether :class:`And` and :class:`Or` (and the :code:`&` and :code:`|` operators) evaluate their children
+    in the order that is likely to decide the result soonest, adapting to the values compared.
+
+    Every 16th comparison times the children it evaluates and counts how often they pass.
+    From those samples, cheap children that tend to fail go first in an And, and cheap children that tend to pass
+    go first in an Or. Older samples weigh less, so the order follows changes in the compared values.
+    Like with :func:`optimize`, only the children evaluating values of any type without raising,
+    like :class:`EqualTo` and :class:`IsInstance`, are moved. The others stay behind them in their original order,
+    so that they are still guarded by the children in front of them.
+
+    The order only changes for comparisons that do not keep track of state, like in :func:`Matcher.check`
+    and the fast mode of :func:`set_fast_evaluation`. The failures are recorded, and the children shown,
+    in the order they were passed.
+
+    The setting is stored in a :class:`contextvars.ContextVar`, like the one of :func:`set_fast_evaluation`.
+
+    :param enabled: Whether to adapt the order of evaluation.
+    :return: Whether it was enabled before, for restoring it later.
+
+    Usage:
+      >>> from pychoir import MatchesRegex, Or, set_adaptive_ordering
+      >>> previous = set_adaptive_ordering(True)
+      >>> route = Or(MatchesRegex(r'/users/\\d+$'), MatchesRegex(r'/health$'))
+      >>> all(route.check('/health') for _ in range(1000))
+      True
+      >>> route
+      Or(MatchesRegex(re.compile('/users/\\\\d+$')), MatchesRegex(re.compile('/health$')))
+      >>> _ = set_adaptive_ordering(previous)
+    """
+    previous = _adaptive_ordering.get()
+    _adaptive_ordering.set(enabled)
+    return previous
 
 
 class Matcher(ABC):
@@ -124,12 +551,55 @@ class Matcher(ABC):
 
         For example :class:`_First(Matcher)` (that is created by :class:`First(Transformer)`) uses
         this to make its name :code:`'First'` instead of :code:`'_First'` in its textual representation.
+
+    A NumPy array compared against a Matcher is compared item by item by NumPy, resulting in an array of bools,
+    except against the Matchers of containers (like :class:`All`, :class:`Contains` and :class:`HasLength`)
+    that set :code:`__array_ufunc__ = None` to be compared against the array as a whole.
+
+    The same Matcher can be evaluated concurrently in several threads or asyncio tasks, and each evaluation
+    returns the right result. The failures shown in its textual representation are shared by all the evaluations
+    though, and not kept consistent between concurrent ones: they may be missing some of the failures of evaluations
+    running at the same time, for example those of :code:`!=` comparisons running alongside :code:`==` ones,
+    and the counts of failures may be short. For failure reports to rely on, evaluate the Matcher in one thread
+    or task at a time, or use a Matcher of its own in each.
     """
+    __slots__ = ('__name', '__state', '__fused', '__planners', '__description', '__immutable')
+    #: The relative cost of evaluating the Matcher, for :func:`optimize` to evaluate cheap checks first.
+    #: 1 for simple comparisons like :class:`IsInstance`, up to 20 for going through whole containers.
+    _cost = 10
+    #: Whether the Matcher evaluates values of any type without raising, for :func:`optimize` to move it
+    #: ahead of the others. True for checks like :class:`EqualTo` and :class:`IsInstance`.
+    _total = False
+
     def __init__(self, name: Union[DefaultType, Optional[str]] = Default) -> None:
         super().__init__()
         self.__name = self.__class__.__name__ if name is Default else name
         self.__state = _MatcherState()
-        self.__context: Optional[_MatcherContext] = None
+        self.__fused: Optional[Tuple[Sequence[Matchable], Dict[int, _FusedRun]]] = None
+        self.__planners: Optional[Tuple[Sequence[Matchable], Dict[bool, _Planner]]] = None
+        # the textual representation, with the version of the descriptions and the depth it was rendered for
+        self.__description: Optional[Tuple[int, int, str]] = None
+        self.__immutable: Optional[bool] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the evaluation state is left out, so that the failed values need not be picklable
+        state = dict(getattr(self, '__dict__', {}))
+        state['_Matcher__name'] = self.__name
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for attribute, value in state.items():
+            object.__setattr__(self, attribute, value)
+        self.__state = _MatcherState()
+        self.__fused = None
+        self.__planners = None
+        self.__description = None
+        self.__immutable = None
+
+    @final
+    def _displayed_name(self) -> Optional[str]:
+        """The name the Matcher is shown with, None for the ones shown without one, like those of ``&``."""
+        return self.__name
 
     @final
     def as_(self, type_: Type[T]) -> T:
@@ -151,15 +621,214 @@ class Matcher(ABC):
         :param other: The value being compared.
         :param expect_mismatch: Set to True when expecting a mismatch (for example in :class:`Not`).
         """
-        if self.__context is not None and self.__context.mismatch_expected:
-            expect_mismatch = not expect_mismatch
+        if not isinstance(matcher, Matcher):
+            return bool(matcher == other)
+        # __nested_context inlined, this is the hot path of the Matchers with children
+        evaluation = _current_evaluation.get()
+        if evaluation is not None and evaluation[0] is self:
+            context = evaluation[1]
+            if context.mismatch_expected:
+                expect_mismatch = not expect_mismatch
+            if not context.tracked:
+                return matcher.matches(
+                    other, _UNTRACKED_NESTED_NE_CONTEXT if expect_mismatch else _UNTRACKED_NESTED_EQ_CONTEXT)
+        self.__state.add_nested_call(matcher)
+        return matcher.matches(other, _NESTED_NE_CONTEXT if expect_mismatch else _NESTED_EQ_CONTEXT)
+
+    @final
+    async def nested_match_async(
+        self,
+        matcher: Union['Matcher', Matchable],
+        other: MatchedType,
+        expect_mismatch: bool = False
+    ) -> bool:
+        """Like :func:`nested_match`, but for evaluating Matchables from inside :func:`_matches_async`.
 
+        :param matcher: The value or Matcher to compare against.
+        :param other: The value being compared.
+        :param expect_mismatch: Set to True when expecting a mismatch (for example in :class:`Not`).
+        """
         if isinstance(matcher, Matcher):
-            self.__state.add_nested_call(matcher)
-            return matcher.matches(other, _MatcherContext(mismatch_expected=expect_mismatch, nested_call=True))
+            return await matcher.matches_async(other, self.__nested_context(matcher, expect_mismatch))
         else:
             return bool(matcher == other)
 
+    @final
+    def nested_evaluations(
+        self,
+        matchers: Iterable[Union['Matcher', Matchable]],
+        other: MatchedType,
+        expect_mismatch: bool = False
+    ) -> Iterator[Union[bool, Awaitable[bool]]]:
+        """For evaluating several Matchables concurrently from inside :func:`_matches_async`,
+        with :func:`all_concurrently` or :func:`any_concurrently`.
+
+        Yields the result of each Matchable that awaits nothing, evaluated once it is reached, and an awaitable
+        of :func:`nested_match_async` for the others.
+
+        :param matchers: The values and/or Matchers to compare against.
+        :param other: The value being compared.
+        :param expect_mismatch: Set to True when expecting a mismatch (for example in :class:`Not`).
+        """
+        for matcher in matchers:
+            if isinstance(matcher, Matcher) and matcher._awaits():
+                yield self.nested_match_async(matcher, other, expect_mismatch)
+            else:
+                yield self.nested_match(matcher, other, expect_mismatch)
+
+    @final
+    def nested_match_many(
+        self,
+        matcher: Union['Matcher', Matchable],
+        values: Iterable[MatchedType],
+        expect_mismatch: bool = False
+    ) -> Sequence[bool]:
+        """Like :func:`nested_match`, but for evaluating Matchables against a whole batch of values at once,
+        see :func:`match_many`.
+
+        The failed values are recorded into the nested Matcher together, shown by their indices in the batch.
+
+        :param matcher: The value or Matcher to compare against.
+        :param values: The values being compared.
+        :param expect_mismatch: Set to True when expecting a mismatch (for example in :class:`AreNot`).
+        :return: A list of bools, or a NumPy array of bools when `values` is a NumPy array.
+        """
+        values = _as_sequence(values)
+        if not isinstance(matcher, Matcher):
+            return [bool(matcher == value) for value in values]
+
+        context = self.__nested_context(matcher, expect_mismatch)
+        token = _evaluation.set(_UNTRACKED)
+        try:
+            matched = matcher._matches_many(values)
+        finally:
+            _evaluation.reset(token)
+
+        if context.tracked:
+            failed = _failed_items(values, matched, context.mismatch_expected)
+            if failed is None:
+                matcher.__state.update(True, context.mismatch_expected, values)
+            else:
+                matcher.__state.update(False, context.mismatch_expected, failed)
+        return matched
+
+    @final
+    def nested_match_all(self, matchers: Sequence[Matchable], other: MatchedType) -> bool:
+        """Like :func:`nested_match`, but for evaluating Matchables in order until one of them does not match
+        (for example in :class:`And`).
+
+        See :func:`set_adaptive_ordering` for evaluating them in the order that is likely to finish first.
+
+        :param matchers: The values and/or Matchers to compare against.
+        :param other: The value being compared.
+        """
+        if _adaptive_ordering.get() and not self.__tracked():
+            return self.__match_adaptively(matchers, None, other, for_all=True)
+        return all(self.nested_match(matcher, other) for matcher in matchers)
+
+    @final
+    def nested_match_any(self, matchers: Sequence[Matchable], other: MatchedType) -> bool:
+        """Like :func:`nested_match`, but for evaluating Matchables in order until one of them matches
+        (for example in :class:`Or`).
+
+        Consecutive Matchers that check the start of a string (:class:`StartsWith`, and :class:`MatchesRegex`
+        with an expression anchored to the start) are fused into a single regular expression,
+        so that a compared string is checked once for all of them.
+        The Matchers are recorded as passed or failed as if evaluated one by one.
+        They are not fused while :func:`profile` or :mod:`pychoir.hooks` observe the evaluation of each Matcher.
+        See :func:`set_adaptive_ordering` for evaluating them in the order that is likely to finish first.
+
+        :param matchers: The values and/or Matchers to compare against.
+        :param other: The value being compared.
+        """
+        runs = None
+        if isinstance(other, str) and not _instrumentations:
+            fused = self.__fused
+            if fused is None or fused[0] is not matchers:
+                fused = self.__fused = (matchers, _fused_runs(matchers))
+            runs = fused[1]
+        if _adaptive_ordering.get() and not self.__tracked():
+            return self.__match_adaptively(matchers, runs, other, for_all=False)
+        if runs:
+            return self.__nested_match_fused(matchers, runs, other)
+        return any(self.nested_match(matcher, other) for matcher in matchers)
+
+    @final
+    def __tracked(self) -> bool:
+        evaluation = _current_evaluation.get()
+        return evaluation is None or evaluation[0] is not self or evaluation[1].tracked
+
+    @final
+    def __match_adaptively(
+        self,
+        matchers: Sequence[Matchable],
+        runs: Optional[Dict[int, '_FusedRun']],
+        other: MatchedType,
+        for_all: bool,
+    ) -> bool:
+        planners = self.__planners
+        if planners is None or planners[0] is not matchers:
+            planners = self.__planners = (matchers, {})
+        planner = planners[1].get(bool(runs))
+        if planner is None:
+            planner = planners[1][bool(runs)] = _Planner(_units(matchers, runs), for_all)
+
+        def evaluate(unit: Any) -> bool:
+            if isinstance(unit, _FusedRun):
+                return unit.matched(other) is not None
+            return self.nested_match(unit, other)
+
+        return planner.evaluate(evaluate)
+
+    @final
+    def __nested_match_fused(self, matchers: Sequence[Matchable], runs: Dict[int, '_FusedRun'], other: str) -> bool:
+        index = 0
+        while index < len(matchers):
+            run = runs.get(index)
+            if run is None:
+                if self.nested_match(matchers[index], other):
+                    return True
+                index += 1
+                continue
+
+            matched = run.matched(other)
+            # the ones before the one that matched failed, like they would have one by one
+            tried = run.matchers if matched is None else run.matchers[:matched + 1]
+            for position, matcher in enumerate(tried):
+                context = self.__nested_context(matcher, False)
+                if context.tracked and matcher.__update_state(position == matched, context, other, False):
+                    evaluation = _current_evaluation.get()
+                    if evaluation is not None:
+                        evaluation[3] = True
+            if matched is not None:
+                return True
+            index += len(run.matchers)
+        return False
+
+    @final
+    def report_failed_value(self, value: Any) -> None:
+        """Sets the value to show as failed, if the Matcher fails, instead of the whole value compared.
+
+        To be called from inside :func:`_matches`, for example to only show the failing part of a large value.
+
+        :param value: The value to show as failed.
+        """
+        evaluation = _current_evaluation.get()
+        if evaluation is not None and evaluation[0] is self:
+            evaluation[2] = value
+
+    @final
+    def __nested_context(self, matcher: 'Matcher', expect_mismatch: bool) -> _MatcherContext:
+        evaluation = _current_evaluation.get()
+        context = evaluation[1] if evaluation is not None and evaluation[0] is self else None
+        if context is not None and context.mismatch_expected:
+            expect_mismatch = not expect_mismatch
+
+        if context is not None and not context.tracked:
+            return _UNTRACKED_NESTED_NE_CONTEXT if expect_mismatch else _UNTRACKED_NESTED_EQ_CONTEXT
+        self.__state.add_nested_call(matcher)
+        return _NESTED_NE_CONTEXT if expect_mismatch else _NESTED_EQ_CONTEXT
+
     @abstractmethod
     def _matches(self, other: MatchedType) -> bool:
         """Returns True when Matcher matches, False otherwise.
@@ -170,11 +839,50 @@ class Matcher(ABC):
         """
         ...  # pragma: no cover
 
+    def _matches_many(self, values: Sequence[MatchedType]) -> Sequence[bool]:
+        """Returns for each value whether the Matcher matches it, when evaluated with :func:`match_many`.
+
+        By default calls :func:`_matches` for each value. To be overridden by Matchers that can evaluate
+        a whole batch of values at once. When `values` is a NumPy array, the result can be a NumPy array of bools.
+
+        :param values: The values being compared.
+        """
+        return [self.matches(value, _UNTRACKED_EQ_CONTEXT) for value in values]
+
+    def _fused_pattern(self) -> Optional[str]:
+        """Returns a regular expression matching the start of exactly the strings the Matcher matches, or None.
+
+        Used by :func:`nested_match_any` for checking a string once for several Matchers.
+        To be overridden by Matchers that only compare strings, like :class:`StartsWith`.
+        """
+        return None
+
+    async def _matches_async(self, other: MatchedType) -> bool:
+        """Returns True when Matcher matches, False otherwise, when evaluated with :func:`matches_async`.
+
+        By default calls :func:`_matches`. To be overridden by Matchers that await something,
+        either by themselves or through :func:`nested_match_async` and :func:`nested_evaluations`.
+
+        :param other: The value being compared.
+        """
+        return self._matches(other)
+
+    def _awaits(self) -> bool:
+        """Returns whether evaluating the Matcher with :func:`matches_async` may await something.
+        When not, :func:`_matches` is called instead of :func:`_matches_async`.
+
+        By default, whether the Matcher overrides :func:`_matches_async`. To be overridden by Matchers that
+        only await their children, to check whether any of them awaits.
+        """
+        return type(self)._matches_async is not Matcher._matches_async
+
     @abstractmethod
     def _description(self) -> str:
         """Returns a textual representation of the Matcher's parameters.
 
         For example in :code:`"EqualTo('foo')"` the :code:`'foo'` is returned by :code:`_description()`.
+        Render the values and child Matchers with :func:`described` and :func:`described_all`,
+        so that long ones are elided.
 
         **To be implemented by all Matchers.**
         """
@@ -196,21 +904,145 @@ class Matcher(ABC):
 
     @final
     def matches(self, other: MatchedType, context: _MatcherContext) -> bool:
-        with self.__set_context(context):
+        evaluation: List[Any] = [self, context, _NOT_REPORTED, False]
+        token = _current_evaluation.set(evaluation)
+        try:
             passed = self._matches(other)
+        finally:
+            _current_evaluation.reset(token)
+
+        if context.tracked:  # __update_state inlined, this is the hot path of every evaluation
+            mismatch_expected = context.mismatch_expected
+            if self.__state.update(
+                not passed if mismatch_expected else passed,
+                mismatch_expected,
+                other if evaluation[2] is _NOT_REPORTED else evaluation[2],
+                evaluation[3],
+            ):
+                parent = token.old_value  # the evaluation of the Matcher this one is nested in, if any
+                if type(parent) is list:
+                    parent[3] = True
+        return passed
 
-        reported_passed = passed if not context.mismatch_expected else not passed
-        self.__state.update(reported_passed, context.mismatch_expected, other)
-
+    @final
+    async def matches_async(self, other: MatchedType, context: _MatcherContext) -> bool:
+        evaluation: List[Any] = [self, context, _NOT_REPORTED, False]
+        token = _current_evaluation.set(evaluation)
+        try:
+            passed = await self._matches_async(other) if self._awaits() else self._matches(other)
+        finally:
+            _current_evaluation.reset(token)
+
+        if context.tracked and self.__update_state(
+                passed, context, other if evaluation[2] is _NOT_REPORTED else evaluation[2], evaluation[3]):
+            parent = token.old_value
+            if type(parent) is list:
+                parent[3] = True
         return passed
 
+    @final
+    def __update_state(self, passed: bool, context: _MatcherContext, other: MatchedType, nested_failed: bool) -> bool:
+        mismatch_expected = context.mismatch_expected
+        reported_passed = passed if not mismatch_expected else not passed
+        return self.__state.update(reported_passed, mismatch_expected, other, nested_failed)
+
+    @final
+    def check(self, other: MatchedType) -> bool:
+        """Returns True when the Matcher matches the value, False otherwise, like :code:`==`.
+
+        Evaluates the Matcher without keeping track of its state, which is faster.
+        If the value does not match, it is evaluated again with tracking, so that the textual representation
+        of the Matcher shows the failure.
+        See :func:`set_fast_evaluation` for making all comparisons work like this.
+
+        :param other: The value being compared.
+
+        Usage:
+          >>> from pychoir import GreaterThan
+          >>> GreaterThan(0).check(1)
+          True
+          >>> matcher = GreaterThan(0)
+          >>> matcher.check(-1)
+          False
+          >>> matcher
+          GreaterThan(0)[FAILED for -1]
+        """
+        if _matches_untracked(self, other, _UNTRACKED_EQ_CONTEXT):
+            return True
+        return _matches_tracked(self, other, _EQ_CONTEXT)
+
+    @final
+    def match_many(self, values: Iterable[MatchedType]) -> Sequence[bool]:
+        """Returns for each of the values whether the Matcher matches it.
+
+        Evaluates like :func:`check`, without keeping track of state, but for a whole batch of values at once.
+        Several Matchers evaluate the batch in one go instead of value by value.
+
+        :param values: The values to compare.
+        :return: A list of bools, or a NumPy array of bools when `values` is a NumPy array.
+
+        Usage:
+          >>> from pychoir import GreaterThan
+          >>> GreaterThan(0).match_many([1, 0, -1])
+          [True, False, False]
+        """
+        values = _as_sequence(values)
+        token = _evaluation.set(_UNTRACKED)
+        try:
+            matched = self._matches_many(values)
+        finally:
+            _evaluation.reset(token)
+        if is_ndarray(values) and not is_ndarray(matched):
+            return bool_array(matched, len(values))  # type: ignore[no-any-return]
+        return matched
+
+    @final
+    def first_failure(self, values: Iterable[MatchedType]) -> Optional[int]:
+        """Returns the index of the first of the values the Matcher does not match, or None if it matches them all.
+
+        Evaluates like :func:`match_many`. The failing value is evaluated again with tracking, so that
+        the textual representation of the Matcher shows the failure.
+
+        :param values: The values to compare.
+
+        Usage:
+          >>> from pychoir import GreaterThan
+          >>> matcher = GreaterThan(0)
+          >>> matcher.first_failure([1, 2, 3]) is None
+          True
+          >>> matcher.first_failure([1, 0, -1])
+          1
+          >>> matcher
+          GreaterThan(0)[FAILED for 0]
+        """
+        values = _as_sequence(values)
+        for index, passed in enumerate(self.match_many(values)):
+            if not passed:
+                _matches_tracked(self, values[index], _EQ_CONTEXT)
+                return index
+        return None
+
     @final
     def __eq__(self, other: MatchedType) -> bool:
-        return self.matches(other, _MatcherContext(mismatch_expected=False, nested_call=False))
+        evaluation = _evaluation.get()
+        if evaluation is _TRACKED:
+            return self.matches(other, _EQ_CONTEXT)
+        elif evaluation is _UNTRACKED:
+            return self.matches(other, _UNTRACKED_EQ_CONTEXT)
+        else:
+            return self.check(other)
 
     @final
     def __ne__(self, other: MatchedType) -> bool:
-        return not self.matches(other, _MatcherContext(mismatch_expected=True, nested_call=False))
+        evaluation = _evaluation.get()
+        if evaluation is _TRACKED:
+            return not self.matches(other, _NE_CONTEXT)
+        elif evaluation is _UNTRACKED:
+            return not self.matches(other, _UNTRACKED_NE_CONTEXT)
+        elif not _matches_untracked(self, other, _UNTRACKED_NE_CONTEXT):
+            return True
+        else:
+            return not _matches_tracked(self, other, _NE_CONTEXT)
 
     @final
     def __str__(self) -> str:
@@ -250,24 +1082,223 @@ class Matcher(ABC):
         """
         return _OrOperator(self, other)
 
+    @final
+    def _failed(self) -> bool:
+        """Whether the Matcher has failed, and shows the values it failed for in its textual representation."""
+        return self.__state.status is _FAILED
+
+    @final
+    def _has_immutable_parameters(self) -> bool:
+        """Whether the textual representation of the Matcher can only change with its failures, its parameters
+        (and those of the Matchers in them) being immutable values, so that it can be cached."""
+        # the attributes themselves are not reassigned after the Matcher has been created
+        if self.__immutable is None:
+            self.__immutable = all(
+                _immutable(value) for attribute, value in getattr(self, '__dict__', {}).items()
+                if not attribute.startswith('_')  # derived from the public ones
+            )
+        return self.__immutable
+
     @final
     def __describe(self) -> str:
+        version = _descriptions_version
+        depth = _description_depth.get()
+        max_depth = _description_rendering.max_depth
+        rendered_depth = -1 if max_depth is None else depth  # the same at any depth without a maximum
+        cached = self.__description
+        if cached is not None and cached[0] == version and cached[1] == rendered_depth:
+            return cached[2]
+
+        if max_depth is not None and depth >= max_depth and self.__state.status is not _FAILED:
+            description = '...'
+        else:
+            token = _description_depth.set(depth + 1)
+            try:
+                description = self._description()
+            finally:
+                _description_depth.reset(token)
         if self.__name:
-            return f'{self.__name}({self._description()}){self.__status_string()}'
+            text = f'{self.__name}({description}){self.__status_string()}'
         else:
-            return f'({self._description()}){self.__status_string()}'
+            text = f'({description}){self.__status_string()}'
+        if self._has_immutable_parameters():
+            self.__description = (version, rendered_depth, text)
+        return text
 
     @final
     def __status_string(self) -> str:
-        failed_value = sequence_or_its_only_member(self.__state.failed_values)
-        return f'[FAILED for {failed_value!r}]' if self.__state.status == _MatcherStatus.FAILED else ''
+        if self.__state.status is not _FAILED:
+            return ''
+        failed_values = self.__state.render_failed_values()
+        failed_value = sequence_or_its_only_member(failed_values)
+        if self.__state.failure_count > len(failed_values):
+            return f'[FAILED for {failed_value!r} <first {len(failed_values)} of {self.__state.failure_count:,}>]'
+        return f'[FAILED for {failed_value!r}]'
+
+
+# fewer consecutive Matchers are faster to evaluate one by one
+_MIN_FUSED = 2
+
+
+class _FusedRun:
+    # consecutive Matchers, starting from the key in the dict of runs, fused into one regular expression
+    __slots__ = ('matchers', 'regex')
+
+    def __init__(self, matchers: List[Matcher], regex: 're.Pattern[str]'):
+        self.matchers = matchers
+        self.regex = regex
+
+    def matched(self, other: str) -> Optional[int]:
+        # the position of the first of the Matchers that matches, if any
+        match = self.regex.match(other)
+        if match is None:
+            return None
+        # the outermost group is the last one to close, so it is the lastgroup of a match
+        return int(match.lastgroup[2:])  # type: ignore[index]
+
+
+def _fused_runs(matchers: Sequence[Matchable]) -> Dict[int, _FusedRun]:
+    # only needed for fusing Matchers of strings, not worth the import time otherwise
+    import re
+
+    runs: Dict[int, _FusedRun] = {}
+    fused: List[Matcher] = []
+    patterns: List[str] = []
+    for index, matcher in enumerate(chain(matchers, [None])):
+        pattern = matcher._fused_pattern() if isinstance(matcher, Matcher) else None
+        if isinstance(matcher, Matcher) and pattern is not None:
+            patterns.append(f'(?P<_m{len(fused)}>{pattern})')
+            fused.append(matcher)
+            continue
+        if len(fused) >= _MIN_FUSED:
+            try:
+                runs[index - len(fused)] = _FusedRun(fused, re.compile('|'.join(patterns)))
+            except re.error:
+                pass  # for example the same group name in two of the expressions, evaluated one by one
+        fused = []
+        patterns = []
+    return runs
+
+
+def _units(matchers: Sequence[Matchable], runs: Optional[Dict[int, _FusedRun]]) -> List[Any]:
+    # the children of an And or Or, or the runs of them fused together, that can be evaluated in any order
+    units: List[Any] = []
+    index = 0
+    while index < len(matchers):
+        run = runs.get(index) if runs else None
+        units.append(matchers[index] if run is None else run)
+        index += 1 if run is None else len(run.matchers)
+    return units
+
+
+# of the evaluations, every _SAMPLE_INTERVAL'th times the children it evaluates
+_SAMPLE_INTERVAL = 16
+# after this many samples the children are reordered, and the older samples weigh half as much
+_SAMPLES_PER_PLAN = 16
+
+
+def _movable(unit: Any) -> bool:
+    # whether the unit evaluates any value without raising, so that it can go ahead of the units guarding the others,
+    # like in optimize(): fused runs are only evaluated against strings and bare values are compared with ==
+    return isinstance(unit, _FusedRun) or not isinstance(unit, Matcher) or unit._total
+
+
+class _Planner:
+    # the order to evaluate the children of an And or Or in, adapted to the values seen
+    __slots__ = ('units', 'for_all', 'order', 'positions', 'evaluations', 'samples', 'passed', 'seconds')
+
+    def __init__(self, units: List[Any], for_all: bool):
+        self.units = units
+        self.for_all = for_all
+        self.order = units
+        self.positions = list(range(len(units)))  # of the units in the order
+        self.evaluations = 0
+        self.samples = [0.0] * len(units)
+        self.passed = [0.0] * len(units)
+        self.seconds = [0.0] * len(units)
+
+    def evaluate(self, evaluate: Callable[[Any], bool]) -> bool:
+        self.evaluations += 1
+        if self.evaluations % _SAMPLE_INTERVAL:
+            if self.for_all:
+                return all(evaluate(unit) for unit in self.order)
+            return any(evaluate(unit) for unit in self.order)
+
+        # short-circuiting like the others, so that no child is evaluated that would not have been otherwise
+        result = self.for_all
+        for index in self.positions:
+            start = perf_counter()
+            passed = bool(evaluate(self.units[index]))
+            self.seconds[index] += perf_counter() - start
+            self.passed[index] += passed
+            self.samples[index] += 1
+            if passed is not self.for_all:
+                result = passed
+                break
+        if self.evaluations % (_SAMPLE_INTERVAL * _SAMPLES_PER_PLAN) == 0:
+            self.plan()
+        return result
+
+    def plan(self) -> None:
+        # cheap children likely to decide the result go first: failing ones for And and passing ones for Or,
+        # the ones that may raise stay behind all the others in their original order
+        def rank(index: int) -> float:
+            samples = self.samples[index]
+            if not samples:
+                return float('inf')  # never reached
+            pass_rate = (self.passed[index] + 1) / (samples + 2)
+            deciding_rate = 1 - pass_rate if self.for_all else pass_rate
+            return self.seconds[index] / samples / deciding_rate
+
+        movable = [index for index, unit in enumerate(self.units) if _movable(unit)]
+        fixed = [index for index, unit in enumerate(self.units) if not _movable(unit)]
+        self.positions = sorted(movable, key=rank) + fixed
+        self.order = [self.units[index] for index in self.positions]
+        for statistics in (self.samples, self.passed, self.seconds):
+            statistics[:] = [value / 2 for value in statistics]
+
+
+_MatchesFunction = Callable[[Matcher, Any, _MatcherContext], bool]
+
+# the plain Matcher.matches, and the wrappers of it installed by profile() and pychoir.hooks while they are in use,
+# swapped in as Matcher.matches so that evaluation does not pay for them otherwise
+_plain_matches: _MatchesFunction = Matcher.matches
+_instrumentations: List[Callable[[_MatchesFunction], _MatchesFunction]] = []
+_instrumentation_lock = threading.Lock()
+
+
+def _instrument(instrumentation: Callable[[_MatchesFunction], _MatchesFunction], enabled: bool) -> None:
+    with _instrumentation_lock:
+        if enabled:
+            _instrumentations.append(instrumentation)
+        else:
+            _instrumentations.remove(instrumentation)
+        matches = _plain_matches
+        for wrap in _instrumentations:
+            matches = wrap(matches)
+        setattr(Matcher, 'matches', matches)
+
+
+def _as_sequence(values: Iterable[Any]) -> Sequence[Any]:
+    if isinstance(values, Sequence) or is_ndarray(values):
+        return values  # type: ignore[return-value]
+    return list(values)
 
-    @final
-    @contextmanager
-    def __set_context(self, context: _MatcherContext) -> Iterator[None]:
-        self.__context = context
-        yield
-        self.__context = None
+
+def _matches_untracked(matcher: Matcher, other: MatchedType, context: _MatcherContext) -> bool:
+    token = _evaluation.set(_UNTRACKED)
+    try:
+        return matcher.matches(other, context)
+    finally:
+        _evaluation.reset(token)
+
+
+def _matches_tracked(matcher: Matcher, other: MatchedType, context: _MatcherContext) -> bool:
+    token = _evaluation.set(_TRACKED)
+    try:
+        return matcher.matches(other, context)
+    finally:
+        _evaluation.reset(token)
 
 
 class MatchWrapper:
@@ -295,8 +1326,24 @@ class MatcherWrapper:
         :param matcher: The Matcher to compare `that(value)` with
         :return: a truthy value in case `that(value)` passes the given `matcher`
         """
-        context = _MatcherContext(mismatch_expected=False, nested_call=False)
-        did_match = matcher.matches(self.value, context)
+        did_match = matcher == self.value
+        return MatchWrapper(self.value, matcher, did_match)
+
+    async def matches_async(self, matcher: Matcher) -> MatchWrapper:
+        """Like :func:`matches`, but awaits what the `matcher` needs to await, for example coroutine functions
+        passed to :class:`WhenPassedTo`.
+
+        :param matcher: The Matcher to compare `that(value)` with
+        :return: a truthy value in case `that(value)` passes the given `matcher`
+
+        Usage:
+          >>> import asyncio
+          >>> from pychoir import that, WhenPassedTo
+          >>> async def double(x):
+          ...     return 2 * x
+          >>> assert asyncio.run(that(3).matches_async(WhenPassedTo(double).returns(6)))
+        """
+        did_match = await matcher.matches_async(self.value, _EQ_CONTEXT)
         return MatchWrapper(self.value, matcher, did_match)
 
 
@@ -335,10 +1382,16 @@ class _AndOperator(Matcher):
         self.matchers = matchers
 
     def _matches(self, other: Any) -> bool:
-        return all(self.nested_match(matcher, other) for matcher in self.matchers)
+        return self.nested_match_all(self.matchers, other)
+
+    async def _matches_async(self, other: Any) -> bool:
+        return await all_concurrently(self.nested_evaluations(self.matchers, other))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
 
     def _description(self) -> str:
-        return ' & '.join(map(repr, self.matchers))
+        return described_all(self.matchers, ' & ')
 
     def __and__(self, other: Matchable) -> Matcher:
         if isinstance(other, _AndOperator):
@@ -353,10 +1406,16 @@ class _OrOperator(Matcher):
         self.matchers = matchers
 
     def _matches(self, other: Any) -> bool:
-        return any(self.nested_match(matcher, other) for matcher in self.matchers)
+        return self.nested_match_any(self.matchers, other)
+
+    async def _matches_async(self, other: Any) -> bool:
+        return await any_concurrently(self.nested_evaluations(self.matchers, other))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
 
     def _description(self) -> str:
-        return ' | '.join(map(repr, self.matchers))
+        return described_all(self.matchers, ' | ')
 
     def __or__(self, other: Matchable) -> Matcher:
         if isinstance(other, _OrOperator):
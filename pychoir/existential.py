@@ -1,6 +1,7 @@
 from typing import Any, Iterable
 
-from pychoir.core import Matchable, Matcher
+from pychoir.core import Matchable, Matcher, described, described_all
+from pychoir.utils import ValueIndex, imported_numpy, is_ndarray_vector
 
 
 class Anything(Matcher):
@@ -15,6 +16,9 @@ class Anything(Matcher):
       >>> {'b': 1} == {'a': Anything()}
       False
     """
+    _cost = 0
+    _total = True
+
     def _matches(self, _: Any) -> bool:
         return True
 
@@ -36,6 +40,9 @@ class Is(Matcher):
       >>> [] == Is([])
       False
     """
+    _cost = 1
+    _total = True
+
     def __init__(self, value: Any):
         super().__init__()
         self.value = value
@@ -44,7 +51,7 @@ class Is(Matcher):
         return other is self.value
 
     def _description(self) -> str:
-        return repr(self.value)
+        return described(self.value)
 
 
 class IsNoneOr(Matcher):
@@ -63,6 +70,8 @@ class IsNoneOr(Matcher):
       >>> 4 == IsNoneOr(5)
       False
     """
+    _cost = 2
+
     def __init__(self, *matchers: Matchable):
         super().__init__()
         self.matchers = matchers
@@ -71,7 +80,7 @@ class IsNoneOr(Matcher):
         return other is None or any(self.nested_match(matcher, other) for matcher in self.matchers)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 Optionally = IsNoneOr
@@ -89,6 +98,9 @@ class IsTruthy(Matcher):
       >>> 5 == IsTruthy()
       True
     """
+    _cost = 1
+    _total = True
+
     def _matches(self, other: Any) -> bool:
         return bool(other)
 
@@ -108,6 +120,9 @@ class IsFalsy(Matcher):
       >>> 5 == IsFalsy()
       False
     """
+    _cost = 1
+    _total = True
+
     def _matches(self, other: Any) -> bool:
         return not bool(other)
 
@@ -118,6 +133,9 @@ class IsFalsy(Matcher):
 class In(Matcher):
     """A Matcher checking that the compared value is in the passed iterable.
 
+    The items of a list or tuple are indexed when the Matcher is created,
+    so that hashable values are looked up from a set instead of being searched for.
+
     Usage:
       >>> from string import ascii_lowercase
       >>> from pychoir import In
@@ -126,15 +144,30 @@ class In(Matcher):
       >>> 'A' == In(ascii_lowercase)
       False
     """
+    _cost = 3
+
     def __init__(self, allowed_values: Iterable[Any]):
         super().__init__()
         self.allowed_values = allowed_values
+        self._allowed: Any = (
+            ValueIndex(allowed_values) if isinstance(allowed_values, (list, tuple)) else allowed_values)
+        # only an index of bare values takes values of any type, `in` a str or a set raises for some
+        self._total = isinstance(self._allowed, ValueIndex) and not any(
+            isinstance(value, Matcher) for value in self._allowed.values)
 
     def _matches(self, other: Any) -> bool:
-        return other in self.allowed_values
+        return other in self._allowed
+
+    def _matches_many(self, values: Any) -> Any:
+        allowed_values = self.allowed_values
+        if (is_ndarray_vector(values) and isinstance(allowed_values, (set, frozenset, list, tuple, range))
+                and not any(isinstance(value, Matcher) for value in allowed_values)):
+            return imported_numpy().isin(values, list(allowed_values))
+        allowed = self._allowed
+        return [value in allowed for value in values]
 
     def _description(self) -> str:
-        return repr(self.allowed_values)
+        return described(self.allowed_values)
 
 
 OneOf = In
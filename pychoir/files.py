@@ -0,0 +1,56 @@
+import mmap
+import os
+from typing import Union
+
+from pychoir.core import Matchable, MatchWrapper
+
+
+class _MappedFile(mmap.mmap):
+    # shown in failures by the file it maps
+    path: str
+
+    def __repr__(self) -> str:
+        return f'<contents of {self.path!r}>'
+
+
+class FileContents:
+    """A helper for matching the contents of a (large) file without reading it into memory.
+
+    The file is memory-mapped and the mapping passed to the Matcher as an :class:`mmap.mmap` object,
+    so that for example :class:`StartsWith` and :class:`EndsWith` only read the pages they need.
+    Empty files are passed as :code:`b''`, as they cannot be memory-mapped.
+
+    :param path: The path of the file.
+
+    Usage:
+      >>> import tempfile
+      >>> from pychoir import Contains, FileContents, MatchesRegex, StartsWith
+      >>> with tempfile.NamedTemporaryFile(suffix='.log') as log:
+      ...     _ = log.write(b'INFO started\\nERROR 42 failed\\n')
+      ...     log.flush()
+      ...     assert FileContents(log.name)(StartsWith(b'INFO'))
+      ...     assert FileContents(log.name)(MatchesRegex(r'ERROR \\d+'))
+      ...     assert not FileContents(log.name)(Contains(b'WARNING'))
+    """
+    def __init__(self, path: Union[str, 'os.PathLike[str]']):
+        self.path = path
+
+    def __call__(self, matcher: Matchable) -> MatchWrapper:
+        return self.matches(matcher)
+
+    def matches(self, matcher: Matchable) -> MatchWrapper:
+        """
+        :param matcher: The Matcher to compare the contents of the file with
+        :return: a truthy value in case the contents pass the given `matcher`
+        """
+        with open(self.path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                did_match = bool(matcher == b'')
+            else:
+                with _MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+                    contents.path = os.fspath(self.path)
+                    did_match = bool(matcher == contents)
+        return MatchWrapper(self, matcher, did_match)  # type: ignore[arg-type]
+
+    def __repr__(self) -> str:
+        return f'FileContents({os.fspath(self.path)!r})'
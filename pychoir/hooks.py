@@ -0,0 +1,219 @@
+"""
+Observing the evaluation of Matchers in production, through sampled events
+"""
+import atexit
+import random
+import threading
+from collections import deque
+from contextvars import ContextVar
+from time import perf_counter, sleep
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from pychoir.core import (
+    MatchedType,
+    Matcher,
+    _AndOperator,
+    _instrument,
+    _MatcherContext,
+    _MatchesFunction,
+    _OrOperator,
+)
+
+# how many events are kept for the drain thread, the oldest ones are dropped when it falls behind
+BUFFER_SIZE = 65_536
+# how often the drain thread passes the buffered events to the callbacks, in seconds
+DRAIN_INTERVAL = 0.1
+
+
+class MatchEvent(NamedTuple):
+    """An evaluation of a Matcher, passed to the callbacks registered with :func:`on_match`."""
+    path: Tuple[str, ...]
+    """The names of the Matchers from the one compared against down to this one, as they are displayed,
+    And and Or for the ones made with ``&`` and ``|``."""
+    matcher: Matcher
+    passed: Optional[bool]
+    """Whether the Matcher matched, None if it raised an exception."""
+    duration: float
+    """The seconds spent evaluating the Matcher, including its children."""
+    value_type: Type[Any]
+    """The type of the compared value."""
+
+
+class Hook:
+    """A callback registered with :func:`on_match`.
+
+    :ivar callback: The callable receiving the events.
+    :ivar sample_rate: The fraction of the evaluations that are passed to the callback.
+    """
+    def __init__(self, callback: Callable[[MatchEvent], Any], sample_rate: float):
+        self.callback = callback
+        self.sample_rate = sample_rate
+
+    def remove(self) -> None:
+        """Stops passing events to the callback. The events already buffered are still passed."""
+        with _lock:
+            if self in _hooks:
+                _hooks.remove(self)
+                if not _hooks:
+                    _instrument(_hooking, False)
+
+    def __repr__(self) -> str:
+        return f'Hook({self.callback!r}, sample_rate={self.sample_rate!r})'
+
+
+def on_match(callback: Callable[[MatchEvent], Any], sample_rate: float = 1.0) -> Hook:
+    """Registers a callback receiving a :class:`MatchEvent` for each evaluation of a Matcher
+    (through :func:`Matcher.matches`), for example for collecting failure rates and latencies per Matcher.
+
+    Whole comparisons are sampled: when a value compared against a Matcher is sampled, the events of the Matcher
+    and all the Matchers evaluated by it are recorded. The events are buffered and passed to the callbacks by
+    a background thread, so that slow callbacks do not slow down the evaluation.
+    While no callbacks are registered, the evaluation of Matchers is not slowed down at all.
+
+    :param callback: Called with each event, from the background thread.
+    :param sample_rate: The fraction of the comparisons to record, for example 0.001 for one in a thousand.
+    :return: A :class:`Hook`, for removing the callback.
+
+    Usage:
+      >>> from pychoir import GreaterThan, IsInstance
+      >>> from pychoir import hooks
+      >>> events = []
+      >>> hook = hooks.on_match(events.append)
+      >>> 5 == IsInstance(int) & GreaterThan(10)
+      False
+      >>> hooks.flush()
+      >>> [(event.path, event.passed, event.value_type) for event in events]  # doctest: +NORMALIZE_WHITESPACE
+      [(('And', 'IsInstance'), True, <class 'int'>),
+       (('And', 'GreaterThan'), False, <class 'int'>),
+       (('And',), False, <class 'int'>)]
+      >>> hook.remove()
+    """
+    if not 0 <= sample_rate <= 1:
+        raise ValueError(f'sample_rate must be between 0 and 1, got {sample_rate!r}')
+    hook = Hook(callback, sample_rate)
+    with _lock:
+        _start_draining()
+        if not _hooks:
+            _instrument(_hooking, True)
+        _hooks.append(hook)
+    return hook
+
+
+def disable(matcher: Matcher) -> None:
+    """Stops recording events for the Matcher and the Matchers evaluated by it.
+
+    :param matcher: The Matcher, for example a noisy or very often evaluated part of a larger one.
+    """
+    _disabled[id(matcher)] = matcher
+
+
+def enable(matcher: Matcher) -> None:
+    """Records events for a Matcher disabled with :func:`disable` again.
+
+    :param matcher: The Matcher.
+    """
+    _disabled.pop(id(matcher), None)
+
+
+def flush() -> None:
+    """Passes the buffered events to the callbacks now, in the calling thread."""
+    with _draining:
+        while _buffer:
+            hooks, event = _buffer.popleft()
+            for hook in hooks:
+                try:
+                    hook.callback(event)
+                except Exception:
+                    pass  # a failing sink must not stop the others
+
+
+def dropped() -> int:
+    """Returns how many events have been dropped because the buffer was full."""
+    return _dropped[0]
+
+
+_hooks: List[Hook] = []
+_lock = threading.Lock()
+# by id, as Matchers are not hashable, kept alive so that the ids are not reused
+_disabled: Dict[int, Matcher] = {}
+
+# a deque is safe for appending and popping from different threads without locking
+_buffer: Deque[Tuple[Tuple[Hook, ...], MatchEvent]] = deque(maxlen=BUFFER_SIZE)
+_dropped = [0]
+_draining = threading.Lock()
+_drain_thread: List[threading.Thread] = []
+
+# the hooks sampling the comparison being evaluated and the path to the current Matcher, None when not sampled
+_sampled: ContextVar[Optional[Tuple[Tuple[Hook, ...], Tuple[str, ...]]]] = ContextVar(
+    'pychoir_sampled_hooks', default=None)
+
+
+def _start_draining() -> None:
+    if _drain_thread:
+        return
+    thread = threading.Thread(target=_drain, name='pychoir-hooks', daemon=True)
+    _drain_thread.append(thread)
+    thread.start()
+    atexit.register(flush)
+
+
+def _drain() -> None:
+    while True:
+        sleep(DRAIN_INTERVAL)
+        flush()
+
+
+def _hooking(matches: _MatchesFunction) -> _MatchesFunction:
+    def hooked_matches(self: Matcher, other: MatchedType, context: _MatcherContext) -> bool:
+        sampled = _sampled.get()
+        if sampled is None:
+            if context.nested_call:  # in a comparison that is not sampled
+                return matches(self, other, context)
+            hooks = _sampling_hooks()
+            if not hooks:
+                return matches(self, other, context)
+            sampled = (hooks, ())
+        if id(self) in _disabled:
+            token = _sampled.set(None)
+            try:
+                return matches(self, other, context)
+            finally:
+                _sampled.reset(token)
+        return _recorded(matches, self, other, context, sampled[0], sampled[1] + (_name(self),))
+
+    return hooked_matches
+
+
+def _sampling_hooks() -> Tuple[Hook, ...]:
+    draw = random.random()
+    return tuple(hook for hook in _hooks if draw < hook.sample_rate)
+
+
+def _recorded(
+    matches: _MatchesFunction,
+    matcher: Matcher,
+    other: MatchedType,
+    context: _MatcherContext,
+    hooks: Tuple[Hook, ...],
+    path: Tuple[str, ...],
+) -> bool:
+    token = _sampled.set((hooks, path))
+    passed = None
+    start = perf_counter()
+    try:
+        passed = matches(matcher, other, context)
+        return passed
+    finally:
+        duration = perf_counter() - start
+        _sampled.reset(token)
+        if len(_buffer) == BUFFER_SIZE:
+            _dropped[0] += 1
+        _buffer.append((hooks, MatchEvent(path, matcher, passed, duration, type(other))))
+
+
+# the names of the Matchers shown without one, after the operators they are made with
+_OPERATOR_NAMES: Dict[Type[Matcher], str] = {_AndOperator: 'And', _OrOperator: 'Or'}
+
+
+def _name(matcher: Matcher) -> str:
+    return matcher._displayed_name() or _OPERATOR_NAMES.get(type(matcher), type(matcher).__name__)
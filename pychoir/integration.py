@@ -1,7 +1,7 @@
 import sys
 from typing import Any, TypeVar
 
-from pychoir.core import Matcher
+from pychoir.core import Matcher, described_all
 
 T = TypeVar('T', contravariant=True)
 
@@ -26,7 +26,7 @@ class Matches(Matcher):
         return any(matcher.matches(other) for matcher in self.matchers)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 M = Matches
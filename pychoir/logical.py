@@ -1,6 +1,7 @@
 from typing import Any, Callable
 
-from pychoir.core import Matchable, Matcher
+from pychoir.core import Matchable, Matcher, _any_awaits, described_all
+from pychoir.utils import all_concurrently, any_concurrently
 
 
 class And(Matcher):
@@ -24,10 +25,16 @@ class And(Matcher):
         self.matchers = matchers
 
     def _matches(self, other: Any) -> bool:
-        return all(self.nested_match(matcher, other) for matcher in self.matchers)
+        return self.nested_match_all(self.matchers, other)
+
+    async def _matches_async(self, other: Any) -> bool:
+        return await all_concurrently(self.nested_evaluations(self.matchers, other))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 AllOf = And
@@ -38,6 +45,9 @@ class Or(Matcher):
 
     Consider using the :code:`|` operator (:func:`Matcher.__or__`) instead: :code:`StartsWith('a') | StartsWith('b')`.
 
+    Consecutive :class:`StartsWith` Matchers, and :class:`MatchesRegex` Matchers anchored to the start of the string,
+    are fused into a single regular expression, so that each compared string is checked once for all of them.
+
     :param matchers: The value(s) and/or matcher(s) to compare against.
 
     Usage:
@@ -54,10 +64,16 @@ class Or(Matcher):
         self.matchers = matchers
 
     def _matches(self, other: Any) -> bool:
-        return any(self.nested_match(matcher, other) for matcher in self.matchers)
+        return self.nested_match_any(self.matchers, other)
+
+    async def _matches_async(self, other: Any) -> bool:
+        return await any_concurrently(self.nested_evaluations(self.matchers, other))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 AnyOf = Or
@@ -84,8 +100,14 @@ class Not(Matcher):
     def _matches(self, other: Any) -> bool:
         return not any(self.nested_match(matcher, other, expect_mismatch=True) for matcher in self.matchers)
 
+    async def _matches_async(self, other: Any) -> bool:
+        return not await any_concurrently(self.nested_evaluations(self.matchers, other, expect_mismatch=True))
+
+    def _awaits(self) -> bool:
+        return _any_awaits(self.matchers)
+
     def _description(self) -> str:
-        return ', '.join(map(repr, self.matchers))
+        return described_all(self.matchers)
 
 
 IsNoneOf = Not
@@ -103,6 +125,8 @@ class ResultsTrueFor(Matcher):
       >>> 'abc' == ResultsTrueFor(lambda x: x[2] == 'c')
       True
     """
+    _cost = 10
+
     def __init__(self, *conditions: Callable[[Any], bool]):
         super().__init__()
         self.conditions = conditions
@@ -111,4 +135,4 @@ class ResultsTrueFor(Matcher):
         return all(condition(other) for condition in self.conditions)
 
     def _description(self) -> str:
-        return ', '.join(map(repr, self.conditions))
+        return described_all(self.conditions)
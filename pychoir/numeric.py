@@ -1,6 +1,7 @@
 from typing import Any
 
 from pychoir import Matcher
+from pychoir.utils import is_ndarray_vector
 
 
 class IsOdd(Matcher):
@@ -13,9 +14,16 @@ class IsOdd(Matcher):
       >>> 4 == IsOdd()
       False
     """
+    _cost = 1
+
     def _matches(self, other: Any) -> bool:
         return bool(other % 2 == 1)
 
+    def _matches_many(self, values: Any) -> Any:
+        if is_ndarray_vector(values):
+            return values % 2 == 1
+        return [bool(other % 2 == 1) for other in values]
+
     def _description(self) -> str:
         return ''
 
@@ -30,9 +38,16 @@ class IsEven(Matcher):
       >>> 5 == IsEven()
       False
     """
+    _cost = 1
+
     def _matches(self, other: Any) -> bool:
         return bool(other % 2 == 0)
 
+    def _matches_many(self, values: Any) -> Any:
+        if is_ndarray_vector(values):
+            return values % 2 == 0
+        return [bool(other % 2 == 0) for other in values]
+
     def _description(self) -> str:
         return ''
 
@@ -47,9 +62,16 @@ class IsPositive(Matcher):
       >>> 0 == IsPositive()
       False
     """
+    _cost = 1
+
     def _matches(self, other: Any) -> bool:
         return bool(other > 0)
 
+    def _matches_many(self, values: Any) -> Any:
+        if is_ndarray_vector(values):
+            return values > 0
+        return [bool(other > 0) for other in values]
+
     def _description(self) -> str:
         return ''
 
@@ -66,9 +88,16 @@ class IsNonNegative(Matcher):
       >>> -1 == IsNonNegative()
       False
     """
+    _cost = 1
+
     def _matches(self, other: Any) -> bool:
         return bool(other >= 0)
 
+    def _matches_many(self, values: Any) -> Any:
+        if is_ndarray_vector(values):
+            return values >= 0
+        return [bool(other >= 0) for other in values]
+
     def _description(self) -> str:
         return ''
 
@@ -83,8 +112,15 @@ class IsNegative(Matcher):
       >>> 0 == IsNegative()
       False
     """
+    _cost = 1
+
     def _matches(self, other: Any) -> bool:
         return bool(other < 0)
 
+    def _matches_many(self, values: Any) -> Any:
+        if is_ndarray_vector(values):
+            return values < 0
+        return [bool(other < 0) for other in values]
+
     def _description(self) -> str:
         return ''
@@ -0,0 +1,140 @@
+"""
+Rewriting Matcher trees into equivalent ones that are faster to evaluate
+"""
+from typing import Any, Dict, List, Tuple, Type, Union
+
+from pychoir.core import Matchable, Matcher, _AndOperator, _OrOperator
+from pychoir.existential import Anything
+from pychoir.logical import And, Not, Or
+from pychoir.types import IsInstance
+
+_ALL_OF = (And, _AndOperator)
+_ANY_OF = (Or, _OrOperator)
+
+
+def optimize(matcher: Matchable) -> Matchable:
+    """Rewrites the :class:`And`, :class:`Or` and :class:`Not` Matchers of a tree (including those created with
+    the :code:`&` and :code:`|` operators) into an equivalent tree that is faster to evaluate.
+
+    - nested And and Or Matchers are flattened into their parents,
+    - :class:`Anything` is dropped from And, and makes an Or match anything,
+    - duplicate children (of the same type, with equal parameters) are removed,
+    - :class:`IsInstance` children of an Or are merged into one,
+    - the checks that evaluate values of any type without raising (like :class:`EqualTo` and
+      :class:`IsInstance`) are moved first, cheap ones first. The other children keep their order
+      and stay behind the children before them, which may be guarding them against values they would raise for.
+      So the optimized tree can return a result where the original would raise, but not the other way round.
+
+    The original Matchers are left as they are, use the returned tree instead.
+    The failures are shown in the returned tree, in its order. Also see :func:`compile`.
+
+    :param matcher: The Matcher (or value) to optimize.
+    :return: The optimized Matcher, or the value itself when there is nothing to optimize.
+
+    Usage:
+      >>> from pychoir import Anything, InAnyOrder, IsInstance, HasLength, optimize
+      >>> optimize(InAnyOrder([1, 2]) & (Anything() & HasLength(2)) & IsInstance(list))
+      (IsInstance(list) & InAnyOrder([1, 2]) & HasLength(2))
+      >>> optimize(IsInstance(int) | IsInstance(float) | 'inf')
+      (IsInstance(int, float) | 'inf')
+    """
+    if isinstance(matcher, _ALL_OF):
+        return _optimized_all_of(matcher)
+    if isinstance(matcher, _ANY_OF):
+        return _optimized_any_of(matcher)
+    if isinstance(matcher, Not):
+        return Not(*_by_cost(_deduplicated([optimize(child) for child in matcher.matchers])))
+    return matcher
+
+
+def _optimized_all_of(matcher: Union[And, _AndOperator]) -> Matchable:
+    children = [child for child in _flattened(matcher, _ALL_OF) if type(child) is not Anything]
+    children = _by_cost(_deduplicated(children))
+    if not children:
+        return Anything()
+    return children[0] if len(children) == 1 else type(matcher)(*children)
+
+
+def _optimized_any_of(matcher: Union[Or, _OrOperator]) -> Matchable:
+    children = _flattened(matcher, _ANY_OF)
+    if any(type(child) is Anything for child in children):
+        return Anything()
+    children = _by_cost(_deduplicated(_merged_types(children)))
+    return children[0] if len(children) == 1 else type(matcher)(*children)
+
+
+def _flattened(matcher: Matcher, types: Tuple[Type[Matcher], ...]) -> List[Matchable]:
+    children: List[Matchable] = []
+    for child in matcher.matchers:  # type: ignore[attr-defined]
+        child = optimize(child)
+        if isinstance(child, types):
+            children.extend(child.matchers)  # type: ignore[attr-defined]
+        else:
+            children.append(child)
+    return children
+
+
+def _deduplicated(children: List[Matchable]) -> List[Matchable]:
+    unique: List[Matchable] = []
+    for child in children:
+        if not any(_same(child, kept) for kept in unique):
+            unique.append(child)
+    return unique
+
+
+def _same(left: Any, right: Any) -> bool:
+    # compares the parameters of Matchers without evaluating any of them, values only when they are of the same type
+    if left is right:
+        return True
+    if type(left) is not type(right):
+        return False
+    if isinstance(left, Matcher):
+        return _same(_parameters(left), _parameters(right))
+    if isinstance(left, (list, tuple)):
+        return len(left) == len(right) and all(map(_same, left, right))
+    if isinstance(left, dict):
+        return left.keys() == right.keys() and all(_same(value, right[key]) for key, value in left.items())
+    try:
+        return (left == right) is True
+    except Exception:
+        return False
+
+
+def _parameters(matcher: Matcher) -> Dict[str, Any]:
+    # the private attributes are derived from the public ones (or are evaluation state)
+    return {
+        attribute: value for attribute, value in matcher.__getstate__().items()
+        if not attribute.startswith('_') or attribute == '_Matcher__name'
+    }
+
+
+def _merged_types(children: List[Matchable]) -> List[Matchable]:
+    type_checks = [child for child in children if type(child) is IsInstance]
+    if len(type_checks) < 2:
+        return children
+    merged = IsInstance(*dict.fromkeys(type_ for check in type_checks for type_ in check.types))
+    first = next(index for index, child in enumerate(children) if child is type_checks[0])
+    return [merged if index == first else child
+            for index, child in enumerate(children) if type(child) is not IsInstance or index == first]
+
+
+def _by_cost(children: List[Matchable]) -> List[Matchable]:
+    # the children that may raise keep their order behind all the children before them
+    total = [child for child in children if _is_total(child)]
+    return sorted(total, key=_cost) + [child for child in children if not _is_total(child)]
+
+
+def _is_total(matcher: Any) -> bool:
+    if isinstance(matcher, _ALL_OF + _ANY_OF + (Not,)):
+        return all(map(_is_total, matcher.matchers))
+    if isinstance(matcher, Matcher):
+        return matcher._total
+    return True  # compared with ==
+
+
+def _cost(matcher: Any) -> int:
+    if isinstance(matcher, _ALL_OF + _ANY_OF + (Not,)):
+        return sum(map(_cost, matcher.matchers))
+    if isinstance(matcher, Matcher):
+        return matcher._cost
+    return 1  # compared with ==
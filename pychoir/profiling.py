@@ -0,0 +1,224 @@
+"""
+Measuring where the time goes when evaluating Matchers
+"""
+import json
+import marshal
+import os
+import pstats
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from pychoir.core import (
+    MatchedType,
+    Matcher,
+    _instrument,
+    _MatcherContext,
+    _MatchesFunction,
+)
+
+_active_profile: ContextVar[Optional['Profile']] = ContextVar('pychoir_active_profile', default=None)
+_current_node: ContextVar[Optional['ProfiledNode']] = ContextVar('pychoir_profiled_node', default=None)
+
+# Matcher.matches is only instrumented while a profile is active
+_lock = threading.Lock()
+_active_count = 0
+
+_PstatsKey = Tuple[str, int, str]
+
+
+class ProfiledNode:
+    """The measurements of one Matcher evaluated under a :class:`Profile`, under the Matcher that evaluated it.
+
+    :ivar matcher: The Matcher.
+    :ivar calls: How many times the Matcher was evaluated.
+    :ivar passed: How many of the evaluations matched.
+    :ivar failed: How many of the evaluations did not match. The rest raised an exception.
+    :ivar cumulative_time: The seconds spent evaluating the Matcher, including its children.
+    :ivar children: The nodes of the Matchers evaluated by this one, in the order first evaluated.
+    """
+    __slots__ = ('matcher', 'calls', 'passed', 'failed', 'cumulative_time', '_children')
+
+    def __init__(self, matcher: Matcher):
+        self.matcher = matcher
+        self.calls = 0
+        self.passed = 0
+        self.failed = 0
+        self.cumulative_time = 0.0
+        self._children: Dict[int, ProfiledNode] = {}
+
+    @property
+    def children(self) -> List['ProfiledNode']:
+        return list(self._children.values())
+
+    @property
+    def self_time(self) -> float:
+        """The seconds spent evaluating the Matcher, excluding its children."""
+        return max(0.0, self.cumulative_time - sum(child.cumulative_time for child in self._children.values()))
+
+    @property
+    def label(self) -> str:
+        """The textual representation of the Matcher, with those of its children left out."""
+        if not self._children:
+            return repr(self.matcher)
+        return f'{repr(self.matcher).partition("(")[0]}(...)'
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'matcher': self.label,
+            'calls': self.calls,
+            'passed': self.passed,
+            'failed': self.failed,
+            'self_time': self.self_time,
+            'cumulative_time': self.cumulative_time,
+            'children': [child.to_dict() for child in self._children.values()],
+        }
+
+
+class Profile:
+    """The measurements of the Matchers evaluated inside :func:`profile`, as a tree of :class:`ProfiledNode` s
+    mirroring the Matcher trees.
+
+    :ivar roots: The nodes of the Matchers compared against directly, in the order first evaluated.
+    """
+    def __init__(self) -> None:
+        self._roots: Dict[int, ProfiledNode] = {}
+
+    @property
+    def roots(self) -> List[ProfiledNode]:
+        return list(self._roots.values())
+
+    def report(self) -> str:
+        """Returns the measurements as a table, the Matchers indented under the Matchers that evaluated them."""
+        lines = [f'{"calls":>10} {"passed":>10} {"failed":>10} {"self (s)":>10} {"total (s)":>10}  matcher']
+        for root in self._roots.values():
+            self._report(root, 0, lines)
+        return '\n'.join(lines)
+
+    def to_json(self, **kwargs: Any) -> str:
+        """Returns the measurements as JSON, a list of the root nodes with their children nested.
+
+        :param kwargs: Passed to :func:`json.dumps`, for example :code:`indent=2`.
+        """
+        return json.dumps([root.to_dict() for root in self._roots.values()], **kwargs)
+
+    def stats(self) -> pstats.Stats:
+        """Returns the measurements as :class:`pstats.Stats`, for sorting and printing them like
+        those of :mod:`cProfile`. Each Matcher is shown as a function, its label as the function name.
+        """
+        return pstats.Stats(_PstatsExport(self._pstats()))  # type: ignore[arg-type]
+
+    def dump_stats(self, path: Union[str, 'os.PathLike[str]']) -> None:
+        """Writes the measurements to a file in the format of :func:`cProfile.Profile.dump_stats`,
+        for example for :code:`python -m pstats` or a visualizer like SnakeViz.
+
+        :param path: The path of the file to write.
+        """
+        with open(path, 'wb') as file:
+            marshal.dump(self._pstats(), file)
+
+    def _report(self, node: ProfiledNode, depth: int, lines: List[str]) -> None:
+        lines.append(f'{node.calls:>10,} {node.passed:>10,} {node.failed:>10,} '
+                     f'{node.self_time:>10.6f} {node.cumulative_time:>10.6f}  {"  " * depth}{node.label}')
+        for child in node._children.values():
+            self._report(child, depth + 1, lines)
+
+    def _pstats(self) -> Dict[_PstatsKey, Any]:
+        stats: Dict[_PstatsKey, Any] = {}
+
+        def add(node: ProfiledNode, caller: Optional[_PstatsKey]) -> None:
+            key = (sys.modules[type(node.matcher).__module__].__file__ or '', len(stats) + 1, node.label)
+            callers = {} if caller is None else {
+                caller: (node.calls, node.calls, node.self_time, node.cumulative_time),
+            }
+            stats[key] = (node.calls, node.calls, node.self_time, node.cumulative_time, callers)
+            for child in node._children.values():
+                add(child, key)
+
+        for root in self._roots.values():
+            add(root, None)
+        return stats
+
+
+class _PstatsExport:
+    # what pstats.Stats() loads statistics from, like cProfile.Profile
+    def __init__(self, stats: Dict[_PstatsKey, Any]):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Measures the Matchers evaluated inside the context (through :func:`Matcher.matches`), in the current
+    thread or asyncio task and the ones started from it.
+
+    For each Matcher, the calls, how many of them passed and failed, and the time spent in the Matcher itself and
+    including its children are recorded. Outside of profiling, the evaluation of Matchers is not slowed down,
+    as the profiling is swapped in for the duration of the context only.
+
+    With pytest, the :code:`--pychoir-profile` option profiles the whole test session and shows the report at
+    the end, and :code:`--pychoir-profile-json=PATH` writes it as JSON.
+
+    :return: A :class:`Profile`, filled in as the Matchers are evaluated.
+
+    Usage:
+      >>> from pychoir import And, GreaterThan, IsInstance, profile
+      >>> matcher = And(IsInstance(int), GreaterThan(0))
+      >>> with profile() as measured:
+      ...     results = [value == matcher for value in (1, 2, -3)]
+      >>> [(node.label, node.calls, node.passed, node.failed) for node in measured.roots[0].children]
+      [('IsInstance(int)', 3, 3, 0), ('GreaterThan(0)[FAILED for -3]', 3, 2, 1)]
+      >>> print(measured.report())  # doctest: +ELLIPSIS
+           calls     passed     failed   self (s)  total (s)  matcher
+               3          2          1   0.0...   0.0...  And(...)
+               3          3          0   0.0...   0.0...    IsInstance(int)
+               3          2          1   0.0...   0.0...    GreaterThan(0)[FAILED for -3]
+    """
+    global _active_count
+    measured = Profile()
+    token = _active_profile.set(measured)
+    with _lock:
+        if _active_count == 0:
+            _instrument(_profiling, True)
+        _active_count += 1
+    try:
+        yield measured
+    finally:
+        with _lock:
+            _active_count -= 1
+            if _active_count == 0:
+                _instrument(_profiling, False)
+        _active_profile.reset(token)
+
+
+def _profiling(matches: _MatchesFunction) -> _MatchesFunction:
+    def profiled_matches(self: Matcher, other: MatchedType, context: _MatcherContext) -> bool:
+        measured = _active_profile.get()
+        if measured is None:  # another thread is profiling
+            return matches(self, other, context)
+
+        parent = _current_node.get()
+        nodes = measured._roots if parent is None else parent._children
+        node = nodes.get(id(self))
+        if node is None or node.matcher is not self:
+            node = nodes[id(self)] = ProfiledNode(self)
+        token = _current_node.set(node)
+        start = perf_counter()
+        try:
+            passed = matches(self, other, context)
+        finally:
+            node.cumulative_time += perf_counter() - start
+            node.calls += 1
+            _current_node.reset(token)
+        if passed:
+            node.passed += 1
+        else:
+            node.failed += 1
+        return passed
+
+    return profiled_matches
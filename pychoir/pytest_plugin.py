@@ -0,0 +1,54 @@
+"""
+The pytest options of pychoir, registered as a pytest plugin when pychoir is installed
+
+:code:`--pychoir-profile` profiles the Matchers evaluated during the test session (see :func:`profile`)
+and shows the report at the end of it. :code:`--pychoir-profile-json=PATH` writes the report as JSON.
+"""
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Optional
+
+from pychoir.profiling import Profile, profile
+
+if TYPE_CHECKING:
+    import pytest
+
+_PROFILE = '_pychoir_profile'
+
+
+def pytest_addoption(parser: 'pytest.Parser') -> None:
+    group = parser.getgroup('pychoir')
+    group.addoption('--pychoir-profile', action='store_true', default=False,
+                    help='Profile the evaluated Matchers and show the report at the end of the session.')
+    group.addoption('--pychoir-profile-json', metavar='PATH', default=None,
+                    help='Profile the evaluated Matchers and write the report to PATH as JSON.')
+
+
+def pytest_configure(config: 'pytest.Config') -> None:
+    if config.getoption('pychoir_profile') or config.getoption('pychoir_profile_json'):
+        profiling = ExitStack()
+        measured = profiling.enter_context(profile())
+        setattr(config, _PROFILE, (profiling, measured))
+
+
+def pytest_terminal_summary(terminalreporter: 'pytest.TerminalReporter', config: 'pytest.Config') -> None:
+    measured = _profile(config)
+    if measured is not None and config.getoption('pychoir_profile'):
+        terminalreporter.write_sep('=', 'pychoir profile')
+        terminalreporter.write_line(measured.report())
+
+
+def pytest_unconfigure(config: 'pytest.Config') -> None:
+    profiling = getattr(config, _PROFILE, None)
+    if profiling is None:
+        return
+    profiling[0].close()
+    delattr(config, _PROFILE)
+    path = config.getoption('pychoir_profile_json')
+    if path:
+        with open(path, 'w') as file:
+            file.write(profiling[1].to_json(indent=2))
+
+
+def _profile(config: 'pytest.Config') -> Optional[Profile]:
+    profiling = getattr(config, _PROFILE, None)
+    return None if profiling is None else profiling[1]
@@ -0,0 +1,165 @@
+"""
+Validating records streamed from JSON Lines and CSV files
+"""
+import csv
+import io
+import json
+import os
+from contextlib import contextmanager
+from typing import IO, Any, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from pychoir.core import Matchable, Matcher
+
+Source = Union[str, 'os.PathLike[str]', IO[Any]]
+
+FORMATS = ('jsonl', 'csv')
+
+# files are read in large chunks, validated files are often gigabytes in size
+_BUFFER_SIZE = 1 << 20
+
+
+class Failure(NamedTuple):
+    """A record that did not match, see :func:`validate`."""
+    line: int
+    record: Any
+
+
+class Validation:
+    """The result of :func:`validate`, truthy when all the records matched.
+
+    :ivar matcher: The Matcher the records were compared against, showing the failures.
+    :ivar records: The number of records read.
+    :ivar failure_count: The number of records that did not match.
+    :ivar failures: The first :class:`Failure` s, as many as were kept.
+    """
+    def __init__(self, matcher: Matchable, records: int, failure_count: int, failures: List[Failure]):
+        self.matcher = matcher
+        self.records = records
+        self.failure_count = failure_count
+        self.failures = failures
+
+    def __bool__(self) -> bool:
+        return self.failure_count == 0
+
+    def __repr__(self) -> str:
+        return (f'Validation(records={self.records:,}, failures={self.failure_count:,}, '
+                f'first failed lines={[failure.line for failure in self.failures]!r}, matcher={self.matcher!r})')
+
+
+def records(source: Source, format: str = 'jsonl') -> Iterator[Tuple[int, Any]]:
+    """Reads the records of a JSON Lines or CSV file lazily.
+
+    JSON Lines are decoded with a single reused decoder, skipping empty lines.
+    CSV rows are read as dicts keyed by the header row.
+
+    :param source: The path of the file or a file object to read.
+    :param format: :code:`'jsonl'` or :code:`'csv'`.
+    :return: The line number where each record starts and the record.
+    """
+    if format == 'jsonl':
+        return _json_lines(source)
+    if format == 'csv':
+        return _csv_rows(source)
+    raise ValueError(f'Unknown format {format!r}, expected one of {FORMATS!r}')
+
+
+def failures(source: Source, matcher: Matchable, format: str = 'jsonl') -> Iterator[Failure]:
+    """Compares the records of a JSON Lines or CSV file against the Matcher, yielding those that do not match.
+
+    The records are read lazily, one at a time, and compared like with :func:`Matcher.check`.
+
+    :param source: The path of the file or a file object to read.
+    :param matcher: The Matcher (or value) to compare each record against.
+    :param format: :code:`'jsonl'` or :code:`'csv'`.
+    """
+    for line, record in records(source, format):
+        if not _matches(matcher, record):
+            yield Failure(line, record)
+
+
+def validate(
+    source: Source,
+    matcher: Matchable,
+    format: str = 'jsonl',
+    max_failures: Optional[int] = 100,
+) -> Validation:
+    """Compares the records of a JSON Lines or CSV file against the Matcher, in bounded memory.
+
+    Like :func:`failures`, but reads the whole file, counting the records and the failures
+    and keeping only the first ones.
+
+    :param source: The path of the file or a file object to read.
+    :param matcher: The Matcher (or value) to compare each record against.
+    :param format: :code:`'jsonl'` or :code:`'csv'`.
+    :param max_failures: How many of the first failures to keep, None to keep all.
+    :return: A :class:`Validation`, truthy when all the records matched.
+
+    Usage:
+      >>> import io
+      >>> from pychoir import DictContainsAllOf, IsInstance
+      >>> from pychoir.stream import validate
+      >>> lines = io.StringIO('{"id": 1}\\n{"id": "2"}\\n{"id": 3}\\n')
+      >>> validation = validate(lines, DictContainsAllOf({'id': IsInstance(int)}))
+      >>> bool(validation)
+      False
+      >>> validation
+      Validation(records=3, failures=1, first failed lines=[2], matcher=DictContainsAllOf({'id': IsInstance(int)[FAILED for '2']})[FAILED for {'id': '2'}])
+    """  # noqa: E501
+    record_count = 0
+    failure_count = 0
+    kept: List[Failure] = []
+    for line, record in records(source, format):
+        record_count += 1
+        if not _matches(matcher, record):
+            failure_count += 1
+            if max_failures is None or len(kept) < max_failures:
+                kept.append(Failure(line, record))
+    return Validation(matcher, record_count, failure_count, kept)
+
+
+def _matches(matcher: Matchable, record: Any) -> bool:
+    if isinstance(matcher, Matcher):
+        return matcher.check(record)
+    return bool(record == matcher)
+
+
+def _json_lines(source: Source) -> Iterator[Tuple[int, Any]]:
+    decoder = json.JSONDecoder()
+    with _opened(source, binary=True) as file:
+        for line_number, line in enumerate(file, start=1):
+            text = line.decode() if isinstance(line, bytes) else line
+            if not text or text.isspace():
+                continue
+            try:
+                record = decoder.decode(text)
+            except ValueError as error:
+                raise ValueError(f'Invalid JSON on line {line_number}: {error}') from error
+            yield line_number, record
+
+
+def _csv_rows(source: Source) -> Iterator[Tuple[int, Any]]:
+    with _opened(source, binary=False) as file:
+        reader = csv.DictReader(file)
+        line_number = 1  # the header
+        for row in reader:
+            yield line_number + 1, row
+            line_number = reader.line_num
+
+
+@contextmanager
+def _opened(source: Source, binary: bool) -> Iterator[IO[Any]]:
+    if isinstance(source, (str, os.PathLike)):
+        if binary:
+            with open(source, 'rb', buffering=_BUFFER_SIZE) as file:
+                yield file
+        else:
+            with open(source, newline='', encoding='utf-8', buffering=_BUFFER_SIZE) as file:
+                yield file
+    elif not binary and isinstance(source, (io.RawIOBase, io.BufferedIOBase)):
+        text = io.TextIOWrapper(source, encoding='utf-8', newline='')
+        try:
+            yield text
+        finally:
+            text.detach()  # leave the file object open for the caller
+    else:
+        yield source
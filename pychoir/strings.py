@@ -1,19 +1,115 @@
 import re
 import sys
-from typing import Any, Union
+from typing import Any, Iterator, Optional, Tuple, Union
 
 from pychoir import Matcher
+from pychoir.core import described_all
+from pychoir.utils import buffer_ends_with, buffer_starts_with, is_buffer
 
 if sys.version_info >= (3, 7):
     from re import Pattern
 else:
     Pattern = Any
 
+# the flags a regular expression can be fused with others with, by setting them for its part of the expression
+_FLAG_LETTERS = ((re.IGNORECASE, 'i'), (re.DOTALL, 's'))
+_SCOPED_FLAGS = re.UNICODE | re.IGNORECASE | re.DOTALL
+# group numbers change when fused
+_NUMBERED_REFERENCE = re.compile(r'\\[1-9]|\(\?\(\d')
+# inline flags that apply to the whole expression, already included in its flags
+_GLOBAL_FLAGS = re.compile(r'\A\(\?[aiLmsux]+\)')
+
+
+def _anchored_at_start(pattern: str) -> bool:
+    # whether all the alternatives of the expression start with ^ or \A, without parsing it fully
+    if not pattern.startswith(('^', '\\A')):
+        return False
+    depth = 0
+    characters = iter(pattern)
+    for character in characters:
+        if character == '\\':
+            next(characters, None)
+        elif character == '[':
+            _skip_character_class(characters)
+        elif character == '(':
+            depth += 1
+        elif character == ')':
+            depth -= 1
+        elif character == '|' and depth == 0:
+            return False
+    return True
+
+
+def _skip_character_class(characters: Iterator[str]) -> None:
+    first = True
+    for character in characters:
+        if character == '\\':
+            next(characters, None)
+        elif character == '^' and first:
+            continue
+        elif character == ']' and not first:
+            return
+        first = False
+
+
+class _AffixIndex:
+    # the prefixes or suffixes of a StartsWith or EndsWith, looked up by the slice of each length of the value
+    __slots__ = ('affixes', 'lengths', 'at_end')
+
+    def __init__(self, affixes: Tuple[Union[str, bytes], ...], at_end: bool):
+        self.affixes = frozenset(affixes)
+        self.lengths = sorted({len(affix) for affix in affixes}, reverse=True)
+        self.at_end = at_end
+
+    @classmethod
+    def for_many(cls, affixes: Tuple[Union[str, bytes], ...], at_end: bool) -> Optional['_AffixIndex']:
+        index = cls(affixes, at_end)
+        return index if len(affixes) >= _AFFIXES_PER_LENGTH * len(index.lengths) else None
+
+    def longest(self, value: Union[str, bytes]) -> Optional[Union[str, bytes]]:
+        size = len(value)
+        for length in self.lengths:
+            if length <= size:
+                part = value[size - length:] if self.at_end else value[:length]
+                if part in self.affixes:
+                    return part
+        return None
+
+
+# with this many affixes per distinct length, looking up the slices of the value is faster than .startswith()
+_AFFIXES_PER_LENGTH = 16
+
+
+def _starts_with(value: Any, start: Any) -> bool:
+    try:
+        return value.startswith(start)  # type: ignore[no-any-return]
+    except AttributeError:
+        if not is_buffer(value):
+            raise
+        return any(buffer_starts_with(value, prefix) for prefix in (start if isinstance(start, tuple) else [start]))
+
+
+def _ends_with(value: Any, end: Any) -> bool:
+    try:
+        return value.endswith(end)  # type: ignore[no-any-return]
+    except AttributeError:
+        if not is_buffer(value):
+            raise
+        return any(buffer_ends_with(value, suffix) for suffix in (end if isinstance(end, tuple) else [end]))
+
 
 class StartsWith(Matcher):
-    """A Matcher checking that the compared string :code:`.startswith()` the passed string.
+    """A Matcher checking that the compared string :code:`.startswith()` the passed string,
+    or any of the passed strings.
+
+    Also matches bytes, and :class:`memoryview` and :class:`mmap.mmap` objects,
+    of which only the first bytes are read.
+
+    Many strings (like the allowed routes of an API) are looked up from a set by the start of the compared string
+    of each of their lengths, so that the time taken does not grow with the number of strings.
 
-    :param start: The string the compared value is expected to start with.
+    :param start: The string (or bytes) the compared value is expected to start with.
+    :param starts: More strings, any of which the compared value can start with instead.
 
     Usage:
       >>> from pychoir import StartsWith
@@ -21,22 +117,55 @@ class StartsWith(Matcher):
       True
       >>> 'barbar' == StartsWith('foo')
       False
+      >>> '/api/v2/users' == StartsWith('/api/v1/', '/api/v2/')
+      True
     """
-    def __init__(self, start: str):
+    _cost = 2
+
+    def __init__(self, start: Union[str, bytes], *starts: Union[str, bytes]):
         super().__init__()
-        self.start = start
+        self.starts = (start,) + starts
+        self.start = self.starts if starts else start
+        self._index = _AffixIndex.for_many(self.starts, at_end=False) if starts else None
+
+    def _matches(self, other: Any) -> bool:
+        if self._index is not None and isinstance(other, (str, bytes)):
+            return self._index.longest(other) is not None
+        return _starts_with(other, self.start)
+
+    def matching_start(self, other: Any) -> Optional[Union[str, bytes]]:
+        """Returns the longest of the passed strings that the compared string starts with, or None.
+
+        :param other: The value being compared.
 
-    def _matches(self, other: str) -> bool:
-        return other.startswith(self.start)
+        Usage:
+          >>> from pychoir import StartsWith
+          >>> StartsWith('/api/', '/api/v2/', '/static/').matching_start('/api/v2/users')
+          '/api/v2/'
+        """
+        if self._index is not None and isinstance(other, (str, bytes)):
+            return self._index.longest(other)
+        return max((start for start in self.starts if _starts_with(other, start)), key=len, default=None)
+
+    def _fused_pattern(self) -> Optional[str]:
+        return re.escape(self.start) if isinstance(self.start, str) else None
 
     def _description(self) -> str:
-        return repr(self.start)
+        return described_all(self.starts)
 
 
 class EndsWith(Matcher):
-    """A Matcher checking that the compared string :code:`.endswith()` the passed string.
+    """A Matcher checking that the compared string :code:`.endswith()` the passed string,
+    or any of the passed strings.
+
+    Also matches bytes, and :class:`memoryview` and :class:`mmap.mmap` objects,
+    of which only the last bytes are read.
 
-    :param end: The string the compared value is expected to end with.
+    Many strings (like allowed metric name suffixes) are looked up from a set by the end of the compared string
+    of each of their lengths, so that the time taken does not grow with the number of strings.
+
+    :param end: The string (or bytes) the compared value is expected to end with.
+    :param ends: More strings, any of which the compared value can end with instead.
 
     Usage:
       >>> from pychoir import EndsWith
@@ -44,22 +173,50 @@ class EndsWith(Matcher):
       True
       >>> 'foofoo' == EndsWith('bar')
       False
+      >>> 'requests_total' == EndsWith('_total', '_seconds')
+      True
     """
-    def __init__(self, end: str):
+    _cost = 2
+
+    def __init__(self, end: Union[str, bytes], *ends: Union[str, bytes]):
         super().__init__()
-        self.end = end
+        self.ends = (end,) + ends
+        self.end = self.ends if ends else end
+        self._index = _AffixIndex.for_many(self.ends, at_end=True) if ends else None
+
+    def _matches(self, other: Any) -> bool:
+        if self._index is not None and isinstance(other, (str, bytes)):
+            return self._index.longest(other) is not None
+        return _ends_with(other, self.end)
+
+    def matching_end(self, other: Any) -> Optional[Union[str, bytes]]:
+        """Returns the longest of the passed strings that the compared string ends with, or None.
+
+        :param other: The value being compared.
 
-    def _matches(self, other: str) -> bool:
-        return other.endswith(self.end)
+        Usage:
+          >>> from pychoir import EndsWith
+          >>> EndsWith('_total', '_seconds', '_seconds_total').matching_end('cpu_seconds_total')
+          '_seconds_total'
+        """
+        if self._index is not None and isinstance(other, (str, bytes)):
+            return self._index.longest(other)
+        return max((end for end in self.ends if _ends_with(other, end)), key=len, default=None)
 
     def _description(self) -> str:
-        return repr(self.end)
+        return described_all(self.ends)
 
 
 class MatchesRegex(Matcher):
     """A Matcher checking that the compared string matches the passed regular expression.
 
-    :param regex: The regular expression (as a string or a :class:`re.Pattern`).
+    Also matches bytes, and :class:`memoryview` and :class:`mmap.mmap` objects without copying them.
+    A string pattern is compiled into a bytes pattern for those when first needed.
+
+    Under :class:`Or`, expressions anchored to the start of the string (with :code:`^` or :code:`\\A`)
+    are fused with their neighbours into one regular expression, see :func:`Matcher.nested_match_any`.
+
+    :param regex: The regular expression (as a string, bytes or a :class:`re.Pattern`).
 
     Usage:
       >>> import re
@@ -69,14 +226,34 @@ class MatchesRegex(Matcher):
       >>> 'foofoo' == MatchesRegex(re.compile(r'^b[ao]r$'))
       False
     """
-    def __init__(self, regex: Union[str, Pattern]):
+    _cost = 5
+
+    def __init__(self, regex: Union[str, bytes, Pattern]):
         super().__init__()
-        if isinstance(regex, str):
+        if isinstance(regex, (str, bytes)):
             regex = re.compile(regex)
         self.regex = regex
+        self._bytes_regex: Optional[Pattern] = None
+
+    def _matches(self, other: Any) -> bool:
+        try:
+            return self.regex.search(other) is not None
+        except TypeError:
+            bytes_like = isinstance(other, (bytes, bytearray)) or is_buffer(other)
+            if not bytes_like or not isinstance(self.regex.pattern, str):
+                raise
+            if self._bytes_regex is None:
+                self._bytes_regex = re.compile(self.regex.pattern.encode(), self.regex.flags & ~re.UNICODE)
+            return self._bytes_regex.search(other) is not None
 
-    def _matches(self, other: str) -> bool:
-        return re.search(self.regex, other) is not None
+    def _fused_pattern(self) -> Optional[str]:
+        if not isinstance(self.regex.pattern, str) or self.regex.flags & ~_SCOPED_FLAGS:
+            return None
+        pattern = _GLOBAL_FLAGS.sub('', self.regex.pattern)
+        if not _anchored_at_start(pattern) or _NUMBERED_REFERENCE.search(pattern):
+            return None
+        flags = ''.join(letter for flag, letter in _FLAG_LETTERS if self.regex.flags & flag)
+        return f'(?{flags}:{pattern})' if flags else pattern
 
     def _description(self) -> str:
         return repr(self.regex)
@@ -0,0 +1,189 @@
+"""
+Matching nested dicts and lists against templates
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from pychoir.compiler import CompiledMatcher, compile
+from pychoir.containers import All
+from pychoir.core import Matcher, described
+from pychoir.logical import And
+
+
+class _Failure:
+    __slots__ = ('value', 'reason', 'path')
+
+    def __init__(self, value: Any, reason: Optional[str] = None) -> None:
+        self.value = value
+        self.reason = reason
+        self.path: List[Any] = []  # from the failed node up to the root
+
+    def __repr__(self) -> str:
+        path = ''.join(map(_path_segment, reversed(self.path)))
+        return f'${path}: {self.reason if self.reason is not None else repr(self.value)}'
+
+
+def _path_segment(key: Any) -> str:
+    if isinstance(key, str) and key.isidentifier():
+        return f'.{key}'
+    return f'[{key!r}]'
+
+
+class _Node:
+    __slots__ = ()
+
+    def check(self, structure: Matcher, value: Any) -> Optional[_Failure]:
+        raise NotImplementedError  # pragma: no cover
+
+
+class _Equal(_Node):
+    # a part of the template without Matchers, compared as a whole
+    __slots__ = ('expected',)
+
+    def __init__(self, expected: Any) -> None:
+        self.expected = expected
+
+    def check(self, structure: Matcher, value: Any) -> Optional[_Failure]:
+        if value is self.expected or value == self.expected:
+            return None
+        if isinstance(self.expected, (dict, list, tuple)):
+            # only compiled when failing, to find out where
+            failure = _compile_container(self.expected).check(structure, value)
+            if failure is not None:
+                return failure
+        return _Failure(value)
+
+
+class _Matching(_Node):
+    __slots__ = ('matcher', 'compiled', 'compiled_items')
+
+    def __init__(self, matcher: Matcher) -> None:
+        self.matcher = matcher
+        self.compiled: CompiledMatcher = compile(matcher)
+        # for an All, what each of the items must match, to find the item it fails for
+        self.compiled_items: Optional[CompiledMatcher] = (
+            compile(And(*matcher.matchers)) if type(matcher) is All else None)
+
+    def check(self, structure: Matcher, value: Any) -> Optional[_Failure]:
+        # the Matcher is only evaluated when the compiled predicate fails, to record the failures
+        if self.compiled.passes(value) or structure.nested_match(self.matcher, value):
+            return None
+        if self.compiled_items is not None and isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                if not self.compiled_items.passes(item):
+                    failure = _Failure(item)
+                    failure.path.append(index)
+                    return failure
+        return _Failure(value)
+
+
+class _Dict(_Node):
+    __slots__ = ('keys', 'items')
+
+    def __init__(self, template: Dict[Any, Any]) -> None:
+        self.keys = frozenset(template)
+        self.items: Tuple[Tuple[Any, _Node], ...] = tuple((key, _compile(value)) for key, value in template.items())
+
+    def check(self, structure: Matcher, value: Any) -> Optional[_Failure]:
+        if not isinstance(value, dict):
+            return _Failure(value)
+        if value.keys() != self.keys:
+            missing = [key for key, _ in self.items if key not in value]
+            unexpected = [key for key in value if key not in self.keys]
+            reasons = [f'{name} keys {keys!r}' for name, keys in (('missing', missing), ('unexpected', unexpected))
+                       if keys]
+            return _Failure(value, ', '.join(reasons))
+
+        for key, node in self.items:
+            failure = node.check(structure, value[key])
+            if failure is not None:
+                failure.path.append(key)
+                return failure
+        return None
+
+
+class _Sequence(_Node):
+    __slots__ = ('type', 'items')
+
+    def __init__(self, template: Sequence[Any]) -> None:
+        self.type: Type[Any] = type(template)
+        self.items = tuple(map(_compile, template))
+
+    def check(self, structure: Matcher, value: Any) -> Optional[_Failure]:
+        if not isinstance(value, self.type):
+            return _Failure(value)
+        if len(value) != len(self.items):
+            return _Failure(value, f'length {len(value)}, expected {len(self.items)}')
+
+        for index, (node, item) in enumerate(zip(self.items, value)):
+            failure = node.check(structure, item)
+            if failure is not None:
+                failure.path.append(index)
+                return failure
+        return None
+
+
+def _has_matchers(template: Any) -> bool:
+    if isinstance(template, Matcher):
+        return True
+    if isinstance(template, dict):
+        return any(map(_has_matchers, template.values()))
+    if isinstance(template, (list, tuple)):
+        return any(map(_has_matchers, template))
+    return False
+
+
+def _compile(template: Any) -> _Node:
+    if isinstance(template, Matcher):
+        return _Matching(template)
+    if not _has_matchers(template):
+        return _Equal(template)
+    return _compile_container(template)
+
+
+def _compile_container(template: Any) -> _Node:
+    if isinstance(template, dict):
+        return _Dict(template)
+    if isinstance(template, (list, tuple)):
+        return _Sequence(template)
+    return _Equal(template)
+
+
+class Structure(Matcher):
+    """A Matcher checking that a nested structure of dicts, lists and tuples matches a template,
+    like comparing it to the template with :code:`==` would.
+
+    The template is compiled when the Matcher is created. The keys of dicts and the lengths of lists are checked
+    before their values, parts of the template without Matchers are compared as a whole
+    and the evaluation stops at the first failure, which is shown by its JSON path.
+    The path goes down to the failing item of a list or tuple in the template, or compared with :class:`All`.
+
+    :param template: The nested structure of values and Matchers to compare against.
+
+    Usage:
+      >>> from pychoir import All, IsInstance, Structure
+      >>> matcher = Structure({'user': {'id': IsInstance(int), 'tags': All(IsInstance(str))}})
+      >>> {'user': {'id': 1, 'tags': ['a', 'b']}} == matcher
+      True
+      >>> {'user': {'id': 1, 'tags': ['a', 2]}} == matcher
+      False
+      >>> matcher
+      Structure({'user': {'id': IsInstance(int), 'tags': All(IsInstance(str)[FAILED for 2])[FAILED for ['a', 2]]}})[FAILED for $.user.tags[1]: 2]
+      >>> {'user': {'id': 1}} == matcher
+      False
+    """  # noqa: E501
+    _cost = 20
+
+    def __init__(self, template: Any):
+        super().__init__()
+        self.template = template
+        self._root = _compile(template)
+
+    def _matches(self, other: Any) -> bool:
+        failure = self._root.check(self, other)
+        if failure is None:
+            return True
+        self.report_failed_value(failure)
+        return False
+
+    def _description(self) -> str:
+        return described(self.template)
@@ -1,6 +1,7 @@
 from typing import Any, Type
 
 from pychoir.core import Matcher
+from pychoir.utils import imported_numpy, is_ndarray_vector
 
 
 class IsInstance(Matcher):
@@ -17,6 +18,9 @@ class IsInstance(Matcher):
       >>> 'foobar' == IsInstance(int, str)
       True
     """
+    _cost = 1
+    _total = True
+
     def __init__(self, *types: Type[Any]):
         super().__init__()
         self.types = types
@@ -24,6 +28,14 @@ class IsInstance(Matcher):
     def _matches(self, other: Any) -> bool:
         return isinstance(other, self.types)
 
+    def _matches_many(self, values: Any) -> Any:
+        types = self.types
+        if is_ndarray_vector(values) and values.dtype.kind != 'O':
+            # all items of a non-object array are of the same scalar type
+            item_type = values.dtype.type
+            return imported_numpy().full(len(values), issubclass(item_type, types))
+        return [isinstance(value, types) for value in values]
+
     def _description(self) -> str:
         return ', '.join(map(lambda t: t.__name__, self.types))
 
@@ -43,6 +55,9 @@ class ConvertsTo(Matcher):
       >>> '5.2' == ConvertsTo(int)
       False
     """
+    _cost = 3
+    _total = True
+
     def __init__(self, type_: Type[Any]):
         super().__init__()
         self.type = type_
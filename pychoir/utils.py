@@ -1,8 +1,26 @@
 """
 Useful extensions for standard library
 """
+import sys
+from collections import deque
 from enum import Enum
-from typing import Any, Sequence, Tuple, TypeVar, Union
+from itertools import count
+from typing import (
+    AbstractSet,
+    Any,
+    Awaitable,
+    Collection,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 T = TypeVar('T')
 
@@ -18,6 +36,273 @@ def i_removed(tuple_: Tuple[Any, ...], index: Any) -> Tuple[Any, ...]:
     return tuple_[:index] + tuple_[index + 1:]
 
 
+def maximum_bipartite_matching(adjacency: Sequence[Sequence[int]], right_count: int) -> int:
+    """Returns the size of a maximum matching in a bipartite graph using the Hopcroft-Karp algorithm.
+
+    :param adjacency: For each left vertex, the indices of the right vertices it is connected to.
+    :param right_count: The number of right vertices.
+    """
+    unreached = len(adjacency) + 1
+    match_left = [-1] * len(adjacency)
+    match_right = [-1] * right_count
+    distance = [unreached] * len(adjacency)
+    size = 0
+
+    def layer_free_vertices() -> bool:
+        queue: Deque[int] = deque()
+        for left in range(len(adjacency)):
+            if match_left[left] == -1:
+                distance[left] = 0
+                queue.append(left)
+            else:
+                distance[left] = unreached
+        found_augmenting_path = False
+        while queue:
+            left = queue.popleft()
+            for right in adjacency[left]:
+                next_left = match_right[right]
+                if next_left == -1:
+                    found_augmenting_path = True
+                elif distance[next_left] == unreached:
+                    distance[next_left] = distance[left] + 1
+                    queue.append(next_left)
+        return found_augmenting_path
+
+    def augment(root: int, next_edge: List[int]) -> bool:
+        lefts = [root]
+        rights: List[int] = []
+        while lefts:
+            left = lefts[-1]
+            edges = adjacency[left]
+            while next_edge[left] < len(edges):
+                right = edges[next_edge[left]]
+                next_edge[left] += 1
+                next_left = match_right[right]
+                if next_left == -1:
+                    rights.append(right)
+                    for path_left, path_right in zip(lefts, rights):
+                        match_left[path_left] = path_right
+                        match_right[path_right] = path_left
+                    return True
+                if distance[next_left] == distance[left] + 1:
+                    rights.append(right)
+                    lefts.append(next_left)
+                    break
+            else:
+                distance[left] = unreached
+                lefts.pop()
+                if rights:
+                    rights.pop()
+        return False
+
+    while layer_free_vertices():
+        next_edge = [0] * len(adjacency)
+        for left in range(len(adjacency)):
+            if match_left[left] == -1 and augment(left, next_edge):
+                size += 1
+    return size
+
+
+# how many awaitables are awaited at once, bounding the tasks of Matchers going through many values like All
+_MAX_PENDING = 100
+
+
+async def all_concurrently(evaluations: Iterable[Union[bool, Awaitable[bool]]]) -> bool:
+    """Awaits the awaitables concurrently, returning False as soon as one of them (or one of the results) is false
+    and cancelling the rest. See :func:`_first_concurrently`."""
+    return not await _first_concurrently(evaluations, False)
+
+
+async def any_concurrently(evaluations: Iterable[Union[bool, Awaitable[bool]]]) -> bool:
+    """Awaits the awaitables concurrently, returning True as soon as one of them (or one of the results) is true
+    and cancelling the rest. See :func:`_first_concurrently`."""
+    return await _first_concurrently(evaluations, True)
+
+
+async def _first_concurrently(evaluations: Iterable[Union[bool, Awaitable[bool]]], result: bool) -> bool:
+    """Returns True as soon as any of the evaluations is the result, False if none of them is.
+
+    The evaluations are taken in order, the results already evaluated (by the iterable, when it is reached)
+    checked immediately and the awaitables awaited concurrently, at most :code:`_MAX_PENDING` at a time.
+    An exception only ends the evaluation if none of the others turns out to be the result. Like with
+    :func:`any`, the evaluations after an exception raised by the iterable itself are not taken.
+    """
+    # only needed when evaluating asynchronously, not worth the import time otherwise
+    import asyncio
+    from inspect import isawaitable
+
+    pending: Dict['asyncio.Future[bool]', int] = {}
+    errors: List[Tuple[int, BaseException]] = []
+
+    async def any_done_is_result(return_when: str) -> bool:
+        done, _ = await asyncio.wait(pending, return_when=return_when)
+        for task in sorted(done, key=pending.__getitem__):
+            index = pending.pop(task)
+            error = task.exception()
+            if error is not None:
+                errors.append((index, error))
+            elif bool(task.result()) is result:
+                return True
+        return False
+
+    try:
+        evaluations = iter(evaluations)
+        for index in count():
+            try:
+                evaluation = next(evaluations)
+            except StopIteration:
+                break
+            except Exception as error:
+                errors.append((index, error))
+                break
+            if isawaitable(evaluation):
+                pending[asyncio.ensure_future(evaluation)] = index
+                if len(pending) >= _MAX_PENDING and await any_done_is_result(asyncio.FIRST_COMPLETED):
+                    return True
+            elif bool(evaluation) is result:
+                return True
+        while pending:
+            if await any_done_is_result(asyncio.FIRST_COMPLETED):
+                return True
+        if errors:
+            raise min(errors, key=lambda indexed: indexed[0])[1]
+        return False
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def imported_numpy() -> Any:
+    """Returns the NumPy module if it has been imported, None otherwise.
+
+    NumPy is an optional dependency and never imported by pychoir itself.
+    If it has not been imported, no value can be a NumPy array.
+    """
+    return sys.modules.get('numpy')
+
+
+def is_ndarray(value: Any) -> bool:
+    numpy = imported_numpy()
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def is_ndarray_vector(value: Any) -> bool:
+    return is_ndarray(value) and value.ndim == 1
+
+
+def all_true(values: Iterable[Any]) -> bool:
+    """Returns whether all of the values are true, checking a NumPy array in one go."""
+    if is_ndarray(values):
+        return bool(values.all())  # type: ignore[attr-defined]
+    return all(values)
+
+
+def any_true(values: Iterable[Any]) -> bool:
+    """Returns whether any of the values is true, checking a NumPy array in one go."""
+    if is_ndarray(values):
+        return bool(values.any())  # type: ignore[attr-defined]
+    return any(values)
+
+
+def bool_array(values: Iterable[bool], length: int) -> Any:
+    """Returns the values as a NumPy array of bools. Only to be called when NumPy has been imported."""
+    return imported_numpy().fromiter(values, dtype=bool, count=length)
+
+
+class ValueIndex:
+    """A membership test over values that looks up the hashable ones from a frozenset.
+
+    Unhashable values are kept in order and compared one by one, as are values looked up
+    that are unhashable themselves, so that membership works like in the original values.
+    """
+    __slots__ = ('values', 'hashable', 'unhashable')
+
+    def __init__(self, values: Iterable[Any]) -> None:
+        self.values = tuple(values)
+        hashable: List[Any] = []
+        unhashable: List[Any] = []
+        for value in self.values:
+            (hashable if is_hashable(value) else unhashable).append(value)
+        self.hashable: FrozenSet[Any] = frozenset(hashable)
+        self.unhashable: Tuple[Any, ...] = tuple(unhashable)
+
+    def __contains__(self, value: Any) -> bool:
+        try:
+            if value in self.hashable:
+                return True
+        except TypeError:
+            return value in self.values
+        return value in self.unhashable
+
+
+def is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def frozen(values: Iterable[Any]) -> Optional[FrozenSet[Any]]:
+    """Returns the values as a frozenset, or None if they are not a Collection of hashable values."""
+    if not isinstance(values, Collection):
+        return None
+    try:
+        return frozenset(values)
+    except TypeError:
+        return None
+
+
+# how many lookups into a list or tuple make building a one-off set of it worthwhile
+MANY_LOOKUPS = 8
+
+
+def as_set(container: Any, lookups: int) -> Optional[AbstractSet[Any]]:
+    """Returns the container as a set for looking up values from it, or None if it cannot be used as one.
+
+    Sets are returned as they are. A one-off set is built of a list or tuple of hashable items
+    when it would otherwise be searched through at least :data:`MANY_LOOKUPS` times.
+    """
+    if isinstance(container, (set, frozenset)):
+        return container
+    if isinstance(container, (list, tuple)) and lookups >= MANY_LOOKUPS:
+        try:
+            return set(container)
+        except TypeError:
+            return None
+    return None
+
+
+def is_buffer(value: Any) -> bool:
+    """Returns whether the value is a bytes-like object without the methods of bytes, a memoryview or an mmap,
+    matched without copying it whole.
+
+    Like NumPy, mmap is never imported by pychoir itself. If it has not been imported, no value can be an mmap.
+    """
+    if isinstance(value, memoryview):
+        return True
+    mmap = sys.modules.get('mmap')
+    return mmap is not None and isinstance(value, mmap.mmap)
+
+
+def buffer_starts_with(buffer: Any, prefix: bytes) -> bool:
+    return bytes(buffer[:len(prefix)]).startswith(prefix)
+
+
+def buffer_ends_with(buffer: Any, suffix: bytes) -> bool:
+    return bytes(buffer[max(len(buffer) - len(suffix), 0):]).endswith(suffix)
+
+
+def buffer_contains(buffer: Any, value: Union[bytes, bytearray, memoryview]) -> bool:
+    if not isinstance(buffer, memoryview):  # an mmap
+        return bool(buffer.find(value, 0) != -1)  # from the start, not the position of the mmap
+    # only needed for memoryviews, not worth the import time otherwise
+    import re
+
+    return re.search(re.escape(bytes(value)), buffer) is not None
+
+
 class DefaultType(Enum):
     DEFAULT = 'default'
 
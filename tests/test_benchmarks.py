@@ -0,0 +1,61 @@
+import json
+import pkgutil
+from pathlib import Path
+
+import pytest
+
+import pychoir
+from benchmarks.runner import main, run, scenarios
+
+
+def test_covers_every_module() -> None:
+    modules = {module.name for module in pkgutil.iter_modules(pychoir.__path__)} - {'utils', 'pytest_plugin'}
+    benchmarked = {found.name.partition('.')[0] for found in scenarios()}
+    assert modules - {module for module in modules if module.startswith('_')} <= benchmarked
+
+
+def test_run() -> None:
+    lines: list = []
+    results = run('compiler.compiling', repeat=1, report=lines.append)
+    assert list(results) == ['compiler.compiling']
+    assert results['compiler.compiling'].seconds > 0
+    assert lines[0].startswith('compiler.compiling ')
+    assert lines[0].endswith('Compiling an And of 100 StartsWith.')
+
+
+def test_save_and_compare(tmp_path: Path, capsys: 'pytest.CaptureFixture[str]') -> None:
+    baseline = tmp_path / 'baseline.json'
+    assert main(['run', '-k', 'compiler.compiling', '--repeat', '1', '--save', str(baseline)]) == 0
+    saved = json.loads(baseline.read_text())
+    assert list(saved['results']) == ['compiler.compiling']
+    assert set(saved['environment']) == {'python', 'implementation', 'machine', 'system', 'processor'}
+    assert saved['results']['compiler.compiling']['relative'] > 0
+
+    saved['results']['compiler.compiling']['seconds'] *= 2
+    saved['results']['compiler.compiling']['relative'] *= 2
+    saved['results']['core.added'] = saved['results']['compiler.compiling']
+    slower = tmp_path / 'slower.json'
+    slower.write_text(json.dumps(saved))
+    capsys.readouterr()
+    assert main(['compare', str(baseline), str(slower)]) == 1
+    output = capsys.readouterr()
+    assert output.out.splitlines()[0].endswith('+100.0%  REGRESSION')
+    assert output.out.splitlines()[1].split()[:2] == ['core.added', '-']
+    assert not output.out.splitlines()[1].endswith('REGRESSION')
+    assert '1 of 2 scenarios slower than the baseline by more than 20%' in output.err
+    assert main(['compare', str(baseline), str(slower), '--threshold', '1.1']) == 0
+
+    saved['results']['compiler.compiling']['relative'] /= 2  # as slow as the calibration, on a slower machine
+    slower_machine = tmp_path / 'slower_machine.json'
+    slower_machine.write_text(json.dumps(saved))
+    capsys.readouterr()
+    assert main(['compare', str(baseline), str(slower_machine)]) == 0
+    assert capsys.readouterr().out.splitlines()[0].endswith('+0.0%')
+
+    del saved['results']['compiler.compiling']['relative']
+    uncalibrated = tmp_path / 'uncalibrated.json'
+    uncalibrated.write_text(json.dumps(saved))
+    assert main(['compare', str(baseline), str(uncalibrated)]) == 1
+    output = capsys.readouterr()
+    assert output.out.splitlines()[0].endswith('+100.0%  REGRESSION')
+    assert 'warning: comparing results without calibration' in output.err
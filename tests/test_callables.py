@@ -1,5 +1,9 @@
+import asyncio
 from typing import Any
 
+import pytest
+
+from pychoir import All, that
 from pychoir.callables import WhenPassedTo
 
 
@@ -30,3 +34,32 @@ def test_does_not_raise() -> None:
     assert not Any == WhenPassedTo(raiser).does_not_raise()
 
     assert str(WhenPassedTo(raiser).does_not_raise()) == 'WhenPassedTo(raiser).does_not_raise()'
+
+
+def test_coroutine_functions() -> None:
+    async def double(x: int) -> int:
+        await asyncio.sleep(0)
+        return 2 * x
+
+    async def raiser(_: Any) -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError('raiser raised')
+
+    async def evaluate() -> None:
+        assert await that(3).matches_async(WhenPassedTo(double).returns(6))
+        assert not await that(3).matches_async(WhenPassedTo(double).returns(7))
+        assert await that([1, 2]).matches_async(All(WhenPassedTo(double).returns(WhenPassedTo(int).returns(2) | 4)))
+
+        assert await that(3).matches_async(WhenPassedTo(raiser).raises(RuntimeError))
+        assert not await that(3).matches_async(WhenPassedTo(double).raises())
+        assert await that(3).matches_async(WhenPassedTo(double).does_not_raise())
+        assert not await that(3).matches_async(WhenPassedTo(raiser).does_not_raise())
+
+        assert await that('5').matches_async(WhenPassedTo(int).returns(5))
+
+    asyncio.run(evaluate())
+
+    with pytest.raises(TypeError) as exc_info:
+        assert 3 == WhenPassedTo(raiser).raises()
+    assert str(exc_info.value) == (
+        'raiser is a coroutine function, evaluate with that(value).matches_async(matcher) instead')
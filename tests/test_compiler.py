@@ -0,0 +1,96 @@
+import pickle
+import re
+from typing import Any
+
+import pytest
+
+from pychoir import (
+    All,
+    And,
+    AreNot,
+    CompiledMatcher,
+    Contains,
+    ContainsAllOf,
+    ContainsAnyOf,
+    ContainsNoneOf,
+    DictContainsAllOf,
+    EndsWith,
+    First,
+    GreaterThan,
+    GreaterThanOrEqualTo,
+    HasLength,
+    In,
+    InAnyOrder,
+    IsEmpty,
+    IsInstance,
+    IsNoneOr,
+    IsNotPresentOr,
+    IsOdd,
+    Last,
+    LessThan,
+    Matchable,
+    MatchesRegex,
+    Not,
+    NotPresent,
+    Or,
+    ResultsTrueFor,
+    Slice,
+    StartsWith,
+    compile,
+)
+
+
+@pytest.mark.parametrize('matcher, value', [
+    (5, 5),
+    (All(IsInstance(int), GreaterThan(0)), [1, 2, 3]),
+    (AreNot(IsOdd()), [2, 4]),
+    (And(HasLength(GreaterThan(1)), First(2)([1, 2]), Last()(3), Slice[1](2)), [1, 2, 3]),
+    (IsInstance(str) & StartsWith('a') & EndsWith('c') & MatchesRegex(re.compile('b')), 'abc'),
+    (IsNoneOr(GreaterThanOrEqualTo(10)) | Or(LessThan(0), In([1, 2])), None),
+    (Not(IsEmpty(), Contains(4)), [1]),
+    (ContainsAllOf(1, 2) & ContainsAnyOf(0, 2) & ContainsNoneOf(5), [1, 2]),
+    (DictContainsAllOf({'a': All(IsOdd()), 'b': NotPresent, 'c': IsNotPresentOr(1), 'd': 'd'}), {'a': [1], 'd': 'd'}),
+    (ResultsTrueFor(bool, callable), print),
+    (InAnyOrder([IsOdd(), 2]), [2, 1]),
+])
+def test_compile_matches_like_matcher(matcher: Matchable, value: Any) -> None:
+    compiled = compile(matcher)
+    assert isinstance(compiled, CompiledMatcher)
+    assert value == compiled
+    assert compiled(value)
+    assert repr(compiled) == repr(matcher)
+    assert '[FAILED' not in repr(compiled)
+
+
+def test_compile_reports_failures_like_matcher():
+    compiled = compile(DictContainsAllOf({'a': All(IsInstance(int), GreaterThan(0)), 'b': Or(1, 2)}))
+    assert {'a': [1, 2], 'b': 2} == compiled
+    assert not {'a': [1, -2], 'b': 2} == compiled
+    assert (str(compiled) ==
+            "DictContainsAllOf({'a': All(IsInstance(int), GreaterThan(0)[FAILED for -2])[FAILED for [1, -2]], "
+            "'b': Or(1, 2)})[FAILED for {'a': [1, -2]}]")
+
+    compiled_not = compile(Not(Or(1, 2)))
+    uncompiled_not = Not(Or(1, 2))
+    assert not 3 != compiled_not
+    assert not 3 != uncompiled_not
+    assert str(compiled_not) == str(uncompiled_not) == 'Not(Or(1, 2)[FAILED for 3])[FAILED for 3]'
+
+
+def test_compile_falls_back_to_uncompiled_matchers():
+    in_any_order = InAnyOrder([IsOdd(), 2])
+    compiled = compile(Or(in_any_order, []))
+    assert [] == compiled
+    assert str(compiled) == 'Or(InAnyOrder([IsOdd(), 2]), [])'
+    assert str(in_any_order) == 'InAnyOrder([IsOdd(), 2])'
+
+    assert not [3] == compiled
+    assert str(compiled) == 'Or(InAnyOrder([IsOdd(), 2])[FAILED for [3]], [])[FAILED for [3]]'
+
+
+def test_compiled_matcher_pickles():
+    compiled = pickle.loads(pickle.dumps(compile(All(GreaterThan(0)))))
+    assert isinstance(compiled, CompiledMatcher)
+    assert [1, 2] == compiled
+    assert not [1, -2] == compiled
+    assert str(compiled) == 'All(GreaterThan(0)[FAILED for -2])[FAILED for [1, -2]]'
@@ -1,3 +1,4 @@
+import mmap
 from itertools import permutations
 from typing import Any, Dict
 
@@ -16,6 +17,7 @@ from pychoir import (
     EqualTo,
     First,
     GreaterThan,
+    GreaterThanOrEqualTo,
     HasLength,
     InAnyOrder,
     IsEmpty,
@@ -72,6 +74,20 @@ def test_contains():
     assert str([Contains('1')]) == "[Contains('1')]"
 
 
+def test_contains_in_buffers():
+    buffer = memoryview(b'abc')
+    assert buffer == Contains(b'bc')
+    assert buffer == Contains(bytearray(b'b'))
+    assert buffer != Contains(b'ac')
+    assert buffer == Contains(97)
+    assert buffer != Contains(100)
+
+    mapped = mmap.mmap(-1, 3)
+    mapped.write(b'abc')
+    assert mapped == Contains(b'bc')
+    assert mapped != Contains(b'ac')
+
+
 def test_contains_all_of():
     assert {'a': [1, 2, 3]} == {'a': ContainsAllOf(3, 2, 1)}
     assert not ['12'] == [ContainsAllOf('1', '2', '3')]
@@ -93,6 +109,25 @@ def test_contains_none_of():
     assert str([ContainsNoneOf('5', '3', '1')]) == "[ContainsNoneOf('5', '3', '1')]"
 
 
+def test_contains_many_values():
+    many = list(range(10))
+    assert list(range(20)) == ContainsAllOf(*many)
+    assert tuple(range(20)) == ContainsAllOf(*many)
+    assert set(range(20)) == ContainsAllOf(*many)
+    assert list(range(1, 20)) != ContainsAllOf(*many)
+    assert [[1], *range(10)] == ContainsAllOf([1], *many)
+    assert [[2], *range(10)] != ContainsAllOf([1], *many)
+
+    assert list(range(9, 20)) == ContainsAnyOf(*many)
+    assert list(range(10, 20)) != ContainsAnyOf(*many)
+    assert [[1]] == ContainsAnyOf([1], *many)
+
+    assert list(range(10, 20)) == ContainsNoneOf(*many)
+    assert list(range(9, 20)) != ContainsNoneOf(*many)
+    assert [[1]] != ContainsNoneOf([1], *many)
+    assert [[1], 11] == ContainsNoneOf(*many)
+
+
 def test_dict_contains_all_of():
     test_input = {'a': [1, 2, 3], 'b': 4, 'c': 'extra'}
 
@@ -105,10 +140,38 @@ def test_dict_contains_all_of():
     assert not test_input == DictContainsAllOf({'a': [1]})
     assert not test_input == DictContainsAllOf({'a': [1, 2, 3], 'b': 4, 'c': 'extra', 'e': 'not there'})
 
+    nan = float('nan')
+    assert {'a': nan} == DictContainsAllOf({'a': nan})
+    assert {'a': nan} != DictContainsAllOf({'a': float('nan')})
+
     assert (str(DictContainsAllOf({'a': And(HasLength(3), All(IsInstance(int))), 'b': 4, 'd': NotPresent}))
             == "DictContainsAllOf({'a': And(HasLength(3), All(IsInstance(int))), 'b': 4, 'd': NotPresent})")
 
 
+def test_dict_contains_all_of_reports_failed_key():
+    looked_up = []
+
+    class Config(Dict[str, Any]):
+        def get(self, key: str, default: Any = None) -> Any:
+            looked_up.append(key)
+            return super().get(key, default)
+
+    config = Config((f'key{i}', i) for i in range(1000))
+    assert config == DictContainsAllOf({'key1': 1, 'key2': IsEven(), 'other': NotPresent})
+    assert looked_up == ['key1', 'key2', 'other']
+
+    looked_up.clear()
+    matcher = DictContainsAllOf({'key1': 1, 'key3': IsEven(), 'key5': 5})
+    assert not config == matcher
+    assert looked_up == ['key1', 'key3']
+    assert str(matcher) == (
+        "DictContainsAllOf({'key1': 1, 'key3': IsEven()[FAILED for 3], 'key5': 5})[FAILED for {'key3': 3}]")
+
+    missing = DictContainsAllOf({'other': 1})
+    assert not config == missing
+    assert str(missing) == "DictContainsAllOf({'other': 1})[FAILED for {'other': NotPresent}]"
+
+
 def test_in_any_order():
     assert [1, 2, 3] == InAnyOrder([3, 2, 1])
     assert [1, 2, 2] == InAnyOrder([2, 1, 2])
@@ -128,6 +191,18 @@ def test_in_any_order():
     assert str(InAnyOrder([1, 2, 3])) == 'InAnyOrder([1, 2, 3])'
 
 
+def test_in_any_order_many_items():
+    values = [{'id': i, 'even': i % 2 == 0} for i in range(100)]
+    templates = [{'id': IsInstance(int), 'even': value['even']} for value in reversed(values)]
+    assert values == InAnyOrder(templates)
+    assert values != InAnyOrder(templates[1:] + [{'id': IsInstance(int), 'even': 'neither'}])
+    assert values[:-1] + [{'id': 99, 'even': False}] != InAnyOrder([{'id': IsInstance(int), 'even': IsEven()}] * 100)
+
+    assert list(range(1000)) == InAnyOrder(reversed(range(1000)))
+    assert [[1], [2], [2]] == InAnyOrder([[2], [1], [2]])
+    assert [[1], [2], [2]] != InAnyOrder([[2], [1], [1]])
+
+
 def test_set_equals():
     assert [1, 2, 3] == SetEquals([3, 2, 1])
     assert [1, 2, 3] != SetEquals([3, 2])
@@ -137,6 +212,7 @@ def test_set_equals():
 
     assert {1, 2, 3} == SetEquals({3, 2, 1})
     assert {1, 2, 3} == SetEquals((3, 2, 1))
+    assert [1, 2] == SetEquals(value for value in (1, 2))
 
     assert str(SetEquals([1, 2, 3])) == 'SetEquals([1, 2, 3])'
 
@@ -211,3 +287,56 @@ def test_slice():
         str(exc_info.value).split('\n')[0] ==
         'assert [1, 2, 3] == Slice[0](EqualTo(0)[FAILED for 1])[FAILED for [1, 2, 3]]'
     )
+
+
+def test_numpy_arrays():
+    numpy = pytest.importorskip('numpy')
+
+    values = numpy.arange(-3, 10)
+    assert numpy.arange(1, 10) == All(GreaterThan(0))
+    assert numpy.arange(1, 10) == AreNot(LessThan(0))
+    assert numpy.array([]) == All(GreaterThan(0))
+    assert values == HasLength(13)
+    assert numpy.array([]) == IsEmpty()
+    assert values == Contains(9)
+    assert values == Contains(GreaterThan(8))
+    assert values != Contains(GreaterThan(9))
+    assert values != All(GreaterThan(0))
+    assert (values == GreaterThan(0)).tolist() == [value > 0 for value in values.tolist()]
+
+    with pytest.raises(AssertionError) as exc_info:
+        assert values == All(GreaterThan(-3), LessThan(5))
+    assert str(exc_info.value).split('\n')[0] == (
+        'assert array([-3, -2, -1,  0,  1,  2,  3,  4,  5,  6,  7,  8,  9]) == '
+        'All(GreaterThan(-3)[FAILED for [-3] at indices [0]], LessThan(5))[FAILED for array([-3, -2, -1,  0,  1,  2,  3,  4,  5,  6,  7,  8,  9])]'  # noqa: E501
+    )
+
+    are_not = AreNot(LessThan(0))
+    assert not values == are_not
+    assert repr(are_not) == (
+        'AreNot(LessThan(0)[FAILED for [-3, -2, -1] at indices [0, 1, 2]])'
+        '[FAILED for array([-3, -2, -1,  0,  1,  2,  3,  4,  5,  6,  7,  8,  9])]'
+    )
+
+    all_of = All(GreaterThan(5))
+    assert not values == all_of
+    assert repr(all_of).startswith(
+        'All(GreaterThan(5)[FAILED for [-3, -2, -1, 0, 1, ...] at indices [0, 1, 2, 3, 4, ...]])')
+
+
+def test_all_in_parallel():
+    assert range(100) == All(GreaterThanOrEqualTo(0), workers=2, chunk_size=7)
+    assert iter(range(100)) == AreNot(LessThan(0), workers=2, chunk_size=7)
+    assert [] == All(GreaterThan(0), workers=2)
+
+    values = list(range(100))
+    all_of = All(IsInstance(int), LessThan(40), workers=2, chunk_size=7)
+    assert not values == all_of
+    assert str(all_of) == f'All(IsInstance(int), LessThan(40)[FAILED for 40])[FAILED for {values}]'
+
+    are_not = AreNot(EqualTo(60), GreaterThan(50), workers=2, chunk_size=7)
+    assert not values == are_not
+    assert str(are_not) == f'AreNot(EqualTo(60), GreaterThan(50)[FAILED for 51])[FAILED for {values}]'
+
+    with pytest.raises(TypeError):
+        [1, 'a'] == All(GreaterThan(0), workers=2)
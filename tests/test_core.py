@@ -1,21 +1,49 @@
+import asyncio
+import pickle
 import sys
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Any, Dict, List, cast
+from typing import Any, Callable, Dict, Iterable, Iterator, List, cast
 from unittest.mock import MagicMock
 
 import pytest
 
 from pychoir import (
+    All,
     And,
     Anything,
+    AreNot,
+    DescriptionRendering,
+    DictContainsAllOf,
     EqualTo,
+    FailedValueStorage,
+    FailureRecording,
     GreaterThan,
+    GreaterThanOrEqualTo,
+    In,
     InAnyOrder,
+    IsEven,
     IsInstance,
+    IsNegative,
+    IsNonNegative,
     IsOdd,
+    IsPositive,
     IsTruthy,
+    LessThan,
+    LessThanOrEqualTo,
     Matchable,
     Matcher,
+    Not,
+    NotEqualTo,
+    Or,
+    StartsWith,
+    WhenPassedTo,
+    set_description_rendering,
+    set_failure_recording,
+    set_fast_evaluation,
     that,
 )
 
@@ -106,6 +134,36 @@ class TestMatcher:
         assert not Anything().nested_match(1, 2)
         assert not Anything().nested_match(1, 2, expect_mismatch=True)
 
+    def test_nested_failures_reset_once_after_a_failure(self):
+        child = self._TestMatcher(True)
+        resets = MagicMock(wraps=child._reset_nested_failures)
+        child._reset_nested_failures = resets  # type: ignore[misc,method-assign]
+
+        assert range(1000) == All(child)
+        assert resets.call_count == 0
+
+        greater_than_zero = GreaterThan(0)
+        either = Or(greater_than_zero, child)
+        assert range(1000) == All(either)
+        assert resets.call_count == 1
+        assert str(greater_than_zero) == 'GreaterThan(0)'
+
+    def test_context_restored_after_exception(self):
+        class _Raising(Matcher):
+            def _matches(self, other: Any) -> bool:
+                raise ValueError(other)
+
+            def _description(self) -> str:
+                return ''
+
+        raising = _Raising()
+        with pytest.raises(ValueError):
+            assert 1 != raising
+
+        greater_than_zero = GreaterThan(0)
+        assert raising.nested_match(greater_than_zero, 1)
+        assert str(greater_than_zero) == 'GreaterThan(0)'
+
     def test_and_operator(self) -> None:
         assert 5 == IsInstance(int) & 5
         assert 5 != EqualTo(5) & IsInstance(float)
@@ -149,6 +207,400 @@ class TestMatcher:
         assert str(or_or_normal) == '(EqualTo(5) | IsInstance(int) | IsTruthy())'
 
 
+@contextmanager
+def failure_recording(recording: FailureRecording) -> Iterator[None]:
+    previous = set_failure_recording(recording)
+    try:
+        yield
+    finally:
+        set_failure_recording(previous)
+
+
+def test_failure_recording():
+    def fail_for_all(matcher: Matcher, values: Iterable[Any]) -> Matcher:
+        for value in values:
+            assert not value == matcher
+        return matcher
+
+    assert str(fail_for_all(GreaterThan(0), range(-4, 0))) == 'GreaterThan(0)[FAILED for (-4, -3, -2, -1)]'
+
+    with failure_recording(FailureRecording(max_values=3)):
+        many_failures = fail_for_all(GreaterThan(0), range(-1_204, 0))
+        assert str(many_failures) == 'GreaterThan(0)[FAILED for (-1204, -1203, -1202) <first 3 of 1,204>]'
+        assert str(fail_for_all(GreaterThan(0), [-1, -2, -3])) == 'GreaterThan(0)[FAILED for (-1, -2, -3)]'
+
+    with failure_recording(FailureRecording(storage=FailedValueStorage.REPR, max_repr_length=10)):
+        long_string = 'x' * 100
+        assert str(fail_for_all(EqualTo(''), [long_string])) == "EqualTo('')[FAILED for 'xxxxxx...]"
+
+    with failure_recording(FailureRecording(storage=FailedValueStorage.DIGEST)):
+        digested = str(fail_for_all(EqualTo(''), ['foo']))
+        assert digested.startswith("EqualTo('')[FAILED for <str ")
+        assert len(digested) == len("EqualTo('')[FAILED for <str 0123456789abcdef>]")
+
+
+def test_failed_values_released_after_rendering():
+    class Payload:
+        def __repr__(self) -> str:
+            return 'Payload()'
+
+    payload = Payload()
+    payload_ref = weakref.ref(payload)
+    matcher = EqualTo(None)
+    assert not payload == matcher
+    del payload
+    assert payload_ref() is not None
+    assert str(matcher) == 'EqualTo(None)[FAILED for Payload()]'
+    assert payload_ref() is None
+    assert str(matcher) == 'EqualTo(None)[FAILED for Payload()]'
+
+
+@contextmanager
+def description_rendering(rendering: DescriptionRendering) -> Iterator[None]:
+    previous = set_description_rendering(rendering)
+    try:
+        yield
+    finally:
+        set_description_rendering(previous)
+
+
+def test_description_rendering():
+    allowed = In(list(range(100_000)))
+    assert str(allowed).endswith(', 98, 99, ... 99900 more])')
+    with description_rendering(DescriptionRendering(max_items=3)):
+        assert str(allowed) == 'In([0, 1, 2, ... 99997 more])'
+        assert str(In([(1,), {'a': 1, 'b': 2, 'c': 3, 'd': 4}, {1}, frozenset(), 5])) == (
+            "In([(1,), {'a': 1, 'b': 2, 'c': 3, ... 1 more}, {1}, ... 2 more])")
+
+        wide = DictContainsAllOf({f'key{number}': IsInstance(int) for number in range(1_000)})
+        assert not {**{f'key{number}': number for number in range(1_000)}, 'key999': None} == wide
+        assert str(wide) == ("DictContainsAllOf({'key0': IsInstance(int), 'key1': IsInstance(int), "
+                             "'key2': IsInstance(int), 'key999': IsInstance(int)[FAILED for None], ... 996 more})"
+                             "[FAILED for {'key999': None}]")
+
+    with description_rendering(DescriptionRendering(max_depth=1)):
+        matcher = And(Not(In([1, 2])), Or(EqualTo(2), 2) & IsInstance(int))
+        assert str(matcher) == 'And(Not(...), (...))'
+        assert not 1 == matcher
+        assert str(matcher) == 'And(Not(In([1, 2])[FAILED for 1])[FAILED for 1], (...))[FAILED for 1]'
+
+
+def test_descriptions_cached():
+    class Counted(Matcher):
+        renders = 0
+
+        def _matches(self, other: Any) -> bool:
+            return False
+
+        def _description(self) -> str:
+            Counted.renders += 1
+            return ''
+
+    matcher = And(Or(GreaterThan(0), Counted()), IsInstance(int))
+    assert str(matcher) == 'And(Or(GreaterThan(0), Counted()), IsInstance(int))'
+    assert repr(matcher) == str(matcher)
+    assert 1 == matcher
+    assert str(matcher.matchers[0]) == 'Or(GreaterThan(0), Counted())'
+    assert Counted.renders == 1
+
+    assert not -1 == matcher
+    assert str(matcher) == ('And(Or(GreaterThan(0)[FAILED for -1], Counted()[FAILED for -1])[FAILED for -1], '
+                            'IsInstance(int))[FAILED for -1]')
+    assert Counted.renders == 2
+    with failure_recording(FailureRecording(max_repr_length=1)):
+        assert str(matcher).endswith('IsInstance(int))[FAILED for -1]')
+    assert Counted.renders == 3
+
+
+def test_descriptions_of_mutable_values_not_cached():
+    expected = [1]
+    matcher = Or(EqualTo(expected), IsInstance(str))
+    assert str(matcher) == 'Or(EqualTo([1]), IsInstance(str))'
+    expected.append(2)
+    assert str(matcher) == 'Or(EqualTo([1, 2]), IsInstance(str))'
+
+
+def test_failed_values_elided():
+    matcher = All(IsInstance(str))
+    assert not list(range(100_000)) == matcher
+    assert str(matcher).endswith(', 98, 99, ... 99900 more]]')
+
+
+def test_pickling():
+    matcher = All(And(GreaterThan(0), IsInstance(int)))
+    assert not [1, -1] == matcher
+    unpickled = pickle.loads(pickle.dumps(matcher))
+    assert str(unpickled) == 'All(And(GreaterThan(0), IsInstance(int)))'
+    assert not [-2] == unpickled
+    assert str(unpickled.matchers[0]) == 'And(GreaterThan(0)[FAILED for -2], IsInstance(int))[FAILED for -2]'
+
+    unpicklable_failure = EqualTo(None)
+    assert not threading.Lock() == unpicklable_failure
+    assert str(pickle.loads(pickle.dumps(unpicklable_failure))) == 'EqualTo(None)'
+
+
+def test_check():
+    greater_than_zero = GreaterThan(0)
+    all_greater_than_zero = All(greater_than_zero)
+    assert all_greater_than_zero.check([1, 2, 3])
+    assert str(all_greater_than_zero) == 'All(GreaterThan(0))'
+
+    assert not all_greater_than_zero.check([1, -2, 3])
+    assert str(all_greater_than_zero) == 'All(GreaterThan(0)[FAILED for -2])[FAILED for [1, -2, 3]]'
+
+    not_in_dict = {'a': Not(Or(1, 2))}
+    assert not_in_dict['a'].check(3)
+    assert not not_in_dict['a'].check(2)
+    assert str(not_in_dict) == "{'a': Not(Or(1, 2)[FAILED for 2])[FAILED for 2]}"
+
+
+@contextmanager
+def fast_evaluation() -> Iterator[None]:
+    previous = set_fast_evaluation(True)
+    try:
+        yield
+    finally:
+        set_fast_evaluation(previous)
+
+
+def test_fast_evaluation():
+    with fast_evaluation():
+        matcher = {'a': All(GreaterThan(0)), 'b': InAnyOrder([IsOdd(), 2])}
+        assert {'a': [1], 'b': [2, 1]} == matcher
+        assert str(matcher) == "{'a': All(GreaterThan(0)), 'b': InAnyOrder([IsOdd(), 2])}"
+
+        assert {'a': [1, 0], 'b': [2, 1]} != matcher
+        assert (str(matcher) ==
+                "{'a': All(GreaterThan(0)[FAILED for 0])[FAILED for [1, 0]], 'b': InAnyOrder([IsOdd(), 2])}")
+
+        not_or = Not(Or(1, 2))
+        assert not 3 != not_or
+        assert 2 != not_or
+        assert str(not_or) == 'Not(Or(1, 2)[FAILED for 3])[FAILED for 3]'
+
+        assert that(5).matches(And(EqualTo(5), IsInstance(int)))
+        assert not that(5).matches(EqualTo(4))
+
+    assert [1, 0] != All(GreaterThan(0))
+
+
+def test_concurrent_evaluation():
+    class _Yielding(Matcher):
+        def __init__(self, matcher: Matcher):
+            super().__init__()
+            self.matcher = matcher
+
+        def _matches(self, other: Any) -> bool:
+            time.sleep(0)  # let other threads run in the middle of the evaluation
+            return self.nested_match(self.matcher, other)
+
+        def _description(self) -> str:
+            return repr(self.matcher)
+
+    not_matcher = Not(_Yielding(Or(1, 2)))
+    are_not_matcher = AreNot(_Yielding(Or(1, 2)))
+
+    def evaluate(i: int) -> bool:
+        if i % 2:
+            return 3 == not_matcher and [3, 4] == are_not_matcher
+        else:
+            return not 1 == not_matcher and not [3, 1] == are_not_matcher
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        assert all(executor.map(evaluate, range(2000)))
+
+    assert '3' not in str(not_matcher)
+    assert str(not_matcher).startswith('Not(_Yielding(Or(1, 2)[FAILED for (1, 1, ')
+    assert '[FAILED for (3, ' not in str(are_not_matcher)
+    assert str(are_not_matcher).startswith('AreNot(_Yielding(Or(1, 2)[FAILED for (1, 1, ')
+
+
+def test_concurrent_failure_reports():
+    # the results are right, and the failures shown are only ever those of failed evaluations
+    matcher = And(GreaterThan(0), IsInstance(int))
+    values = [1, -1, 2.5, 3] * 1000
+
+    def evaluate(value: Any) -> bool:
+        passed = value == matcher
+        str(matcher)
+        return passed is (value == 1 or value == 3)
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        assert all(executor.map(evaluate, values))
+
+    greater_than, is_instance = (str(child) for child in matcher.matchers)
+    assert greater_than.startswith('GreaterThan(0)[FAILED for (-1, -1, ')
+    assert is_instance.startswith('IsInstance(int)[FAILED for (2.5, 2.5, ')
+    assert '2.5' not in greater_than and '-1' not in is_instance
+
+
+def test_concurrent_evaluation_contexts_are_isolated():
+    a_entered, b_entered, a_done = threading.Event(), threading.Event(), threading.Event()
+
+    class _Interleaving(Matcher):
+        def __init__(self, matcher: Matcher):
+            super().__init__()
+            self.matcher = matcher
+
+        def _matches(self, other: Any) -> bool:
+            if other == 'a':
+                a_entered.set()
+                assert b_entered.wait(5)
+            else:
+                b_entered.set()
+                assert a_done.wait(5)
+            passed = self.nested_match(self.matcher, other)
+            descriptions[other] = repr(self.matcher)
+            return passed
+
+        def _description(self) -> str:
+            return repr(self.matcher)
+
+    descriptions: Dict[str, str] = {}
+    interleaving = _Interleaving(Or('b'))
+
+    def evaluate_a() -> bool:
+        try:
+            return 'a' == Not(interleaving)
+        finally:
+            a_done.set()
+
+    def evaluate_b() -> bool:
+        assert a_entered.wait(5)
+        return 'b' == interleaving
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        a, b = executor.submit(evaluate_a), executor.submit(evaluate_b)
+        assert a.result() and b.result()
+
+    assert descriptions == {'a': "Or('b')", 'b': "Or('b')"}
+
+
+def test_matches_async():
+    class _Waiting(Matcher):
+        def __init__(self, wait_for: asyncio.Event, set_after: asyncio.Event):
+            super().__init__()
+            self.wait_for = wait_for
+            self.set_after = set_after
+            self.cancelled = False
+
+        async def _matches_async(self, other: Any) -> bool:
+            self.set_after.set()
+            try:
+                await self.wait_for.wait()
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+            return bool(other)
+
+        def _matches(self, other: Any) -> bool:
+            raise NotImplementedError
+
+        def _description(self) -> str:
+            return ''
+
+    async def evaluate() -> None:
+        first, second, never = asyncio.Event(), asyncio.Event(), asyncio.Event()
+        concurrent_and = _Waiting(first, second) & _Waiting(second, first)
+        assert await that(1).matches_async(concurrent_and)
+        assert not await that(0).matches_async(concurrent_and)
+        assert str(concurrent_and) == '(_Waiting()[FAILED for 0] & _Waiting()[FAILED for 0])[FAILED for 0]'
+
+        done = asyncio.Event()
+        done.set()
+        waits_forever = _Waiting(never, asyncio.Event())
+        assert await that(1).matches_async(Or(waits_forever, _Waiting(done, asyncio.Event())))
+        assert waits_forever.cancelled
+
+        # the Matchers that await nothing are evaluated right away, without waiting for the others
+        waits_forever = _Waiting(never, asyncio.Event())
+        assert await that(1).matches_async(Or(waits_forever, IsOdd()))
+        assert not waits_forever.set_after.is_set()
+
+        waits_forever = _Waiting(never, asyncio.Event())
+        assert not await that([2, 1]).matches_async(AreNot(Or(waits_forever, IsOdd())))
+        assert waits_forever.cancelled
+
+        assert await that(3).matches_async(Not(And(IsOdd(), GreaterThan(3))))
+        assert await that([1, 3]).matches_async(All(IsOdd()))
+
+    asyncio.run(evaluate())
+
+
+def test_matches_async_exceptions():
+    async def is_string(value: Any) -> bool:
+        await asyncio.sleep(0)
+        return isinstance(value, str)
+
+    async def fails(value: Any) -> bool:
+        await asyncio.sleep(0)
+        raise ValueError(value)
+
+    async def evaluate() -> None:
+        # an exception is only raised when the other Matchers leave the result undecided
+        assert not await that(5).matches_async(And(WhenPassedTo(is_string).returns(True), StartsWith('a')))
+        assert await that(5).matches_async(Or(WhenPassedTo(fails).returns(True), IsInstance(int)))
+        assert not await that(5).matches_async(And(WhenPassedTo(fails).returns(True), IsInstance(str)))
+        with pytest.raises(AttributeError):
+            await that(5).matches_async(And(WhenPassedTo(is_string).returns(False), StartsWith('a')))
+        assert not await that([1, 'a']).matches_async(All(WhenPassedTo(fails).returns(True), Not(IsInstance(str))))
+        with pytest.raises(ValueError):
+            await that([1, 2]).matches_async(All(WhenPassedTo(fails).returns(True), IsInstance(int)))
+        with pytest.raises(ValueError):
+            await that(1).matches_async(Or(WhenPassedTo(fails).returns(True), IsInstance(str)))
+
+        # the Matchers after a failing one that awaits nothing are not evaluated
+        after = IsInstance(int)
+        assert not await that('a').matches_async(And(WhenPassedTo(is_string).returns(True), IsInstance(int), after))
+        assert str(after) == 'IsInstance(int)'
+
+        many = list(range(1_000))
+        assert await that(many).matches_async(All(WhenPassedTo(is_string).returns(False), IsInstance(int)))
+
+    asyncio.run(evaluate())
+
+
+# factories, so that every test gets Matchers with no failures recorded by the others
+BATCHED_MATCHERS: List[Callable[[], Matcher]] = [
+    lambda: EqualTo(2), lambda: NotEqualTo(2), lambda: GreaterThan(2), lambda: GreaterThanOrEqualTo(2),
+    lambda: LessThan(2), lambda: LessThanOrEqualTo(2), IsEven, IsOdd, IsPositive, IsNonNegative, IsNegative,
+    lambda: In([1, 3]), lambda: IsInstance(int), lambda: And(GreaterThan(0), IsOdd()),
+]
+
+
+@pytest.mark.parametrize('new_matcher', BATCHED_MATCHERS + [lambda: IsInstance(float) | 2])
+def test_match_many(new_matcher: Callable[[], Matcher]) -> None:
+    values = [-1, 0, 1, 2, 3, 2.0, 3.5]
+    expected = [new_matcher() == value for value in values]
+    matcher = new_matcher()
+    description = str(matcher)
+
+    assert matcher.match_many(values) == expected
+    assert matcher.match_many(iter(values)) == expected
+    assert str(matcher) == description
+
+    first_failure = matcher.first_failure(values)
+    assert first_failure == expected.index(False)
+    assert str(matcher).endswith(f'[FAILED for {values[first_failure]!r}]')
+
+
+@pytest.mark.parametrize('new_matcher', BATCHED_MATCHERS)
+def test_match_many_numpy(new_matcher: Callable[[], Matcher]) -> None:
+    numpy = pytest.importorskip('numpy')
+
+    values = numpy.array([-1, 0, 1, 2, 3])
+    expected = [new_matcher() == value for value in values]
+    matcher = new_matcher()
+    description = str(matcher)
+
+    matched = matcher.match_many(values)
+    assert isinstance(matched, numpy.ndarray)
+    assert matched.dtype == bool
+    assert matched.tolist() == expected
+    assert str(matcher) == description
+    assert matcher.first_failure(values) == expected.index(False)
+
+
 def test_matcher_in_mock_call_params():
     m = MagicMock()
 
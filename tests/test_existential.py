@@ -2,6 +2,7 @@ from pychoir import (
     All,
     Anything,
     EqualTo,
+    GreaterThan,
     In,
     Is,
     IsFalsy,
@@ -61,4 +62,12 @@ def test_in():
     assert 'a' == In({'a': 5})
     assert not [0] == [In([1, 2])]
 
+    mixed = In([[1], 2, GreaterThan(5)])
+    assert [1] == mixed
+    assert 2 == mixed
+    assert 6 == mixed
+    assert 3 != mixed
+    assert 'b' == In(('a', 'b'))
+    assert 'bc' == In('abcd')
+
     assert str([In(['1', '2'])]) == "[In(['1', '2'])]"
@@ -0,0 +1,40 @@
+import re
+from pathlib import Path
+
+from pychoir import (
+    Contains,
+    EndsWith,
+    FileContents,
+    HasLength,
+    MatchesRegex,
+    StartsWith,
+    compile,
+)
+
+
+def test_file_contents(tmp_path: Path) -> None:
+    path = tmp_path / 'dump.log'
+    path.write_bytes(b'HEADER\n' + b'.' * 100_000 + b'\nERROR 42\nFOOTER\n')
+    contents = FileContents(path)
+
+    assert contents(StartsWith(b'HEADER'))
+    assert contents(EndsWith(b'FOOTER\n'))
+    assert contents(Contains(b'ERROR 42'))
+    assert contents(compile(StartsWith(b'HEADER') & Contains(b'ERROR')))
+    assert contents(MatchesRegex(rb'ERROR \d+'))
+    assert contents(MatchesRegex(re.compile(r'^ERROR \d+$', re.MULTILINE)))
+    assert contents.matches(HasLength(100_024))
+    assert not contents(Contains(b'WARNING'))
+
+    starts_with = StartsWith(b'FOOTER')
+    assert not contents(starts_with)
+    assert str(starts_with) == f"StartsWith(b'FOOTER')[FAILED for <contents of {str(path)!r}>]"
+
+    assert str(contents(StartsWith(b'HEADER'))) == f"that(FileContents({str(path)!r})).matches(StartsWith(b'HEADER'))"
+
+
+def test_empty_file_contents(tmp_path: Path) -> None:
+    path = tmp_path / 'empty'
+    path.write_bytes(b'')
+    assert FileContents(str(path))(HasLength(0))
+    assert not FileContents(path)(Contains(b'x'))
@@ -0,0 +1,86 @@
+from typing import List
+
+import pytest
+
+from pychoir import DictContainsAllOf, GreaterThan, IsInstance, WhenPassedTo, hooks
+from pychoir.hooks import MatchEvent
+
+
+def test_on_match() -> None:
+    events: List[MatchEvent] = []
+    hook = hooks.on_match(events.append)
+    try:
+        matcher = DictContainsAllOf({'id': IsInstance(int) & GreaterThan(0)})
+        assert {'id': 1} == matcher
+        assert not {'id': '1'} == matcher
+        hooks.flush()
+    finally:
+        hook.remove()
+
+    assert [(event.path, event.passed) for event in events] == [
+        (('DictContainsAllOf', 'And', 'IsInstance'), True),
+        (('DictContainsAllOf', 'And', 'GreaterThan'), True),
+        (('DictContainsAllOf', 'And'), True),
+        (('DictContainsAllOf',), True),
+        (('DictContainsAllOf', 'And', 'IsInstance'), False),
+        (('DictContainsAllOf', 'And'), False),
+        (('DictContainsAllOf',), False),
+    ]
+    assert events[-1].matcher is matcher
+    assert events[-1].value_type is dict
+    assert events[0].value_type is int
+    assert all(event.duration >= 0 for event in events)
+
+    assert {'id': 1} == matcher
+    hooks.flush()
+    assert len(events) == 7
+
+
+def test_sampling_and_disabling() -> None:
+    sampled: List[MatchEvent] = []
+    none: List[MatchEvent] = []
+    hook = hooks.on_match(sampled.append, sample_rate=1.0)
+    no_hook = hooks.on_match(none.append, sample_rate=0.0)
+    try:
+        positive = IsInstance(int) & GreaterThan(0)
+        hooks.disable(positive)
+        assert [1] == [positive]
+        hooks.enable(positive)
+        assert 1 == positive
+
+        with pytest.raises(ZeroDivisionError):
+            assert 1 == WhenPassedTo(lambda value: value / 0).returns(1)
+        hooks.flush()
+    finally:
+        hook.remove()
+        no_hook.remove()
+
+    assert [(event.path, event.passed) for event in sampled] == [
+        (('And', 'IsInstance'), True),
+        (('And', 'GreaterThan'), True),
+        (('And',), True),
+        (('WhenPassedTo',), None),
+    ]
+    assert none == []
+    assert hooks.dropped() == 0
+
+    with pytest.raises(ValueError):
+        hooks.on_match(none.append, sample_rate=2)
+
+
+def test_displayed_names() -> None:
+    events: List[MatchEvent] = []
+    hook = hooks.on_match(events.append)
+    try:
+        assert 1 == (IsInstance(str) | GreaterThan(0)) & WhenPassedTo(str).returns('1')
+        hooks.flush()
+    finally:
+        hook.remove()
+
+    assert [event.path for event in events] == [
+        ('And', 'Or', 'IsInstance'),
+        ('And', 'Or', 'GreaterThan'),
+        ('And', 'Or'),
+        ('And', 'WhenPassedTo'),
+        ('And',),
+    ]
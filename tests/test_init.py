@@ -0,0 +1,79 @@
+import ast
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+import pychoir
+
+REPOSITORY = Path(__file__).parent.parent
+# how many times as long as importing typing, which it cannot do without, `import pychoir` may take,
+# a budget relative to the speed of the machine
+IMPORT_BUDGET = 1.5
+
+
+def _imported(statement: str) -> Dict[str, int]:
+    # the cumulative microseconds of each module imported by the statement, from -X importtime
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=str(REPOSITORY), stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    imported = {}
+    for line in result.stderr.splitlines():
+        _, cumulative, module = line.split('|')
+        if cumulative.strip().isdigit():
+            imported[module.strip()] = int(cumulative)
+    return imported
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason='imported eagerly without module __getattr__')
+def test_import_time() -> None:
+    imported = _imported('import pychoir')
+    assert [module for module in imported if module.startswith('pychoir.')] == []
+    import_time = min(_imported('import pychoir')['pychoir'] for _ in range(3))
+    assert import_time < IMPORT_BUDGET * min(_imported('import typing')['typing'] for _ in range(3))
+
+    imported = _imported('from pychoir import DictContainsAllOf, IsInstance')
+    assert sorted(module for module in imported if module.startswith('pychoir.')) == [
+        'pychoir.containers', 'pychoir.core', 'pychoir.types', 'pychoir.utils',
+    ]
+    assert not {'multiprocessing', 'hashlib', 'mmap'} & imported.keys()
+
+
+def test_exports() -> None:
+    namespace: Dict[str, object] = {}
+    exec('from pychoir import *', namespace)
+    assert sorted(name for name in namespace if name != '__builtins__') == sorted(pychoir.__all__)
+    for name in pychoir.__all__:
+        assert getattr(pychoir, name) is namespace[name]
+        assert name in dir(pychoir)
+
+    assert namespace.get('compile', compile) is compile  # the builtin is not shadowed
+    assert pychoir.compile is pychoir.compiler.compile
+    assert 'compile' in dir(pychoir)
+
+    with pytest.raises(AttributeError, match="module 'pychoir' has no attribute 'Nothing'"):
+        pychoir.Nothing  # type: ignore[attr-defined]
+
+
+def test_submodules_as_attributes() -> None:
+    statement = 'import pychoir; print(pychoir.core.Matcher is pychoir.Matcher, pychoir.hooks.__name__)'
+    result = subprocess.run(
+        [sys.executable, '-c', statement],
+        cwd=str(REPOSITORY), stdout=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+    assert result.stdout.split() == ['True', 'pychoir.hooks']
+    assert {'stream', 'utils'} <= set(dir(pychoir))
+
+
+def test_exports_match_the_imports_for_type_checkers() -> None:
+    # the imports seen by type checkers (and older Pythons) must import exactly the lazily loaded names
+    module = ast.parse((REPOSITORY / 'pychoir' / '__init__.py').read_text())
+    condition = next(node for node in module.body if isinstance(node, ast.If))
+    imported: Dict[str, List[str]] = {}
+    for node in condition.body:
+        assert isinstance(node, ast.ImportFrom) and node.module is not None
+        imported[node.module] = [alias.name for alias in node.names]
+    assert imported == {module: list(names) for module, names in pychoir._EXPORTS.items()}
@@ -1,19 +1,26 @@
 from contextlib import contextmanager
-from typing import Iterator
+from typing import Any, Callable, Iterator, List
+
+import pytest
 
 from pychoir import (
     NE,
     AllOf,
     And,
     AnyOf,
+    EndsWith,
     EqualTo,
     GreaterThan,
     HasLength,
     IsInstance,
     IsNoneOf,
+    Matcher,
+    MatchesRegex,
     Not,
     Or,
     ResultsTrueFor,
+    StartsWith,
+    set_adaptive_ordering,
 )
 
 
@@ -37,6 +44,150 @@ def test_or():
     assert str([Or(0, 1)]) == '[Or(0, 1)]'
 
 
+def test_or_fuses_string_matchers() -> None:
+    def route() -> Or:
+        return Or(
+            StartsWith('GET '),
+            MatchesRegex(r'(?i)^post (\S+)'),
+            MatchesRegex(r'^[|(]x'),
+            EndsWith(' 500'),
+            MatchesRegex(r'^(a)\1'),
+            StartsWith('b'),
+            MatchesRegex(r'^c|d'),
+        )
+
+    for line in ('GET /', 'POST /form', '|x', '(x', 'HEAD / 500', 'aa', 'b', 'c', 'xd'):
+        assert line == route()
+    assert 'PUT /' != route()
+
+    matcher = route()
+    assert not 'DELETE /' == matcher
+    assert str(matcher) == (
+        "Or(StartsWith('GET ')[FAILED for 'DELETE /'], "
+        "MatchesRegex(re.compile('(?i)^post (\\\\S+)', re.IGNORECASE))[FAILED for 'DELETE /'], "
+        "MatchesRegex(re.compile('^[|(]x'))[FAILED for 'DELETE /'], EndsWith(' 500')[FAILED for 'DELETE /'], "
+        "MatchesRegex(re.compile('^(a)\\\\1'))[FAILED for 'DELETE /'], StartsWith('b')[FAILED for 'DELETE /'], "
+        "MatchesRegex(re.compile('^c|d'))[FAILED for 'DELETE /'])[FAILED for 'DELETE /']"
+    )
+
+    matcher = route()
+    assert not 'POST /' != matcher
+    assert str(matcher) == (
+        "Or(StartsWith('GET '), MatchesRegex(re.compile('(?i)^post (\\\\S+)', re.IGNORECASE))[FAILED for 'POST /'], "
+        "MatchesRegex(re.compile('^[|(]x')), EndsWith(' 500'), MatchesRegex(re.compile('^(a)\\\\1')), "
+        "StartsWith('b'), MatchesRegex(re.compile('^c|d')))[FAILED for 'POST /']"
+    )
+
+    assert 'yx' == StartsWith('x') | StartsWith('y') | MatchesRegex(r'\Ay')
+
+
+def test_fused_failures_match_unfused(monkeypatch: pytest.MonkeyPatch) -> None:
+    def evaluated() -> str:
+        matcher = Or(StartsWith('a'), StartsWith('b'), MatchesRegex(r'^c'))
+        assert not 'x' == matcher
+        assert 'c' == matcher
+        assert 'b' == matcher
+        return str(matcher)
+
+    fused = evaluated()
+    assert fused == (
+        "Or(StartsWith('a')[FAILED for ('x', 'c', 'b')], StartsWith('b')[FAILED for ('x', 'c')], "
+        "MatchesRegex(re.compile('^c'))[FAILED for 'x'])[FAILED for 'x']"
+    )
+    monkeypatch.setattr('pychoir.core._MIN_FUSED', 100)
+    assert evaluated() == fused
+
+
+def test_adaptive_ordering() -> None:
+    previous = set_adaptive_ordering(True)
+    try:
+        route = Or(MatchesRegex(r'^/users/\d+$'), StartsWith('/static/'), MatchesRegex(r'/health$'))
+        assert all(route.check('/health') for _ in range(1000))
+        assert route.check('/static/app.js')
+        assert not route.check('/admin')
+        assert str(route) == (
+            "Or(MatchesRegex(re.compile('^/users/\\\\d+$'))[FAILED for '/admin'], "
+            "StartsWith('/static/')[FAILED for '/admin'], "
+            "MatchesRegex(re.compile('/health$'))[FAILED for '/admin'])[FAILED for '/admin']"
+        )
+
+        positive = IsInstance(int) & GreaterThan(0)
+        assert not any(positive.check(-number) for number in range(1000))
+        assert not positive.check('1')  # GreaterThan may raise, so it stays behind IsInstance
+        assert positive.check(1)
+    finally:
+        set_adaptive_ordering(previous)
+
+
+class _Recorded(Matcher):
+    def __init__(self, name: str, predicate: Callable[[Any], bool], total: bool, evaluated: List[str]):
+        super().__init__(name=name)
+        self.predicate = predicate
+        self._total = total
+        self._name = name
+        self._evaluated = evaluated
+
+    def _matches(self, other: Any) -> bool:
+        self._evaluated.append(self._name)
+        return self.predicate(other)
+
+    def _description(self) -> str:
+        return ''
+
+
+def test_adaptive_ordering_reorders() -> None:
+    evaluated: List[str] = []
+
+    def recorded(name: str, predicate: Callable[[Any], bool], total: bool = True) -> Matcher:
+        return _Recorded(name, predicate, total, evaluated)
+
+    previous = set_adaptive_ordering(True)
+    try:
+        route = Or(
+            recorded('users', lambda path: path.startswith('/users/')),
+            recorded('static', lambda path: path.startswith('/static/')),
+            recorded('health', lambda path: path == '/health'),
+        )
+        assert route.check('/health')
+        assert evaluated == ['users', 'static', 'health']
+
+        assert all(route.check('/health') for _ in range(999))
+        evaluated.clear()
+        assert route.check('/health')
+        assert evaluated == ['health']
+
+        positive = And(
+            recorded('int', lambda value: isinstance(value, int)),
+            recorded('positive', lambda value: value > 0),
+        )
+        assert not any(positive.check(-number) for number in range(1000))
+        evaluated.clear()
+        assert not positive.check(-1)
+        # the failing child first, then all of them in the original order for reporting the failure
+        assert evaluated == ['positive', 'int', 'positive']
+    finally:
+        set_adaptive_ordering(previous)
+
+
+def test_adaptive_ordering_keeps_guards() -> None:
+    evaluated: List[str] = []
+    previous = set_adaptive_ordering(True)
+    try:
+        guarded = And(
+            _Recorded('is_str', lambda value: isinstance(value, str), True, evaluated),
+            _Recorded('length', lambda value: len(value) > 1, False, evaluated),  # raises for ints
+        )
+        assert not any(guarded.check(number) for number in range(1000))
+        assert 'length' not in evaluated  # not even when sampling
+
+        assert not any(guarded.check('a') for _ in range(1000))  # length fails, but stays behind its guard
+        evaluated.clear()
+        assert not guarded.check(1)
+        assert evaluated == ['is_str', 'is_str']
+    finally:
+        set_adaptive_ordering(previous)
+
+
 def test_not():
     assert IsNoneOf is Not
 
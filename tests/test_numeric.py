@@ -1,4 +1,6 @@
-from pychoir import IsEven, IsNegative, IsNonNegative, IsOdd, IsPositive
+import pytest
+
+from pychoir import All, Contains, IsEven, IsNegative, IsNonNegative, IsOdd, IsPositive
 
 
 def test_is_even():
@@ -42,3 +44,18 @@ def test_is_negative():
     assert 1 != IsNegative()
 
     assert str(IsNegative()) == 'IsNegative()'
+
+
+def test_numpy_arrays():
+    numpy = pytest.importorskip('numpy')
+
+    # compared item by item by NumPy
+    assert (numpy.array([0, 1, -4]) == IsEven()).tolist() == [True, False, True]
+    assert (numpy.array([1, -3]) != IsOdd()).tolist() == [False, False]
+    assert (numpy.array([1, 0]) == IsPositive()).tolist() == [True, False]
+
+    # as a whole by the Matchers of containers
+    assert numpy.array([0, 2, -4]) == All(IsEven())
+    assert numpy.array([0, 1, -4]) != All(IsEven())
+    assert numpy.array([0, 2]) == All(IsNonNegative())
+    assert numpy.array([-1, 2]) == Contains(IsNegative())
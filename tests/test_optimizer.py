@@ -0,0 +1,96 @@
+from typing import Any
+
+from pychoir import (
+    All,
+    And,
+    Anything,
+    EqualTo,
+    GreaterThan,
+    HasLength,
+    In,
+    InAnyOrder,
+    IsInstance,
+    Not,
+    Or,
+    ResultsTrueFor,
+    StartsWith,
+    WhenPassedTo,
+    compile,
+    optimize,
+)
+
+
+def test_flattens_and_orders_by_cost() -> None:
+    matcher = optimize(And(IsInstance(list), All(GreaterThan(0)) & (InAnyOrder([1, 2]) & HasLength(2))))
+    assert str(matcher) == 'And(IsInstance(list), All(GreaterThan(0)), InAnyOrder([1, 2]), HasLength(2))'
+    assert [2, 1] == matcher
+    assert [2, 3] != matcher
+
+    expensive = WhenPassedTo(len).returns(3)
+    matcher = optimize(Or(expensive, StartsWith('a'), 'abc'))
+    assert str(matcher) == "Or('abc', WhenPassedTo(len).returns(3), StartsWith('a'))"
+
+
+def test_keeps_the_order_of_checks_that_may_raise() -> None:
+    matcher = optimize(And(InAnyOrder([1]), HasLength(1), IsInstance(int) | IsInstance(list), GreaterThan(0) | 1))
+    assert str(matcher) == 'And(IsInstance(int, list), InAnyOrder([1]), HasLength(1), (1 | GreaterThan(0)))'
+
+    original = ResultsTrueFor(lambda x: x is not None) & GreaterThan(0)
+    matcher = optimize(original)
+    assert None != original  # noqa: E711
+    assert None != matcher  # noqa: E711
+    assert 1 == matcher
+
+
+def test_in_may_raise_unless_of_a_list() -> None:
+    is_str = ResultsTrueFor(lambda x: isinstance(x, str))
+    for allowed in ('abc', {'a', 'b'}, ['a', 'b', ['c']]):
+        original = is_str & In(allowed)
+        matcher = optimize(original)
+        for value in ('a', 'd', 5, ['c']):
+            assert (value == original) == (value == matcher)
+    raising: Any = optimize(is_str & In('abc'))
+    assert [type(child) for child in raising.matchers] == [ResultsTrueFor, In]
+    indexed: Any = optimize(is_str & In(['a', 'b']))
+    assert [type(child) for child in indexed.matchers] == [In, ResultsTrueFor]
+
+
+def test_anything_and_duplicates() -> None:
+    assert str(optimize(Anything() & EqualTo(1) & EqualTo(1))) == 'EqualTo(1)'
+    assert str(optimize(And(Anything(), Anything()))) == 'Anything()'
+    assert str(optimize(Or(EqualTo(1), Anything(), 2))) == 'Anything()'
+    assert str(optimize(Not(1, 2, 1, Or(3, 3)))) == 'Not(1, 2, 3)'
+    assert optimize(5) == 5
+
+
+def test_keeps_children_that_only_look_the_same() -> None:
+    matcher = optimize(And(In(list(range(200))), In(list(range(100)) + list(range(1000, 1100)))))
+    assert isinstance(matcher, And) and len(matcher.matchers) == 2
+    assert 150 != matcher
+
+    failed = EqualTo(1)
+    assert not 2 == failed
+    assert str(optimize(Or(failed, EqualTo(1), EqualTo(1.0)))) == 'Or(EqualTo(1)[FAILED for 2], EqualTo(1.0))'
+
+
+def test_merges_type_checks() -> None:
+    matcher = optimize(Or(IsInstance(int), StartsWith('a'), Or(IsInstance(float), IsInstance(int))))
+    assert str(matcher) == "Or(IsInstance(int, float), StartsWith('a'))"
+    assert 1.5 == matcher
+
+
+def test_merges_type_checks_without_evaluating_other_children() -> None:
+    matcher = optimize(Or(Not(IsInstance(bytes)), IsInstance(str), IsInstance(int)))
+    assert str(matcher) == 'Or(Not(IsInstance(bytes)), IsInstance(str, int))'
+    assert 3.5 == matcher
+
+    matcher = optimize(Or(ResultsTrueFor(bool), IsInstance(str), IsInstance(bytes)))
+    assert str(matcher) == "Or(IsInstance(str, bytes), ResultsTrueFor(<class 'bool'>))"
+    assert 5 == matcher
+
+
+def test_compile_optimized() -> None:
+    matcher = compile(Anything() & IsInstance(str) & StartsWith('a') & StartsWith('a'), optimize=True)
+    assert 'abc' == matcher
+    assert not 'bcd' == matcher
+    assert str(matcher) == "(IsInstance(str) & StartsWith('a')[FAILED for 'bcd'])[FAILED for 'bcd']"
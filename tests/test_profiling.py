@@ -0,0 +1,74 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from pychoir import (
+    And,
+    DictContainsAllOf,
+    GreaterThan,
+    IsInstance,
+    Matcher,
+    Or,
+    StartsWith,
+    profile,
+)
+
+
+def test_profile() -> None:
+    original_matches = Matcher.matches
+    matcher = And(IsInstance(dict), DictContainsAllOf({'id': IsInstance(int) & GreaterThan(0)}))
+    with profile() as measured:
+        assert Matcher.matches is not original_matches
+        for number in range(-1, 9):
+            _ = {'id': number} == matcher
+        with profile() as inner:
+            assert 'abc' == StartsWith('a')
+    assert Matcher.matches is original_matches
+
+    assert [root.label for root in measured.roots] == ['And(...)']
+    assert [root.label for root in inner.roots] == ["StartsWith('a')"]
+    root = measured.roots[0]
+    assert (root.calls, root.passed, root.failed) == (10, 8, 2)
+    assert [child.label for child in root.children] == ['IsInstance(dict)', 'DictContainsAllOf(...)']
+    type_check, greater_than = root.children[1].children[0].children
+    assert (type_check.calls, greater_than.calls, greater_than.failed) == (10, 10, 2)
+    assert root.cumulative_time >= root.self_time + sum(child.cumulative_time for child in root.children) * 0.999
+
+    report = measured.report().splitlines()
+    assert report[0].split() == ['calls', 'passed', 'failed', 'self', '(s)', 'total', '(s)', 'matcher']
+    assert report[3].endswith('   DictContainsAllOf(...)')
+    assert report[4].endswith('     (...)')
+    assert report[5].endswith('       IsInstance(int)')
+
+    exported = json.loads(measured.to_json())
+    assert exported[0]['children'][1]['children'][0]['children'][1]['matcher'] == 'GreaterThan(0)[FAILED for (-1, 0)]'
+
+    stats = measured.stats()
+    assert stats.total_calls == 10 + 10 + 10 + 10 + 10 + 10  # type: ignore[attr-defined]
+
+
+def test_profile_fused_matchers() -> None:
+    with profile() as measured:
+        assert 'b' == Or(StartsWith('a'), StartsWith('b'), StartsWith('c'))
+    assert [child.label for child in measured.roots[0].children] == ["StartsWith('a')", "StartsWith('b')"]
+
+
+def test_pytest_option(tmp_path: Path) -> None:
+    (tmp_path / 'test_example.py').write_text(
+        'from pychoir import IsInstance\n'
+        '\n'
+        'def test_example():\n'
+        '    assert 5 == IsInstance(int)\n'
+    )
+    report_path = tmp_path / 'profile.json'
+    result = subprocess.run(
+        [sys.executable, '-m', 'pytest', '-p', 'pychoir.pytest_plugin', '--pychoir-profile',
+         f'--pychoir-profile-json={report_path}', '-p', 'no:cacheprovider', str(tmp_path)],
+        stdout=subprocess.PIPE, universal_newlines=True, cwd=tmp_path,
+        env=dict(os.environ, PYTHONPATH=str(Path(__file__).parent.parent)),
+    )
+    assert result.returncode == 0, result.stdout
+    assert 'pychoir profile' in result.stdout
+    assert json.loads(report_path.read_text())[0]['matcher'] == 'IsInstance(int)'
@@ -0,0 +1,55 @@
+import io
+from pathlib import Path
+
+import pytest
+
+from pychoir import All, DictContainsAllOf, GreaterThan, IsInstance, MatchesRegex
+from pychoir.stream import Failure, failures, records, validate
+
+JSON_LINES = '{"id": 1, "tags": ["a"]}\n\n{"id": -2, "tags": []}\n{"id": 3, "tags": ["b", 4]}\n'
+
+CSV = 'id,name\n1,one\n2,"two\nlines"\nx,three\n'
+
+
+def test_validate_json_lines(tmp_path: Path) -> None:
+    path = tmp_path / 'records.jsonl'
+    path.write_text(JSON_LINES)
+    matcher = DictContainsAllOf({'id': GreaterThan(0), 'tags': All(IsInstance(str))})
+
+    validation = validate(path, matcher)
+    assert not validation
+    assert validation.records == 3
+    assert validation.failure_count == 2
+    assert validation.failures == [Failure(3, {'id': -2, 'tags': []}), Failure(4, {'id': 3, 'tags': ['b', 4]})]
+    assert str(matcher) == (
+        "DictContainsAllOf({'id': GreaterThan(0)[FAILED for -2], "
+        "'tags': All(IsInstance(str)[FAILED for 4])[FAILED for ['b', 4]]})"
+        "[FAILED for ({'id': -2}, {'tags': ['b', 4]})]"
+    )
+
+    assert validate(str(path), DictContainsAllOf({'id': IsInstance(int)}))
+    assert validate(path, matcher, max_failures=1).failures == [Failure(3, {'id': -2, 'tags': []})]
+    assert validate(io.BytesIO(JSON_LINES.encode()), matcher).failure_count == 2
+    assert [failure.line for failure in failures(io.StringIO(JSON_LINES), matcher)] == [3, 4]
+
+
+def test_validate_csv(tmp_path: Path) -> None:
+    path = tmp_path / 'records.csv'
+    path.write_text(CSV)
+    matcher = DictContainsAllOf({'id': MatchesRegex(r'^\d+$')})
+
+    validation = validate(path, matcher, format='csv')
+    assert validation.records == 3
+    assert validation.failures == [Failure(5, {'id': 'x', 'name': 'three'})]
+    assert [line for line, _ in records(io.BytesIO(CSV.encode()), format='csv')] == [2, 3, 5]
+    assert validate(io.StringIO(CSV), {'id': '1', 'name': 'one'}, format='csv').failure_count == 2
+
+
+def test_validate_errors():
+    with pytest.raises(ValueError) as format_error:
+        validate(io.StringIO(''), IsInstance(dict), format='xml')
+    assert str(format_error.value) == "Unknown format 'xml', expected one of ('jsonl', 'csv')"
+
+    with pytest.raises(ValueError) as json_error:
+        validate(io.StringIO('{}\n{\n'), IsInstance(dict))
+    assert str(json_error.value).startswith('Invalid JSON on line 2: ')
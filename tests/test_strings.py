@@ -1,5 +1,8 @@
+import mmap
 import re
 
+import pytest
+
 from pychoir import EndsWith, MatchesRegex, StartsWith
 
 
@@ -17,9 +20,56 @@ def test_endswith():
     assert str(EndsWith('bar')) == "EndsWith('bar')"
 
 
+def test_many_starts_and_ends() -> None:
+    routes = StartsWith('/api/v1/', '/api/v2/', '/api/')
+    assert '/api/v2/users' == routes
+    assert '/static/app.js' != routes
+    assert routes.matching_start('/api/v2/users') == '/api/v2/'
+    assert routes.matching_start('/static/app.js') is None
+    assert str(routes) == "StartsWith('/api/v1/', '/api/v2/', '/api/')"
+
+    allowed = [f'/api/v1/resource{number}/' for number in range(1000)]
+    many_routes = StartsWith(*allowed, '/api/v1/')
+    assert '/api/v1/resource999/1' == many_routes
+    assert '/api/v1' != many_routes
+    assert many_routes.matching_start('/api/v1/resource999/1') == '/api/v1/resource999/'
+    assert many_routes.matching_start('/api/v1/other') == '/api/v1/'
+    assert many_routes.matching_start('') is None
+
+    metrics = EndsWith(*[f'_{unit}_total' for unit in range(100)], '_total')
+    assert 'requests_99_total' == metrics
+    assert 'requests_99' != metrics
+    assert metrics.matching_end('requests_99_total') == '_99_total'
+    assert metrics.matching_end('requests_total') == '_total'
+
+    for value in (b'foobar', memoryview(b'foobar')):
+        assert value == StartsWith(b'bar', b'foo')
+        assert value == EndsWith(b'foo', b'bar')
+        assert StartsWith(b'f', b'fo').matching_start(value) == b'fo'
+
+
 def test_matches_regex():
     assert 'foobar' == MatchesRegex(r'^foo')
     assert 'foobar' == MatchesRegex(re.compile(r'bar$', flags=re.VERBOSE))
     assert 'bafoo' != MatchesRegex(r'^foo')
 
     assert str(MatchesRegex(re.compile(r'^foo', re.VERBOSE))) == "MatchesRegex(re.compile('^foo', re.VERBOSE))"
+
+
+def test_bytes_like():
+    mapped = mmap.mmap(-1, 6)
+    mapped.write(b'foobar')
+    for value in (b'foobar', memoryview(b'foobar'), mapped):
+        assert value == StartsWith(b'foo')
+        assert value != StartsWith(b'bar')
+        assert value == EndsWith(b'bar')
+        assert value != EndsWith(b'foo')
+        assert value == MatchesRegex(rb'o+b')
+        assert value == MatchesRegex(r'^fo{2}')
+        assert value != MatchesRegex(r'^bar')
+    assert memoryview(b'ar') != EndsWith(b'bar')
+
+    with pytest.raises(AttributeError):
+        assert 1 == StartsWith('1')
+    with pytest.raises(TypeError):
+        assert 1 == MatchesRegex('1')
@@ -0,0 +1,83 @@
+import pickle
+from typing import Any
+
+import pytest
+
+from pychoir import All, GreaterThan, IsInstance, Not, StartsWith, Structure
+
+
+def template() -> Any:
+    return {
+        'user': {'id': IsInstance(int), 'tags': All(IsInstance(str))},
+        'items': [{'name': StartsWith('a'), 'count': GreaterThan(0)}, {'name': 'b', 'count': 1}],
+        'meta': {'version': (1, 2), 'flags': [True, False]},
+    }
+
+
+def payload() -> Any:
+    return {
+        'user': {'id': 1, 'tags': ['x', 'y']},
+        'items': [{'name': 'apple', 'count': 2}, {'name': 'b', 'count': 1}],
+        'meta': {'version': (1, 2), 'flags': [True, False]},
+    }
+
+
+def test_structure():
+    assert payload() == Structure(template())
+    assert payload() == template()
+    assert payload() != Structure({'user': {}})
+    assert 5 == Structure(GreaterThan(4))
+    assert [1, 2] == Structure([1, 2])
+    assert [1, 2] != Structure((1, 2))
+
+    assert str(Structure({'a': [1]})) == "Structure({'a': [1]})"
+
+
+@pytest.mark.parametrize('path, value, failure', [
+    (('user', 'tags', 1), 2, '$.user.tags[1]: 2'),
+    (('user', 'tags'), ('x', 'y', 3), '$.user.tags[2]: 3'),
+    (('user', 'tags'), {3}, '$.user.tags: {3}'),  # no path to the items of a set
+    (('items', 0, 'count'), 0, '$.items[0].count: 0'),
+    (('items', 1, 'name'), 'c', "$.items[1].name: 'c'"),
+    (('meta', 'flags', 1), True, '$.meta.flags[1]: True'),
+    (('meta', 'version'), [1, 2], '$.meta.version: [1, 2]'),
+])
+def test_structure_reports_path(path: Any, value: Any, failure: str) -> None:
+    compared = payload()
+    container = compared
+    for key in path[:-1]:
+        container = container[key]
+    container[path[-1]] = value
+
+    matcher = Structure(template())
+    assert not compared == matcher
+    assert str(matcher).endswith(f'[FAILED for {failure}]')
+
+
+def test_structure_reports_keys_and_lengths():
+    compared = payload()
+    compared['user'] = {'id': 1, 'tag': []}
+    compared['items'].pop()
+
+    matcher = Structure(template())
+    assert not compared == matcher
+    assert str(matcher).endswith("[FAILED for $.user: missing keys ['tags'], unexpected keys ['tag']]")
+
+    compared['user'] = {'id': 1, 'tags': []}
+    assert not compared == matcher
+    assert str(matcher).endswith("$.items: length 1, expected 2)]")
+
+    odd_keys = Structure({'a b': [{1: IsInstance(str)}]})
+    assert not {'a b': [{1: 1}]} == odd_keys
+    assert str(odd_keys).endswith("[FAILED for $['a b'][0][1]: 1]")
+
+
+def test_structure_records_nested_failures():
+    matcher = Structure({'a': Not(GreaterThan(0))})
+    assert not {'a': 1} == matcher
+    assert str(matcher) == "Structure({'a': Not(GreaterThan(0)[FAILED for 1])[FAILED for 1]})[FAILED for $.a: 1]"
+
+
+def test_structure_pickles():
+    matcher = pickle.loads(pickle.dumps(Structure(template())))
+    assert payload() == matcher
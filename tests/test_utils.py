@@ -1,6 +1,10 @@
 from typing import Any, List
 
-from pychoir.utils import i_removed, sequence_or_its_only_member
+from pychoir.utils import (
+    i_removed,
+    maximum_bipartite_matching,
+    sequence_or_its_only_member,
+)
 
 
 def test_sequence_or_its_first_member():
@@ -16,3 +20,12 @@ def test_i_removed():
     assert i_removed(t, 1) == (0, 2, 3, 4, 5)
     assert i_removed(t, 5) == (0, 1, 2, 3, 4)
     assert i_removed(t, 6) == t
+
+
+def test_maximum_bipartite_matching():
+    assert maximum_bipartite_matching([], 0) == 0
+    assert maximum_bipartite_matching([[0], [0]], 1) == 1
+    assert maximum_bipartite_matching([[0, 1], [0]], 2) == 2
+    assert maximum_bipartite_matching([[0, 1, 2], [0], [1]], 3) == 3
+    assert maximum_bipartite_matching([[0, 1], [0, 1], [0, 1]], 3) == 2
+    assert maximum_bipartite_matching([[i, i + 1] for i in range(999)] + [[0]], 1000) == 1000